@@ -0,0 +1,103 @@
+"""Benchmark the Aqara E1 thermostat schedule settings codec.
+
+Checks that random valid schedules survive every bytes, string and record round
+trip, then times parsing, formatting and editing `ScheduleSettings`:
+
+    python benchmarks/aqara_schedule.py --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import random
+import sys
+import timeit
+
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent.parent / "custom_zha_quirks")
+)
+
+from zhaquirks.xiaomi.aqara.thermostat_agl001 import (  # noqa: E402
+    ScheduleRecord,
+    ScheduleSettings,
+)
+
+SCHEDULE = "mon,tue,wed,thu,fri|6:00,21.0|8:00,17.0|17:30,21.0|22:00,17.0"
+
+
+def _random_record(rng: random.Random) -> ScheduleRecord:
+    """Return a random schedule the device accepts."""
+    while True:
+        start = rng.randrange(1, 24 * 60 + 1)
+        gaps = [rng.randrange(60, 8 * 60) for _ in range(3)]
+        if sum(gaps) > 24 * 60:
+            continue
+
+        times = [start]
+        for gap in gaps:
+            times.append((times[-1] + gap - 1) % (24 * 60) + 1)
+
+        return ScheduleRecord(
+            rng.randrange(1, 128) << 1,
+            tuple(times),
+            tuple(rng.randrange(500, 3001, 50) for _ in range(4)),
+        )
+
+
+def check_round_trips(count: int = 10000) -> None:
+    """Check round trips of random schedules through every representation."""
+    rng = random.Random(0)
+
+    for _ in range(count):
+        record = _random_record(rng)
+        settings = ScheduleSettings(record)
+
+        assert ScheduleRecord.from_bytes(bytes(settings)) == record, record
+        assert ScheduleSettings(bytes(settings)).record == record, record
+        assert ScheduleSettings(str(settings)) == settings, record
+        assert ScheduleSettings.deserialize(settings.serialize())[0] == settings
+
+        index = rng.randrange(4)
+        temperature = rng.randrange(500, 3001, 50)
+        edited = record.replace_event(index, temperature=temperature)
+        assert edited.temperatures[index] == temperature
+        assert edited.diff(record) == (
+            [] if temperature == record.temperatures[index] else [f"event_{index}"]
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per run")
+    args = parser.parse_args()
+
+    check_round_trips()
+
+    settings = ScheduleSettings(SCHEDULE)
+    data = bytes(settings)
+
+    def edit_string() -> ScheduleSettings:
+        groups = str(settings).split("|")
+        groups[2] = "8:00,18.5"
+        return ScheduleSettings("|".join(groups))
+
+    def edit_record() -> ScheduleSettings:
+        return ScheduleSettings(settings.record.replace_event(1, temperature=1850))
+
+    assert edit_string() == edit_record()
+
+    for label, func in (
+        ("parse bytes", lambda: ScheduleSettings(data)),
+        ("parse string", lambda: ScheduleSettings(SCHEDULE)),
+        ("format string", lambda: str(settings)),
+        ("edit via string", edit_string),
+        ("edit via record", edit_record),
+    ):
+        elapsed = min(timeit.repeat(func, number=args.number, repeat=3))
+        print(f"{label:>16}: {elapsed / args.number * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Benchmark multi-press detection for a burst of presses across many remotes.
+
+Compares the former Philips `ButtonPressQueue`, which started a task per press and
+compared wall clock times, against `MultiPressDetector`, which keeps one loop timer
+per counting button. Every remote presses each of its buttons a random number of
+times in quick succession:
+
+    python benchmarks/multi_press.py --remotes 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent.parent / "custom_zha_quirks")
+)
+
+from zhaquirks import MultiPressDetector  # noqa: E402
+
+WINDOW = 0.3
+BUTTONS = 4
+
+
+class _LegacyQueue:
+    """The former Philips button press queue, one per button."""
+
+    def __init__(self):
+        self._ms_threshold = WINDOW * 1000
+        self._ms_last_click = 0
+        self._click_counter = 1
+        self._button = None
+        self._callback = lambda x: None
+        self._task = None
+
+    async def _job(self):
+        await asyncio.sleep(self._ms_threshold / 1000)
+        self._callback(self._click_counter)
+
+    def _reset(self, button):
+        if self._task:
+            self._task.cancel()
+        self._click_counter = 1
+        self._button = button
+
+    def press(self, callback, button):
+        now_ms = time.time() * 1000
+        if self._button != button:
+            self._reset(button)
+        elif now_ms - self._ms_last_click > self._ms_threshold:
+            self._click_counter = 1
+        else:
+            self._task.cancel()
+            self._click_counter += 1
+        self._ms_last_click = now_ms
+        self._callback = callback
+        self._task = asyncio.ensure_future(self._job())
+
+
+def _bursts(remotes: int) -> list[tuple[int, int, int]]:
+    """Return (remote, button, presses) bursts in random order."""
+    rng = random.Random(0)
+    bursts = [
+        (remote, button, rng.randrange(1, 6))
+        for remote in range(remotes)
+        for button in range(BUTTONS)
+    ]
+    rng.shuffle(bursts)
+    return bursts
+
+
+async def _run(press, bursts) -> tuple[float, int, dict]:
+    """Replay the bursts, returning the time spent pressing and the reports."""
+    loop = asyncio.get_running_loop()
+    reports = {}
+    pending = len(bursts)
+    done = loop.create_future()
+    peak = 0
+
+    def callback(key):
+        def report(count):
+            nonlocal pending
+            reports[key] = count
+            pending -= 1
+            if not pending:
+                done.set_result(None)
+
+        return report
+
+    elapsed = 0.0
+    # interleave the remotes, pressing every button once per round
+    rounds = max(count for *_, count in bursts)
+    for round_ in range(rounds):
+        start = time.perf_counter()
+        for remote, button, count in bursts:
+            if round_ < count:
+                press(remote, button, callback((remote, button)))
+        elapsed += time.perf_counter() - start
+        peak = max(peak, len(loop._scheduled), len(asyncio.all_tasks()) - 1)
+        await asyncio.sleep(0)
+
+    await done
+    presses = sum(count for *_, count in bursts)
+    return elapsed / presses, peak, reports
+
+
+async def _legacy(bursts):
+    queues = {}
+
+    def press(remote, button, callback):
+        queue = queues.get((remote, button))
+        if queue is None:
+            queue = queues[remote, button] = _LegacyQueue()
+        queue.press(callback, button)
+
+    return await _run(press, bursts)
+
+
+async def _detector(bursts):
+    detectors = {}
+
+    def press(remote, button, callback):
+        detector = detectors.get(remote)
+        if detector is None:
+            detector = detectors[remote] = MultiPressDetector(WINDOW)
+        detector.press(button, callback)
+
+    return await _run(press, bursts)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--remotes", type=int, default=1000, help="remotes pressed")
+    args = parser.parse_args()
+
+    bursts = _bursts(args.remotes)
+    expected = {(remote, button): count for remote, button, count in bursts}
+
+    for label, run in (("task per press", _legacy), ("detector", _detector)):
+        per_press, peak, reports = asyncio.run(run(bursts))
+        assert reports == expected, label
+        print(
+            f"{label:>15}: {per_press * 1e6:6.2f} us per press,"
+            f" peak {peak} pending timers/tasks"
+        )
+
+
+if __name__ == "__main__":
+    main()
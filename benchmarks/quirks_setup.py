@@ -0,0 +1,292 @@
+"""Benchmark the import time and memory cost of registering ZHA quirks.
+
+Every measurement runs in a fresh interpreter against the vendored
+`custom_zha_quirks` tree, so no network access or Home Assistant install is needed:
+
+    python benchmarks/quirks_setup.py --output before.json
+    python benchmarks/quirks_setup.py --output after.json --compare before.json
+
+The report contains:
+
+* `setup`: `zhaquirks.setup()` wall time and tracemalloc peak, cold with and without
+  a cached quirk index, and warm (a second call with `sys.modules` populated).
+* `registry`: entries created by `QuirkBuilder.add_to_registry()` and
+  `TuyaQuirkBuilder.add_to_registry()`, and the number of v1 `CustomDevice` classes.
+* `modules`: per-module import time and allocated memory in `walk_packages` order.
+  Both are inclusive of any not yet imported dependency of the module.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import pathlib
+import pkgutil
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+QUIRKS_ROOT = pathlib.Path(__file__).resolve().parent.parent / "custom_zha_quirks"
+REPORT_VERSION = 1
+
+
+def _walk_quirk_modules() -> list[str]:
+    """List every module of the `zhaquirks` package in registration order."""
+    import zhaquirks
+
+    return [
+        modname
+        for _importer, modname, _ispkg in pkgutil.walk_packages(
+            path=zhaquirks.__path__, prefix="zhaquirks."
+        )
+    ]
+
+
+def _worker_setup(index: str, trace: bool) -> dict[str, Any]:
+    """Time a cold `setup()` call followed by a warm one."""
+    if trace:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    import zhaquirks
+
+    if index == "none":
+        zhaquirks.QUIRKS_INDEX_FILE = pathlib.Path(tempfile.mkdtemp()) / "index.json"
+    else:
+        zhaquirks.QUIRKS_INDEX_FILE = pathlib.Path(index)
+
+    zhaquirks.setup()
+    cold = time.perf_counter() - start
+    cold_peak = tracemalloc.get_traced_memory()[1] if trace else None
+    modules = sum(name.startswith("zhaquirks") for name in sys.modules)
+
+    start = time.perf_counter()
+    zhaquirks.setup()
+    warm = time.perf_counter() - start
+
+    return {
+        "cold_s": cold,
+        "warm_s": warm,
+        "cold_peak_bytes": cold_peak,
+        "zhaquirks_modules": modules,
+        "index_file": str(zhaquirks.QUIRKS_INDEX_FILE),
+    }
+
+
+def _worker_modules(trace: bool) -> dict[str, Any]:
+    """Import every quirk module one at a time, recording its individual cost."""
+    import zhaquirks  # noqa: F401
+
+    if trace:
+        tracemalloc.start()
+
+    results = {}
+    # walk_packages imports packages itself, so time the package before recursing
+    pending = ["zhaquirks"]
+    seen = set()
+
+    while pending:
+        modname = pending.pop(0)
+        if modname in seen:
+            continue
+        seen.add(modname)
+
+        before = tracemalloc.get_traced_memory()[0] if trace else 0
+        start = time.perf_counter()
+        module = importlib.import_module(modname)
+        elapsed = time.perf_counter() - start
+        after = tracemalloc.get_traced_memory()[0] if trace else 0
+
+        results[modname] = {"import_s": elapsed, "allocated_bytes": after - before}
+
+        if hasattr(module, "__path__"):
+            pending[0:0] = [
+                name
+                for _importer, name, _ispkg in pkgutil.iter_modules(
+                    module.__path__, prefix=modname + "."
+                )
+            ]
+
+    return results
+
+
+def _worker_registry() -> dict[str, Any]:
+    """Count the registry entries created by each kind of quirk."""
+    from zigpy.quirks import DEVICE_REGISTRY
+    from zigpy.quirks.v2 import QuirkBuilder
+
+    from zhaquirks.tuya.builder import TuyaQuirkBuilder
+
+    counts = {"quirk_builder": 0, "tuya_quirk_builder": 0}
+    add_to_registry = QuirkBuilder.add_to_registry
+
+    def _counting_add_to_registry(self, *args, **kwargs):
+        entry = add_to_registry(self, *args, **kwargs)
+        if isinstance(self, TuyaQuirkBuilder):
+            counts["tuya_quirk_builder"] += len(entry.manufacturer_model_metadata)
+        else:
+            counts["quirk_builder"] += len(entry.manufacturer_model_metadata)
+        return entry
+
+    QuirkBuilder.add_to_registry = _counting_add_to_registry
+
+    for modname in _walk_quirk_modules():
+        importlib.import_module(modname)
+
+    v1_devices = {
+        quirk
+        for models in DEVICE_REGISTRY.registry_v1.values()
+        for quirks in models.values()
+        for quirk in quirks
+        if quirk.__module__.startswith("zhaquirks.")
+    }
+
+    return {
+        "quirk_builder_entries": counts["quirk_builder"],
+        "tuya_quirk_builder_entries": counts["tuya_quirk_builder"],
+        "v1_custom_devices": len(v1_devices),
+        "v1_registry_keys": sum(
+            len(models) for models in DEVICE_REGISTRY.registry_v1.values()
+        ),
+        "v2_registry_keys": len(DEVICE_REGISTRY.registry_v2),
+    }
+
+
+def _run_worker(*args: str) -> Any:
+    """Run a measurement in a fresh interpreter and return its JSON result."""
+    proc = subprocess.run(
+        [sys.executable, __file__, "--worker", *args],
+        cwd=QUIRKS_ROOT,
+        env={**os.environ, "PYTHONPATH": str(QUIRKS_ROOT)},
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def _git_revision() -> str | None:
+    """Return the checked out revision, if any."""
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=QUIRKS_ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def run(repeat: int) -> dict[str, Any]:
+    """Collect a full benchmark report."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        index_file = str(pathlib.Path(tmpdir) / "index.json")
+        # Build the index once so the indexed runs only measure lazy registration
+        full = [_run_worker("setup", index_file)]
+        full += [_run_worker("setup", "none") for _ in range(repeat - 1)]
+        indexed = [_run_worker("setup", index_file) for _ in range(repeat)]
+        full_traced = _run_worker("setup", "none", "--trace")
+        indexed_traced = _run_worker("setup", index_file, "--trace")
+
+    import_times = _run_worker("modules")
+    import_memory = _run_worker("modules", "--trace")
+
+    return {
+        "version": REPORT_VERSION,
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "setup": {
+            "cold_full_s": statistics.median(r["cold_s"] for r in full),
+            "cold_indexed_s": statistics.median(r["cold_s"] for r in indexed),
+            "warm_s": statistics.median(r["warm_s"] for r in indexed),
+            "cold_full_peak_bytes": full_traced["cold_peak_bytes"],
+            "cold_indexed_peak_bytes": indexed_traced["cold_peak_bytes"],
+            "cold_full_modules": full[0]["zhaquirks_modules"],
+            "cold_indexed_modules": indexed[0]["zhaquirks_modules"],
+        },
+        "registry": _run_worker("registry"),
+        "modules": {
+            modname: {
+                "import_s": timing["import_s"],
+                "allocated_bytes": import_memory[modname]["allocated_bytes"],
+            }
+            for modname, timing in import_times.items()
+        },
+    }
+
+
+def compare(base: dict[str, Any], head: dict[str, Any], top: int) -> str:
+    """Summarize the difference between two reports."""
+    lines = [f"{base.get('revision')} -> {head.get('revision')}"]
+
+    for section in ("setup", "registry"):
+        for key, value in head[section].items():
+            old = base[section].get(key)
+            if isinstance(value, (int, float)) and isinstance(old, (int, float)):
+                lines.append(f"{section}.{key}: {old:.6g} -> {value:.6g}")
+
+    deltas = sorted(
+        (
+            stats["import_s"] - base["modules"].get(modname, {}).get("import_s", 0),
+            modname,
+        )
+        for modname, stats in head["modules"].items()
+    )
+    lines.append(f"largest import time regressions (top {top}):")
+    lines.extend(
+        f"  {modname}: {delta * 1000:+.2f} ms"
+        for delta, modname in reversed(deltas[-top:])
+    )
+
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=pathlib.Path, help="write the JSON report")
+    parser.add_argument("--compare", type=pathlib.Path, help="baseline JSON report")
+    parser.add_argument("--repeat", type=int, default=3, help="cold setup runs")
+    parser.add_argument("--top", type=int, default=10, help="modules to compare")
+    parser.add_argument("--worker", nargs="+", help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    if args.worker:
+        mode, *params = args.worker
+        if mode == "setup":
+            result = _worker_setup(params[0], args.trace)
+        elif mode == "modules":
+            result = _worker_modules(args.trace)
+        else:
+            result = _worker_registry()
+        json.dump(result, sys.stdout)
+        return
+
+    report = run(max(args.repeat, 1))
+    text = json.dumps(report, indent=2, sort_keys=True)
+
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        print(compare(json.loads(args.compare.read_text()), report, args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark self resetting motion/occupancy timers.
+
+Compares re-arming one `loop.call_later` handle per sensor, as the clusters used to,
+against the shared `ResetScheduler`, for a fleet of sensors that keep triggering:
+
+    python benchmarks/reset_timers.py --sensors 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent.parent / "custom_zha_quirks")
+)
+
+from zhaquirks.reset_scheduler import ResetScheduler  # noqa: E402
+
+
+class _LegacySensor:
+    """Sensor re-arming its own timer handle on every trigger."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, reset_s: float) -> None:
+        self._loop = loop
+        self.reset_s = reset_s
+        self._timer_handle: asyncio.TimerHandle | None = None
+        self.resets = 0
+
+    def trigger(self) -> None:
+        if self._timer_handle:
+            self._timer_handle.cancel()
+        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+
+    def _turn_off(self) -> None:
+        self._timer_handle = None
+        self.resets += 1
+
+
+class _ScheduledSensor:
+    """Sensor re-arming through the shared reset scheduler."""
+
+    def __init__(self, scheduler: ResetScheduler, reset_s: float) -> None:
+        self._scheduler = scheduler
+        self.reset_s = reset_s
+        self.resets = 0
+
+    def trigger(self) -> None:
+        self._scheduler.schedule(self, self.reset_s, self._turn_off, group=id(self))
+
+    def _turn_off(self) -> None:
+        self.resets += 1
+
+
+async def _run(kind: str, sensors: int, rounds: int, interval: float) -> dict:
+    """Trigger every sensor `rounds` times, `interval` seconds apart."""
+    loop = asyncio.get_running_loop()
+    rng = random.Random(0)
+    scheduler = ResetScheduler(loop)
+
+    if kind == "call_later":
+        fleet = [_LegacySensor(loop, rng.uniform(5, 120)) for _ in range(sensors)]
+    else:
+        fleet = [
+            _ScheduledSensor(scheduler, rng.uniform(5, 120)) for _ in range(sensors)
+        ]
+
+    trigger_s = 0.0
+    max_handles = 0
+
+    for _ in range(rounds):
+        rng.shuffle(fleet)
+        start = time.perf_counter()
+        for sensor in fleet:
+            sensor.trigger()
+        trigger_s += time.perf_counter() - start
+
+        max_handles = max(max_handles, len(loop._scheduled))  # noqa: SLF001
+        await asyncio.sleep(interval)
+
+    for sensor in fleet:
+        if kind == "call_later":
+            if sensor._timer_handle:  # noqa: SLF001
+                sensor._timer_handle.cancel()  # noqa: SLF001
+        else:
+            scheduler.cancel_group(id(sensor))
+
+    return {
+        "trigger_us": trigger_s / (sensors * rounds) * 1e6,
+        "max_loop_handles": max_handles,
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sensors", type=int, default=1000, help="sensor count")
+    parser.add_argument("--rounds", type=int, default=50, help="triggers per sensor")
+    parser.add_argument(
+        "--interval", type=float, default=0.01, help="seconds between rounds"
+    )
+    args = parser.parse_args()
+
+    for kind in ("call_later", "scheduler"):
+        result = asyncio.run(_run(kind, args.sensors, args.rounds, args.interval))
+        print(
+            f"{kind:>10}: {result['trigger_us']:6.2f} us/trigger,"
+            f" {result['max_loop_handles']:>6} loop timer handles"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Benchmark decoding of Tuya MCU datapoint frames.
+
+Compares the single-pass `TuyaCommand.deserialize` against the generic zigpy struct
+decoding it replaced, after checking that both produce identical datapoints:
+
+    python benchmarks/tuya_codec.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent.parent / "custom_zha_quirks")
+)
+
+import zigpy.types as t  # noqa: E402
+
+from zhaquirks.tuya import TuyaCommand, TuyaData, TuyaDPType  # noqa: E402
+
+FRAMES = {
+    # TS0601 DIN power meter: energy, current, power and voltage
+    "power_meter": bytes.fromhex(
+        "00121102000400000d4a1202000400000b7c13020004000004e21402000400000906"
+    ),
+    # mmWave presence radar: presence, distance, illuminance and a raw report
+    "presence_radar": bytes.fromhex(
+        "00340104000101090200040000009668020004000001236700000603e80064000a"
+    ),
+    # TRV: system mode, child lock, setpoint and fault bitmap
+    "trv": bytes.fromhex("00560204000102070100010102020004000000d21305000100"),
+    "single_bool": bytes.fromhex("00010101000101"),
+}
+
+
+class _LegacyTuyaData(TuyaData):
+    """Tuya data decoded through zigpy types, without payload caching."""
+
+    @property
+    def payload(self):
+        """Decode the payload on every access."""
+        return self._decode_payload()
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> tuple[_LegacyTuyaData, bytes]:
+        """Deserialize Tuya data field by field."""
+        dp_type, data = TuyaDPType.deserialize(data)
+        function, data = t.uint8_t.deserialize(data)
+        raw, data = t.LVBytes.deserialize(data)
+
+        instance = cls()
+        instance.dp_type = dp_type
+        instance.function = function
+        instance.raw = raw
+
+        return instance, data
+
+
+class _LegacyDatapointData(t.Struct):
+    """Generic struct datapoint."""
+
+    dp: t.uint8_t
+    data: _LegacyTuyaData
+
+
+class _LegacyTuyaCommand(t.Struct):
+    """Generic struct Tuya command."""
+
+    status: t.uint8_t
+    tsn: t.uint8_t
+    datapoints: t.List[_LegacyDatapointData]
+
+
+def _decoded(command) -> tuple:
+    """Flatten a decoded frame for comparison."""
+    return (
+        command.status,
+        command.tsn,
+        [
+            (
+                record.dp,
+                record.data.dp_type,
+                record.data.function,
+                record.data.raw,
+                record.data.payload,
+            )
+            for record in command.datapoints
+        ],
+    )
+
+
+def check_equivalence() -> None:
+    """Check that both codecs agree on every frame and its truncations."""
+    for name, frame in FRAMES.items():
+        fast, rest = TuyaCommand.deserialize(frame)
+        legacy, legacy_rest = _LegacyTuyaCommand.deserialize(frame)
+
+        assert rest == legacy_rest == b"", name
+        assert _decoded(fast) == _decoded(legacy), name
+        assert fast.serialize() == frame, name
+
+        for size in range(len(frame)):
+            truncated = frame[:size]
+            outcomes = []
+            for codec in (TuyaCommand, _LegacyTuyaCommand):
+                try:
+                    outcomes.append(_decoded(codec.deserialize(truncated)[0]))
+                except ValueError:
+                    outcomes.append(ValueError)
+            assert outcomes[0] == outcomes[1], (name, size)
+
+
+def _handle(codec: type[t.Struct], frame: bytes) -> None:
+    """Decode a frame and read each payload twice, like a handler and its log."""
+    command, _ = codec.deserialize(frame)
+    for record in command.datapoints:
+        record.data.payload  # noqa: B018
+        record.data.payload  # noqa: B018
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="frames per run")
+    args = parser.parse_args()
+
+    check_equivalence()
+
+    for name, frame in FRAMES.items():
+        results = {}
+        for label, codec in (
+            ("generic", _LegacyTuyaCommand),
+            ("single-pass", TuyaCommand),
+        ):
+            elapsed = min(
+                timeit.repeat(
+                    lambda codec=codec: _handle(codec, frame),
+                    number=args.number,
+                    repeat=3,
+                )
+            )
+            results[label] = args.number / elapsed
+
+        print(
+            f"{name:>15}: generic {results['generic']:>9.0f} frames/s,"
+            f" single-pass {results['single-pass']:>9.0f} frames/s"
+            f" ({results['single-pass'] / results['generic']:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
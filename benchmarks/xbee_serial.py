@@ -0,0 +1,149 @@
+"""Benchmark XBee serial data throughput.
+
+Compares sending and receiving serial data one `XBeeSerialDataCluster` command or
+relay event per frame against the stream returned by `open_serial_stream()`. The
+radio is replaced by a stand-in application object that completes every request
+immediately:
+
+    python benchmarks/xbee_serial.py --size 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import pathlib
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent.parent / "custom_zha_quirks")
+)
+
+import zigpy.device  # noqa: E402
+import zigpy.types as t  # noqa: E402
+from zigpy.zcl import foundation  # noqa: E402
+
+from zhaquirks.xbee import (  # noqa: E402
+    DATA_IN_CMD,
+    XBEE_DATA_CLUSTER,
+    XBEE_DATA_ENDPOINT,
+    XBEE_SERIAL_MAX_PAYLOAD,
+)
+from zhaquirks.xbee.types import BinaryString  # noqa: E402
+from zhaquirks.xbee.xbee3_io import XBee3Sensor  # noqa: E402
+
+
+class StandInApplication:
+    """Controller application completing every request immediately."""
+
+    def __init__(self) -> None:
+        self._dblistener = None
+        self.state = SimpleNamespace(
+            node_info=SimpleNamespace(ieee=t.EUI64(range(8)), nwk=t.NWK(0x0000))
+        )
+        self.sent_frames = 0
+        self.sent_bytes = 0
+        self._sequence = 0
+
+    def register_callback_listener(self, *args, **kwargs):
+        return lambda: None
+
+    def get_sequence(self) -> int:
+        self._sequence = (self._sequence + 1) % 256
+        return self._sequence
+
+    async def request(self, device, profile, cluster, src_ep, dst_ep, seq, data, **kw):
+        self.sent_frames += 1
+        self.sent_bytes += len(data)
+        return foundation.Status.SUCCESS, "sent"
+
+
+def _create_device(app: StandInApplication) -> XBee3Sensor:
+    """Create an XBee3 quirk device on the stand-in application."""
+    device = zigpy.device.Device(app, t.EUI64(range(1, 9)), 0x1234)
+    for endpoint_id in (0xE6, XBEE_DATA_ENDPOINT):
+        endpoint = device.add_endpoint(endpoint_id)
+        endpoint.profile_id = 0xC105
+        endpoint.device_type = 0x0001
+
+    return XBee3Sensor(app, device.ieee, device.nwk, device)
+
+
+async def _send_commands(device: XBee3Sensor, data: bytes) -> None:
+    """Send data with one cluster command per frame."""
+    cluster = device.endpoints[XBEE_DATA_ENDPOINT].out_clusters[XBEE_DATA_CLUSTER]
+    for offset in range(0, len(data), XBEE_SERIAL_MAX_PAYLOAD):
+        chunk = data[offset : offset + XBEE_SERIAL_MAX_PAYLOAD]
+        await cluster.command(DATA_IN_CMD, chunk.decode("latin1"))
+
+
+async def _send_stream(device: XBee3Sensor, data: bytes) -> None:
+    """Send data through a serial stream in application sized writes."""
+    _reader, writer = await device.open_serial_stream()
+    for offset in range(0, len(data), 1024):
+        writer.write(data[offset : offset + 1024])
+        await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+def _receive(device: XBee3Sensor, data: bytes) -> float:
+    """Deliver data in radio frames, to the event relay or an open stream."""
+    cluster = device.endpoints[XBEE_DATA_ENDPOINT].in_clusters[XBEE_DATA_CLUSTER]
+    schema = cluster.server_commands[DATA_IN_CMD].schema
+    hdr = foundation.ZCLHeader.cluster(0, DATA_IN_CMD)
+    frames = [
+        schema(data=BinaryString(data[offset : offset + 64].decode("latin1")))
+        for offset in range(0, len(data), 64)
+    ]
+
+    start = time.perf_counter()
+    for frame in frames:
+        cluster.handle_cluster_request(hdr, frame)
+    return time.perf_counter() - start
+
+
+async def _run(size: int) -> dict[str, float]:
+    payload = bytes(range(256)) * (size // 256)
+    results = {}
+
+    for label, send in (("commands", _send_commands), ("stream", _send_stream)):
+        app = StandInApplication()
+        device = _create_device(app)
+        start = time.perf_counter()
+        await send(device, payload)
+        elapsed = time.perf_counter() - start
+        assert app.sent_bytes == len(payload), label
+        results[f"send_{label}"] = len(payload) / elapsed
+
+    device = _create_device(StandInApplication())
+    results["receive_events"] = len(payload) / _receive(device, payload)
+
+    reader, _writer = await device.open_serial_stream(limit=len(payload))
+    results["receive_stream"] = len(payload) / _receive(device, payload)
+    assert await reader.readexactly(len(payload)) == payload
+
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="bytes to send")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args.size))
+    for direction in ("send", "receive"):
+        base, stream = [
+            value for key, value in results.items() if key.startswith(direction)
+        ]
+        print(
+            f"{direction:>8}: per frame {base / 1e6:7.2f} MB/s,"
+            f" stream {stream / 1e6:7.2f} MB/s ({stream / base:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
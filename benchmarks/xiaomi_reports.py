@@ -0,0 +1,125 @@
+"""Benchmark fixing up Xiaomi attribute reports.
+
+Compares the single-pass and cached `XiaomiCluster` report fix-up against the
+exhaustive length search it replaced, after checking that both produce identical
+reports:
+
+    python benchmarks/xiaomi_reports.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent.parent / "custom_zha_quirks")
+)
+
+from zhaquirks.xiaomi import XiaomiCluster  # noqa: E402
+
+
+def _string_attr(attr_id: int, tlv: str, len_offset: int = 0) -> bytes:
+    """Encode a Xiaomi "Character String" attribute, optionally with a wrong length."""
+    value = bytes.fromhex(tlv)
+    return (
+        attr_id.to_bytes(2, "little")
+        + b"\x42"
+        + bytes([len(value) + len_offset])
+        + value
+    )
+
+
+REPORTS = {
+    # lumi.weather heartbeat: voltage, temperature, RSSI, humidity and pressure
+    "weather_heartbeat": _string_attr(
+        0xFF01,
+        "0121d10b03281b0421a81305210d00062400000000000a2100006429a2096521621a"
+        "66295e27",
+    ),
+    # lumi.plug heartbeat with consumption, voltage and power floats
+    "plug_heartbeat": _string_attr(
+        0xFF01,
+        "0410000328200521ed00062401000000000a210000953960b6a03f9639d7a36943"
+        "9739000000009839000000009b210000",
+    ),
+    # lumi.sensor_ht reports the 0xFF01 string one byte too long
+    "broken_length": _string_attr(
+        0xFF01, "0121bd0b0421a81364295d096521a91a0a210000", len_offset=1
+    ),
+    # Model string reported after a button press, followed by a heartbeat
+    "model_and_heartbeat": (
+        bytes.fromhex("0500420e6c756d692e73656e736f725f6874")
+        + _string_attr(0xFF01, "0121bd0b0421a81364295d096521a91a0a210000")
+    ),
+    # lumi.motion.ac02 E1 heartbeat on 0x00F7
+    "e1_heartbeat": _string_attr(
+        0x00F7, "0121b80c0328190421a8130521070006240200000000082104020a2100006510"
+        "00",
+    ),
+}
+
+
+def _legacy_fix_attr_report(cluster: XiaomiCluster, data: bytes) -> bytes | None:
+    """Fix a report by enumerating every interpretation, like the old parser."""
+    reports = list(cluster._interpret_attr_reports(data))
+    if not reports:
+        return None
+    return b"".join(attr.serialize() for attr in reports[0])
+
+
+def _cluster() -> XiaomiCluster:
+    """Create a cluster for the report helpers, which need no endpoint."""
+    return XiaomiCluster.__new__(XiaomiCluster)
+
+
+def check_equivalence() -> None:
+    """Check that every parser agrees on every report and its truncations."""
+    cluster = _cluster()
+
+    for name, report in REPORTS.items():
+        legacy = _legacy_fix_attr_report(cluster, report)
+        assert legacy is not None, name
+        assert cluster._fix_attr_report(report) == legacy, name
+        assert cluster._cached_fix_attr_report(report) == legacy, name
+        assert cluster._cached_fix_attr_report(report) == legacy, name
+
+        for size in range(len(report)):
+            truncated = report[:size]
+            assert cluster._fix_attr_report(truncated) == _legacy_fix_attr_report(
+                cluster, truncated
+            ), (name, size)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="reports per run")
+    args = parser.parse_args()
+
+    check_equivalence()
+    cluster = _cluster()
+
+    for name, report in REPORTS.items():
+        results = {}
+        for label, fix in (
+            ("search", lambda: _legacy_fix_attr_report(cluster, report)),
+            ("single-pass", lambda: cluster._fix_attr_report(report)),
+            ("cached", lambda: cluster._cached_fix_attr_report(report)),
+        ):
+            elapsed = min(timeit.repeat(fix, number=args.number, repeat=3))
+            results[label] = args.number / elapsed
+
+        print(
+            f"{name:>20}: search {results['search']:>9.0f} reports/s,"
+            f" single-pass {results['single-pass']:>9.0f} reports/s"
+            f" ({results['single-pass'] / results['search']:.1f}x),"
+            f" cached {results['cached']:>9.0f} reports/s"
+            f" ({results['cached'] / results['search']:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Iterator
+import hashlib
 import importlib
+import importlib.metadata
 import importlib.util
+import json
 import logging
+import os
 import pathlib
 import pkgutil
 import sys
@@ -14,6 +18,7 @@ from typing import Any
 
 import zigpy.device
 import zigpy.endpoint
+import zigpy.quirks
 from zigpy.quirks import DEVICE_REGISTRY, CustomCluster, CustomDevice
 import zigpy.types as t
 from zigpy.util import ListenableMixin
@@ -47,6 +52,16 @@ from .const import (
     ZHA_SEND_EVENT,
     ZONE_STATUS_CHANGE_COMMAND,
 )
+from .cluster_substitution import ClusterSubstitutionMixin  # noqa: F401
+from .derived_attributes import (  # noqa: F401
+    DerivedAttribute,
+    DerivedAttributesMixin,
+    derivation_frame,
+)
+from .multi_press import MultiPressDetector  # noqa: F401
+from .reporting import ReportingFilterMixin  # noqa: F401
+from .reset_scheduler import ResetTimerMixin
+from .time_sync import get_time_sync  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -246,19 +261,12 @@ class PowerConfigurationCluster(CustomCluster, PowerConfiguration):
         return percent
 
 
-class _Motion(CustomCluster, IasZone):
+class _Motion(ResetTimerMixin, CustomCluster, IasZone):
     """Self reset Motion cluster."""
 
     reset_s: int = 30
 
-    def __init__(self, *args, **kwargs):
-        """Init."""
-        super().__init__(*args, **kwargs)
-        self._loop = asyncio.get_running_loop()
-        self._timer_handle = None
-
     def _turn_off(self):
-        self._timer_handle = None
         self.debug("%s - Resetting motion sensor", self.endpoint.device.ieee)
         self.listener_event(
             CLUSTER_COMMAND, 253, ZONE_STATUS_CHANGE_COMMAND, [OFF, 0, 0, 0]
@@ -284,9 +292,7 @@ class MotionWithReset(_Motion):
         """Handle the cluster command."""
         # check if the command is for a zone status change of ZoneStatus.Alarm_1 or ZoneStatus.Alarm_2
         if hdr.command_id == ZONE_STATUS_CHANGE_COMMAND and args[0] & 3:
-            if self._timer_handle:
-                self._timer_handle.cancel()
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._schedule_reset()
             if self.send_occupancy_event:
                 self.endpoint.device.occupancy_bus.listener_event(OCCUPANCY_EVENT)
 
@@ -309,25 +315,15 @@ class MotionOnEvent(_Motion):
 
         self.debug("%s - Received motion event message", self.endpoint.device.ieee)
 
-        if self._timer_handle:
-            self._timer_handle.cancel()
+        self._schedule_reset()
 
-        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
 
-
-class _Occupancy(CustomCluster, OccupancySensing):
+class _Occupancy(ResetTimerMixin, CustomCluster, OccupancySensing):
     """Self reset Occupancy cluster."""
 
     reset_s: int = 600
 
-    def __init__(self, *args, **kwargs):
-        """Init."""
-        super().__init__(*args, **kwargs)
-        self._timer_handle = None
-        self._loop = asyncio.get_running_loop()
-
     def _turn_off(self):
-        self._timer_handle = None
         self._update_attribute(OCCUPANCY_STATE, OFF)
 
 
@@ -343,10 +339,7 @@ class OccupancyOnEvent(_Occupancy):
         """Occupancy event."""
         self._update_attribute(OCCUPANCY_STATE, ON)
 
-        if self._timer_handle:
-            self._timer_handle.cancel()
-
-        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+        self._schedule_reset()
 
 
 class OccupancyWithReset(_Occupancy):
@@ -356,10 +349,8 @@ class OccupancyWithReset(_Occupancy):
         super()._update_attribute(attrid, value)
 
         if attrid == OCCUPANCY_STATE and value == ON:
-            if self._timer_handle:
-                self._timer_handle.cancel()
             self.endpoint.device.motion_bus.listener_event(MOTION_EVENT)
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._schedule_reset()
 
 
 class QuickInitDevice(CustomDevice):
@@ -446,20 +437,254 @@ class NoReplyMixin:
         return rsp
 
 
-def setup(custom_quirks_path: str | None = None) -> None:
-    """Register all quirks with zigpy, including optional custom quirks."""
+QUIRKS_INDEX_FILE = pathlib.Path(__file__).parent / ".quirks_index.json"
+QUIRKS_INDEX_VERSION = 2
+
+# (manufacturer, model) -> quirk modules not yet imported, in registration order
+_lazy_quirk_modules: dict[tuple[str | None, str | None], list[str]] = {}
+# quirk module -> position in the order an eager import registers them
+_quirk_module_ranks: dict[str, int] = {}
+
+
+def _registry_buckets() -> Iterator[tuple[tuple, typing.Any]]:
+    """Yield every v1 and v2 registry bucket together with a unique key."""
+    for manufacturer, models in DEVICE_REGISTRY.registry_v1.items():
+        for model, quirks in models.items():
+            yield (1, manufacturer, model), quirks
+
+    for (manufacturer, model), entries in DEVICE_REGISTRY.registry_v2.items():
+        yield (2, manufacturer, model), entries
+
+
+def _registry_sizes() -> dict[tuple, int]:
+    """Snapshot the size of every registry bucket."""
+    return {key: len(bucket) for key, bucket in _registry_buckets()}
 
-    if custom_quirks_path is not None:
-        DEVICE_REGISTRY.purge_custom_quirks(custom_quirks_path)
 
-    # Import all quirks in the `zhaquirks` package first
+def _quirks_fingerprint() -> str:
+    """Fingerprint the quirk sources and zigpy version the index was built from."""
+    try:
+        zigpy_version = importlib.metadata.version("zigpy")
+    except importlib.metadata.PackageNotFoundError:
+        # e.g. a source checkout on the path, without `__version__` in older zigpy
+        zigpy_version = getattr(zigpy, "__version__", None)
+        if zigpy_version is None:
+            zigpy_version = str(os.stat(zigpy.__file__).st_mtime_ns)
+
+    digest = hashlib.sha256(zigpy_version.encode())
+    root = pathlib.Path(__path__[0])
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            stat = os.stat(os.path.join(dirpath, filename))
+            relpath = os.path.relpath(os.path.join(dirpath, filename), root)
+            digest.update(f"{relpath}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+
+    return digest.hexdigest()
+
+
+def _load_quirks_index(fingerprint: str) -> dict[str, Any] | None:
+    """Load the cached quirk index, if it is still valid."""
+    try:
+        index = json.loads(QUIRKS_INDEX_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != QUIRKS_INDEX_VERSION
+        or index.get("fingerprint") != fingerprint
+    ):
+        return None
+
+    return index
+
+
+def _save_quirks_index(index: dict[str, Any]) -> None:
+    """Write the quirk index next to the package, ignoring read-only installs."""
+    tmp_file = QUIRKS_INDEX_FILE.with_suffix(".tmp")
+
+    try:
+        tmp_file.write_text(json.dumps(index, separators=(",", ":")))
+        tmp_file.replace(QUIRKS_INDEX_FILE)
+    except OSError as exc:
+        _LOGGER.debug("Unable to write quirk index %s: %r", QUIRKS_INDEX_FILE, exc)
+
+
+def _build_quirks_index(fingerprint: str) -> dict[str, Any]:
+    """Import every quirk module and record what each of them registers.
+
+    Modules matching any manufacturer and model, modules registering handlers for
+    uninitialized devices and modules imported before setup are loaded eagerly.
+    Everything else is keyed by the manufacturer and model it registers.
+    """
+    handlers = zigpy.quirks._uninitialized_device_message_handlers  # pylint: disable=W0212
+    preloaded = set(sys.modules)
+    eager: list[str] = []
+    # modules imported before setup registered first
+    modules: tuple[list[str], list[str]] = ([], [])
+    quirks: dict[tuple[str | None, str | None], list[str]] = {}
+
     for _importer, modname, _ispkg in pkgutil.walk_packages(
         path=__path__,
         prefix=__name__ + ".",
     ):
         _LOGGER.debug("Loading quirks module %r", modname)
+
+        if modname in preloaded:
+            importlib.import_module(modname)
+            eager.append(modname)
+            modules[0].append(modname)
+            continue
+
+        modules[1].append(modname)
+
+        sizes = _registry_sizes()
+        num_handlers = len(handlers)
         importlib.import_module(modname)
 
+        keys = {
+            key[1:]
+            for key, bucket in _registry_buckets()
+            if len(bucket) > sizes.get(key, 0)
+        }
+
+        if len(handlers) > num_handlers or (None, None) in keys:
+            eager.append(modname)
+            continue
+
+        for key in keys:
+            quirks.setdefault(key, []).append(modname)
+
+    return {
+        "version": QUIRKS_INDEX_VERSION,
+        "fingerprint": fingerprint,
+        "eager": eager,
+        # modules imported before setup registered first
+        "modules": modules[0] + modules[1],
+        "quirks": [[*key, modnames] for key, modnames in quirks.items()],
+    }
+
+
+def _load_lazy_quirks(manufacturer: str | None, model: str | None) -> None:
+    """Import the quirk modules that can match a manufacturer and model."""
+    modnames = [
+        modname
+        for key in ((manufacturer, model), (manufacturer, None), (None, model))
+        for modname in _lazy_quirk_modules.pop(key, ())
+    ]
+    if not modnames:
+        return
+
+    sizes = _registry_sizes()
+
+    for modname in modnames:
+        _LOGGER.debug("Lazily loading quirks module %r", modname)
+
+        try:
+            importlib.import_module(modname)
+        except Exception:
+            _LOGGER.exception("Unexpected exception importing quirk %r", modname)
+
+    # Quirks are prepended to the registry: restore the order an eager import gives,
+    # keeping anything registered outside of `zhaquirks` (custom quirks) in front
+    for key, bucket in _registry_buckets():
+        size = sizes.get(key, 0)
+        if not size or len(bucket) == size:
+            continue
+
+        ranks = {id(entry): _quirk_module_rank(entry) for entry in bucket}
+        custom = [entry for entry in bucket if ranks[id(entry)] is None]
+        builtin = [entry for entry in bucket if ranks[id(entry)] is not None]
+        # stable, so quirks registered by the same module keep their order
+        builtin.sort(key=lambda entry: -ranks[id(entry)])
+
+        bucket.clear()
+        bucket.extend(custom + builtin)
+
+    _instrument_loaded_clusters()
+
+
+def _quirk_module_rank(entry: Any) -> int | None:
+    """Return the eager import rank of a registry entry, None for custom quirks."""
+    quirk_file = getattr(entry, "quirk_file", None)
+    if quirk_file is None:
+        modname = entry.__module__
+    else:
+        try:
+            relpath = pathlib.Path(quirk_file).relative_to(__path__[0])
+        except ValueError:
+            return None
+        parts = relpath.with_suffix("").parts
+        modname = ".".join(
+            (__name__, *parts[: -1 if parts[-1] == "__init__" else None])
+        )
+
+    if modname != __name__ and not modname.startswith(__name__ + "."):
+        return None
+
+    # built-in modules imported outside of setup registered before all others
+    return _quirk_module_ranks.get(modname, -1)
+
+
+def _instrument_loaded_clusters() -> None:
+    """Instrument newly loaded clusters if instrumentation has been enabled."""
+    instrumentation = sys.modules.get("zhaquirks.instrumentation")
+    if instrumentation is not None and instrumentation.is_enabled():
+        instrumentation.instrument_loaded_clusters()
+
+
+def _install_lazy_quirk_loader() -> None:
+    """Load indexed quirk modules the first time a matching device is looked up."""
+    if "get_device" in vars(DEVICE_REGISTRY):
+        return
+
+    get_device = DEVICE_REGISTRY.get_device
+
+    def _get_device(device: zigpy.device.Device) -> zigpy.device.Device:
+        _load_lazy_quirks(device.manufacturer, device.model)
+        return get_device(device)
+
+    DEVICE_REGISTRY.get_device = _get_device
+
+
+def setup(custom_quirks_path: str | None = None) -> None:
+    """Register all quirks with zigpy, including optional custom quirks.
+
+    Built-in quirk modules are only imported once a device they apply to is looked
+    up, using an on-disk index of the manufacturer and model registered by each
+    module. The index is rebuilt by importing everything whenever the quirk sources
+    or zigpy version change.
+    """
+
+    if custom_quirks_path is not None:
+        DEVICE_REGISTRY.purge_custom_quirks(custom_quirks_path)
+
+    fingerprint = _quirks_fingerprint()
+    index = _load_quirks_index(fingerprint)
+
+    if index is None:
+        # Import all quirks in the `zhaquirks` package first
+        _save_quirks_index(_build_quirks_index(fingerprint))
+    else:
+        for modname in index["eager"]:
+            _LOGGER.debug("Loading quirks module %r", modname)
+            importlib.import_module(modname)
+
+        for manufacturer, model, modnames in index["quirks"]:
+            _lazy_quirk_modules[(manufacturer, model)] = modnames
+
+        _quirk_module_ranks.update(
+            (modname, rank) for rank, modname in enumerate(index["modules"])
+        )
+
+        _install_lazy_quirk_loader()
+
+    _instrument_loaded_clusters()
+
     if custom_quirks_path is None:
         return
 
@@ -0,0 +1,62 @@
+"""Manufacturer clusters standing in for another cluster on the air."""
+
+from __future__ import annotations
+
+import types
+
+import zigpy.types as t
+from zigpy.zcl import foundation
+
+
+class ClusterSubstitutionMixin:
+    """Device mixin for manufacturer clusters aliasing another cluster on the air.
+
+    A manufacturer specific cluster declaring `SUBSTITUTION_FOR` is sent as that
+    cluster ID. Manufacturer specific frames received on the substituted cluster ID
+    are routed back to the manufacturer cluster. Both tables are built once, after
+    the quirk has replaced the endpoints' clusters.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+
+        outbound = {}
+        inbound = {}
+        for endpoint_id, endpoint in self.endpoints.items():
+            # ignore ZDO and narrow down to manufacturer specific clusters
+            if endpoint_id == 0:
+                continue
+            for cluster_id, cluster in endpoint.in_clusters.items():
+                substitute_id = getattr(cluster, "SUBSTITUTION_FOR", None)
+                if cluster_id < 0xFC00 or substitute_id is None:
+                    continue
+                outbound[endpoint_id, cluster_id] = t.ClusterId(substitute_id)
+                inbound[endpoint_id, substitute_id] = t.ClusterId(cluster_id)
+
+        # (endpoint id, cluster id) -> cluster id used on the air, and back
+        self._outbound_substitutions = types.MappingProxyType(outbound)
+        self._inbound_substitutions = types.MappingProxyType(inbound)
+
+    async def request(self, *args, **kwargs):
+        """Remap cluster IDs for clusters that substitute for others."""
+        # this method is always called with kwargs
+        substitute_id = self._outbound_substitutions.get(
+            (kwargs["dst_ep"], kwargs["cluster"])
+        )
+        if substitute_id is not None:
+            kwargs["cluster"] = substitute_id
+
+        return await super().request(*args, **kwargs)
+
+    def packet_received(self, packet: t.ZigbeePacket) -> None:
+        """Route manufacturer specific frames back to the substituting cluster."""
+        cluster_id = self._inbound_substitutions.get((packet.src_ep, packet.cluster_id))
+        if (
+            cluster_id is not None
+            and packet.data.value
+            and foundation.FrameControl(packet.data.value[0]).is_manufacturer_specific
+        ):
+            packet = packet.replace(cluster_id=cluster_id)
+
+        super().packet_received(packet)
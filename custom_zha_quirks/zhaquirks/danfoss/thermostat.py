@@ -28,14 +28,17 @@ Broken ZCL attributes:
     0x0204 - TemperatureDisplayMode (0x0000): Writing doesn't seem to do anything
 """
 
+import asyncio
 from collections.abc import Callable
 from datetime import UTC, datetime
 import time
 from typing import Any
+import weakref
 
 from zigpy import types
 from zigpy.profiles import zha
 from zigpy.quirks import CustomCluster, CustomDevice
+from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import (
     Basic,
     Identify,
@@ -48,6 +51,7 @@ from zigpy.zcl.clusters.homeautomation import Diagnostic
 from zigpy.zcl.clusters.hvac import Thermostat, UserInterface
 from zigpy.zcl.foundation import ZCLAttributeDef, ZCLCommandDef
 
+from zhaquirks import get_time_sync
 from zhaquirks.const import (
     DEVICE_TYPE,
     ENDPOINTS,
@@ -158,6 +162,20 @@ class DanfossPreheatCommandEnum(types.enum8):
     Force = 0
 
 
+# device -> semaphore bounding the frames of split commands in flight
+_device_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _reports_status_for_all(result: Any) -> bool:
+    """Return whether a response is a single record reporting the status of all."""
+    return (
+        not isinstance(result, BaseException)
+        and isinstance(result[0], list)
+        and len(result[0]) == 1
+        and getattr(result[0][0], "attrid", 0) is None
+    )
+
+
 class CustomizedStandardCluster(CustomCluster):
     """Danfoss customized standard clusters by adding custom attributes.
 
@@ -166,63 +184,114 @@ class CustomizedStandardCluster(CustomCluster):
     manufacturer specific to be passed for specific attributes, but not for standard attributes.
     """
 
-    @staticmethod
-    def combine_results(*result_lists):
-        """Combine results from 1 or more result lists from zigbee commands."""
-        success_global = []
-        failure_global = []
-        for result in result_lists:
-            if len(result) == 1:
-                success_global.extend(result[0])
-            elif len(result) == 2:
-                success_global.extend(result[0])
-                failure_global.extend(result[1])
-
-        if failure_global:
-            return [success_global, failure_global]
-        else:
-            return [success_global]
+    # Bytes of attribute records sent in one frame, longer lists are split up
+    max_payload_size: int = 64
+    # Frames in flight per device while splitting a command
+    max_concurrent_commands: int = 2
 
     async def split_command(
         self,
         records: list[Any],
         func: Callable,
         extract_attrid: Callable[[Any], int],
+        status_record: Callable[[Any, foundation.Status], Any],
         *args,
         **kwargs,
     ):
-        """Split execution of command in one for manufacturer specific and one for standard attributes."""
-        records_specific = [
-            e
-            for e in records
-            if self.attributes[extract_attrid(e)].is_manufacturer_specific
-        ]
-        records_standard = [
-            e
-            for e in records
-            if not self.attributes[extract_attrid(e)].is_manufacturer_specific
-        ]
-
-        result_specific = (
-            await func(records_specific, *args, **kwargs) if records_specific else []
-        )
+        """Split execution of command in frames for manufacturer specific and standard attributes.
 
-        result_standard = (
-            await func(records_standard, *args, **kwargs) if records_standard else []
+        The frames are sent concurrently and their response records combined.
+        `status_record(record, status)` creates the response record of a record whose
+        frame failed as a whole. Only if every frame failed, the first error is raised.
+        """
+        frames = []
+        for manufacturer_specific in (True, False):
+            frame, size = [], 0
+            for record in records:
+                attr = self.attributes[extract_attrid(record)]
+                if attr.is_manufacturer_specific is not manufacturer_specific:
+                    continue
+
+                record_size = (
+                    len(record.serialize()) if hasattr(record, "serialize") else 2
+                )
+                if frame and size + record_size > self.max_payload_size:
+                    frames.append(frame)
+                    frame, size = [], 0
+                frame.append(record)
+                size += record_size
+
+            if frame:
+                frames.append(frame)
+
+        if not frames:
+            return [[]]
+
+        semaphore = _device_semaphores.get(self.endpoint.device)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_commands)
+            _device_semaphores[self.endpoint.device] = semaphore
+
+        async def send(frame):
+            async with semaphore:
+                return await func(frame, *args, **kwargs)
+
+        if len(frames) == 1:
+            return await send(frames[0])
+
+        results = await asyncio.gather(
+            *(send(frame) for frame in frames), return_exceptions=True
         )
-
-        return self.combine_results(result_specific, result_standard)
+        if all(isinstance(result, BaseException) for result in results):
+            raise results[0]
+
+        combined = []
+        for frame, result in zip(frames, results):
+            if isinstance(result, BaseException):
+                self.debug("Split command failed for %s: %r", frame, result)
+                status = foundation.Status.FAILURE
+            elif not isinstance(result[0], list):
+                # default response
+                status = getattr(result, "status", foundation.Status.FAILURE)
+            elif _reports_status_for_all(result):
+                status = result[0][0].status
+            else:
+                combined.extend(result[0])
+                continue
+
+            combined.extend(status_record(record, status) for record in frame)
+
+        if all(
+            _reports_status_for_all(result)
+            and result[0][0].status == foundation.Status.SUCCESS
+            for result in results
+        ):
+            return results[0]
+
+        return [combined]
 
     async def _configure_reporting(self, records, *args, **kwargs):
         """Configure reporting ZCL foundation command."""
         return await self.split_command(
-            records, super()._configure_reporting, lambda x: x.attrid, *args, **kwargs
+            records,
+            super()._configure_reporting,
+            lambda x: x.attrid,
+            lambda x, status: foundation.ConfigureReportingResponseRecord(
+                status=status, direction=x.direction, attrid=x.attrid
+            ),
+            *args,
+            **kwargs,
         )
 
     async def _read_attributes(self, attr_ids, *args, **kwargs):
         """Read attributes ZCL foundation command."""
         return await self.split_command(
-            attr_ids, super()._read_attributes, lambda x: x, *args, **kwargs
+            attr_ids,
+            super()._read_attributes,
+            lambda x: x,
+            lambda x, status: foundation.ReadAttributeRecord(attrid=x, status=status),
+            *args,
+            **kwargs,
         )
 
 
@@ -361,17 +430,26 @@ class DanfossThermostatCluster(CustomizedStandardCluster, Thermostat):
             attributes[system_mode.name] = system_mode.type.Heat
 
         # Attributes cannot be empty, because write_res cannot be empty, but it can contain unrequested items
-        write_res = await super().write_attributes(
-            attributes, manufacturer=manufacturer
-        )
+        write = super().write_attributes(attributes, manufacturer=manufacturer)
+
+        if fast_setpoint_change is None:
+            return await write
 
-        if fast_setpoint_change is not None:
-            # On Danfoss a fast setpoint change is done through a command
-            await self.setpoint_command(
+        # On Danfoss a fast setpoint change is done through a command,
+        # which is sent along with the attribute write
+        write_res, command_res = await asyncio.gather(
+            write,
+            self.setpoint_command(
                 DanfossSetpointCommandEnum.User_interaction,
                 fast_setpoint_change,
                 manufacturer=manufacturer,
-            )
+            ),
+            return_exceptions=True,
+        )
+
+        for result in (write_res, command_res):
+            if isinstance(result, BaseException):
+                raise result
 
         return write_res
 
@@ -453,6 +531,16 @@ class DanfossDiagnosticCluster(CustomizedStandardCluster, Diagnostic):
 class DanfossTimeCluster(CustomizedStandardCluster, Time):
     """Danfoss cluster for fixing the time."""
 
+    # Seconds between writes of the time, the device never asks for it
+    time_resync_interval: float | None = 24 * 60 * 60
+
+    def schedule_resync(self) -> None:
+        """Write the time every `time_resync_interval` seconds from now on."""
+        if self.time_resync_interval is not None:
+            get_time_sync().schedule_resync(
+                self.endpoint.device, self.write_time, self.time_resync_interval
+            )
+
     async def write_time(self):
         """Write time info to Time Cluster.
 
@@ -460,7 +548,7 @@ class DanfossTimeCluster(CustomizedStandardCluster, Time):
             zoneinfo, datetime or time
         """
         epoch = datetime(2000, 1, 1, 0, 0, 0, 0, tzinfo=UTC)
-        current_time = (datetime.now(UTC) - epoch).total_seconds()
+        current_time = get_time_sync().seconds_since(epoch)
 
         await self.write_attributes(
             {
@@ -477,6 +565,7 @@ class DanfossTimeCluster(CustomizedStandardCluster, Time):
         """
         result = await super().bind()
         await self.write_time()
+        self.schedule_resync()
         return result
 
 
@@ -487,6 +576,9 @@ class DanfossThermostat(CustomDevice):
 
     manufacturer_code = 0x1246
 
+    # whether the periodic time resync has been scheduled since startup
+    _time_resync_scheduled = False
+
     signature = {
         # <SimpleDescriptor endpoint=1 profile=260 device_type=769
         # device_version=0 input_clusters=[0, 1, 3, 10, 32, 513, 516, 1026, 2821]
@@ -536,3 +628,10 @@ class DanfossThermostat(CustomDevice):
             }
         }
     }
+
+    def packet_received(self, packet: types.ZigbeePacket) -> None:
+        """Start the periodic time resync once the device is heard from."""
+        if not self._time_resync_scheduled:
+            self._time_resync_scheduled = True
+            self.endpoints[1].time.schedule_resync()
+        super().packet_received(packet)
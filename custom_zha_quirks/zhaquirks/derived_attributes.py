@@ -0,0 +1,154 @@
+"""Attributes derived from other attributes of the same cluster."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import typing
+from collections.abc import Callable, Iterator
+from typing import Any
+
+
+class DerivedAttribute(typing.NamedTuple):
+    """Attribute computed from other attributes of the same cluster."""
+
+    name: str
+    inputs: tuple[str, ...]
+    # Called with the input values once all are known, returning None skips an update
+    formula: Callable[..., Any]
+
+
+# Clusters with derived attributes to evaluate at the end of the current frame
+_derivation_frame: list[DerivedAttributesMixin] | None = None
+
+
+@contextlib.contextmanager
+def derivation_frame() -> Iterator[None]:
+    """Evaluate derived attributes only once all updates of the block were applied.
+
+    Used around the handling of frames carrying several attributes, so derived
+    attributes are not computed from partially updated inputs. Nested blocks are
+    evaluated with the outermost one.
+    """
+    global _derivation_frame
+
+    if _derivation_frame is not None:
+        yield
+        return
+
+    _derivation_frame = frame = []
+    try:
+        yield
+    finally:
+        _derivation_frame = None
+        for cluster in frame:
+            cluster._derive()
+
+
+@functools.cache
+def _derivation_graph(
+    cls: type[DerivedAttributesMixin],
+) -> tuple[list[tuple[int, tuple[int, ...], Callable]], dict[int, set[int]]]:
+    """Return the derived attributes of a cluster in dependency order.
+
+    Also returns the indexes of the derived attributes depending on each attribute.
+    """
+    derived = {
+        cls.attributes_by_name[attr.name].id: (
+            tuple(cls.attributes_by_name[name].id for name in attr.inputs),
+            attr.formula,
+        )
+        for attr in cls.derived_attributes
+    }
+    order = []
+    visited = set()
+    visiting = set()
+
+    def visit(attrid: int) -> None:
+        if attrid not in derived or attrid in visited:
+            return
+        if attrid in visiting:
+            raise ValueError(f"Derived attributes of {cls} depend on each other")
+
+        visiting.add(attrid)
+        inputs, formula = derived[attrid]
+        for input_id in inputs:
+            visit(input_id)
+        visited.add(attrid)
+        order.append((attrid, inputs, formula))
+
+    for attrid in derived:
+        visit(attrid)
+
+    dependents: dict[int, set[int]] = {}
+    for index, (_, inputs, _) in enumerate(order):
+        for input_id in inputs:
+            dependents.setdefault(input_id, set()).add(index)
+
+    return order, dependents
+
+
+class DerivedAttributesMixin:
+    """Keep `derived_attributes` up to date with the attributes they are derived from.
+
+    Updating an input marks the derived attributes depending on it, which are then
+    evaluated in dependency order: right away, or at the end of the enclosing
+    `derivation_frame()`. Derived attributes are computed from the latest input
+    values, even those a later mixin holds back, and are only updated when their
+    value changes.
+    """
+
+    derived_attributes: tuple[DerivedAttribute, ...] = ()
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        # attribute id -> latest value of each input and derived attribute
+        self._derivation_values: dict[int, Any] = {}
+        # indexes of the derived attributes to evaluate
+        self._dirty_derived: set[int] = set()
+        super().__init__(*args, **kwargs)
+
+    def handle_cluster_general_request(self, *args, **kwargs):
+        """Evaluate derived attributes once per attribute report."""
+        with derivation_frame():
+            return super().handle_cluster_general_request(*args, **kwargs)
+
+    def _update_attribute(self, attrid, value):
+        super()._update_attribute(attrid, value)
+
+        indexes = _derivation_graph(type(self))[1].get(attrid)
+        if indexes is None:
+            return
+
+        self._derivation_values[attrid] = value
+        if _derivation_frame is None:
+            self._dirty_derived.update(indexes)
+            self._derive()
+        else:
+            if not self._dirty_derived:
+                _derivation_frame.append(self)
+            self._dirty_derived.update(indexes)
+
+    def _derive(self) -> None:
+        """Evaluate the derived attributes marked since the last evaluation."""
+        order, dependents = _derivation_graph(type(self))
+        dirty, self._dirty_derived = self._dirty_derived, set()
+
+        for index, (attrid, inputs, formula) in enumerate(order):
+            if index not in dirty:
+                continue
+
+            values = [
+                self._derivation_values.get(input_id, self._attr_cache.get(input_id))
+                for input_id in inputs
+            ]
+            if any(value is None for value in values):
+                continue
+
+            value = formula(*values)
+            if value is None or value == self._derivation_values.get(attrid):
+                continue
+
+            self._derivation_values[attrid] = value
+            dirty.update(dependents.get(attrid, ()))
+            super()._update_attribute(attrid, value)
@@ -8,7 +8,7 @@ import zigpy.types as t
 from zigpy.zcl import foundation
 from zigpy.zcl.clusters.security import IasZone, ZoneStatus
 
-from zhaquirks import PowerConfigurationCluster
+from zhaquirks import ClusterSubstitutionMixin, PowerConfigurationCluster
 
 FRIENT = "frient A/S"
 DEVELCO = "Develco Products A/S"
@@ -40,28 +40,5 @@ class DevelcoIasZone(CustomCluster, IasZone):
         )
 
 
-class ManufacturerDeviceV2(CustomDeviceV2):
-    """Custom device class used to remap cluster IDs in requests."""
-
-    async def request(
-        self,
-        *args,
-        **kwargs,
-    ):
-        """Remap cluster IDs for clusters that substitute for others."""
-        # this method is always called with kwargs
-        endpoint_id = kwargs["src_ep"]
-        cluster_id = kwargs["cluster"]
-
-        # ignore ZDO and narrow down to manufacturer specific clusters
-        if endpoint_id != 0 and cluster_id >= 0xFC00:
-            cluster = self.endpoints[endpoint_id].in_clusters.get(cluster_id)
-            substitution_cluster = getattr(cluster, "SUBSTITUTION_FOR", None)
-
-            if substitution_cluster:
-                kwargs["cluster"] = t.ClusterId(substitution_cluster)
-
-        return await super().request(
-            *args,
-            **kwargs,
-        )
+class ManufacturerDeviceV2(ClusterSubstitutionMixin, CustomDeviceV2):
+    """Custom device class used to remap cluster IDs in requests and replies."""
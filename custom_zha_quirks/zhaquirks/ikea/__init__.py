@@ -1,7 +1,11 @@
 """Ikea module."""
 
+import asyncio
+import functools
 import logging
+from typing import NamedTuple
 
+import zigpy.exceptions
 from zigpy.quirks import CustomCluster
 import zigpy.types as t
 from zigpy.zcl import foundation
@@ -27,6 +31,12 @@ BATTERY_QUANTITY = PowerConfiguration.attributes_by_name["battery_quantity"].id
 BATTERY_RATED_VOLTAGE = PowerConfiguration.attributes_by_name[
     "battery_rated_voltage"
 ].id
+BATTERY_PERCENTAGE_REMAINING = PowerConfiguration.attributes_by_name[
+    "battery_percentage_remaining"
+].id
+
+# Basic cluster attributes
+SW_BUILD_ID = Basic.attributes_by_name["sw_build_id"].id
 
 
 class ScenesCluster(CustomCluster, Scenes):
@@ -186,80 +196,125 @@ class PowerConfig1CRXCluster(CustomCluster, PowerConfiguration):
 # doubling IKEA power configuration clusters:
 
 
+class FirmwareVersion(NamedTuple):
+    """Major and minor version of an IKEA `sw_build_id`."""
+
+    major: int
+    minor: int
+
+    @property
+    def doubles_battery(self) -> bool:
+        """Whether the firmware reports half the battery percentage remaining."""
+        # new firmware is either 24.4.5 or above, or 2.4.5 or above
+        # old firmware is 2.3.x or below
+        return not (self.major >= 3 or (self.major >= 2 and self.minor >= 4))
+
+
+@functools.lru_cache(maxsize=64)
+def firmware_version(sw_build_id: str) -> FirmwareVersion | None:
+    """Parse an IKEA `sw_build_id`, returning None for an unknown format."""
+    split_fw_version = sw_build_id.split(".")
+    if len(split_fw_version) < 2:
+        return None
+
+    # guard against possible future version formatting which includes more than just numbers
+    try:
+        return FirmwareVersion(int(split_fw_version[0]), int(split_fw_version[1]))
+    except ValueError:
+        _LOGGER.warning("sw_build_id is not a number: %s", sw_build_id)
+        return None
+
+
 class DoublingPowerConfigClusterIKEA(CustomCluster, PowerConfiguration):
     """PowerConfiguration cluster implementation for IKEA devices.
 
     This implementation doubles battery pct remaining for IKEA devices with old firmware.
     """
 
+    # Seconds before reading the firmware version again after a failed read,
+    # doubled after every further failure up to the maximum
+    fw_retry_delay: float = 60
+    fw_retry_max_delay: float = 6 * 60 * 60
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        self._fw_probing = False
+        self._fw_retry_at = 0.0
+        self._fw_retry_delay = self.fw_retry_delay
+        self._pending_battery_pct = None
+        super().__init__(*args, **kwargs)
+
     async def bind(self):
         """Bind cluster and read the sw_build_id for later use."""
         result = await super().bind()
-        await self.endpoint.basic.read_attributes([Basic.AttributeDefs.sw_build_id.id])
+        await self.endpoint.basic.read_attributes([SW_BUILD_ID])
         return result
 
     def _is_firmware_new(self):
         """Check if new firmware is installed that does not require battery doubling."""
         # get sw_build_id from attribute cache if available
-        sw_build_id = self.endpoint.basic.get(Basic.AttributeDefs.sw_build_id.id)
+        sw_build_id = self.endpoint.basic.get(SW_BUILD_ID)
 
-        # sw_build_id is not cached or empty, so we consider it new firmware for now
+        # sw_build_id is not cached, empty or of an unknown format,
+        # so we consider it new firmware
         if not sw_build_id:
             return True
 
-        # split sw_build_id into parts to check for new firmware
-        split_fw_version = sw_build_id.split(".")
-        if len(split_fw_version) >= 2:
-            # guard against possible future version formatting which includes more than just numbers
-            try:
-                first_part = int(split_fw_version[0])
-                second_part = int(split_fw_version[1])
-
-                # new firmware is either 24.4.5 or above, or 2.4.5 or above
-                # old firmware is 2.3.x or below
-                return first_part >= 3 or (first_part >= 2 and second_part >= 4)
-            except ValueError:
-                _LOGGER.warning(
-                    "sw_build_id is not a number: %s for device %s",
-                    sw_build_id,
-                    self.endpoint.device.ieee,
-                )
-                # sw_build_id is not a number, so it must be new firmware
-                return True
+        version = firmware_version(sw_build_id)
+        return version is None or not version.doubles_battery
+
+    def _probe_firmware(self) -> bool:
+        """Read the firmware version unless backing off after a failed read.
 
-        # unknown formatting of sw_build_id, so it must be new firmware
+        Returns whether a read is in flight, at most one is per device.
+        """
+        if self._fw_probing:
+            return True
+
+        if asyncio.get_running_loop().time() < self._fw_retry_at:
+            return False
+
+        self._fw_probing = True
+        self.create_catching_task(self._read_firmware())
         return True
 
-    async def _read_fw_and_update_battery_pct(self, reported_battery_pct):
-        """Read firmware version and update battery percentage remaining if necessary."""
-        # read sw_build_id from device
-        await self.endpoint.basic.read_attributes([Basic.AttributeDefs.sw_build_id.id])
+    async def _read_firmware(self):
+        """Read the firmware version, then report the held battery percentage."""
+        try:
+            await self.endpoint.basic.read_attributes([SW_BUILD_ID])
+        except (zigpy.exceptions.ZigbeeException, TimeoutError) as exc:
+            self.debug("Failed to read sw_build_id: %r", exc)
+        finally:
+            self._fw_probing = False
+
+            if self.endpoint.basic.get(SW_BUILD_ID) is None:
+                self._fw_retry_at = (
+                    asyncio.get_running_loop().time() + self._fw_retry_delay
+                )
+                self._fw_retry_delay = min(
+                    self._fw_retry_delay * 2, self.fw_retry_max_delay
+                )
+            else:
+                self._fw_retry_delay = self.fw_retry_delay
 
-        # check if sw_build_id was read successfully and old firmware is installed
-        # if so, update cache with reported battery percentage (doubled)
-        if not self._is_firmware_new():
-            self._update_attribute(
-                PowerConfiguration.AttributeDefs.battery_percentage_remaining.id,
-                reported_battery_pct * 2,
-            )
+            pending, self._pending_battery_pct = self._pending_battery_pct, None
+            if pending is not None:
+                self._update_attribute(BATTERY_PERCENTAGE_REMAINING, pending)
 
     def _update_attribute(self, attrid, value):
         """Update attribute to double battery percentage if firmware is old.
 
-        If the firmware version is unknown, a background task to read the firmware version is also started,
-        but the percentage is not doubled for now then, as that task happens asynchronously.
+        If the firmware version is unknown, the percentage is held back while the
+        firmware version is read and reported once the read finished. Failed reads are
+        retried on later reports with a growing delay, meanwhile the percentage is
+        reported as is.
         """
-        if attrid == PowerConfiguration.AttributeDefs.battery_percentage_remaining.id:
-            # if sw_build_id is not cached, create task to read from device, since it should be awake now
-            if (
-                self.endpoint.basic.get(Basic.AttributeDefs.sw_build_id.id, None)
-                is None
-            ):
-                self.create_catching_task(self._read_fw_and_update_battery_pct(value))
+        if attrid == BATTERY_PERCENTAGE_REMAINING:
+            if self.endpoint.basic.get(SW_BUILD_ID) is None and self._probe_firmware():
+                self._pending_battery_pct = value
+                return
 
             # double percentage if the firmware is confirmed old
-            # The coroutine above will not have executed yet if the firmware is unknown,
-            # so we don't double for now. The coro doubles the value later if needed.
             if not self._is_firmware_new():
                 value = value * 2
         super()._update_attribute(attrid, value)
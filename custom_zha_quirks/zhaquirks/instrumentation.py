@@ -0,0 +1,289 @@
+"""Opt-in instrumentation of quirk cluster message handling.
+
+Nothing is wrapped until `enable()` is called, so there is no overhead by default.
+Once enabled, the message handling methods of every `zhaquirks` cluster record call
+counts, latency histograms and exceptions per quirk, cluster, method and command:
+
+    from zhaquirks import instrumentation
+
+    instrumentation.enable()
+    ...
+    instrumentation.dump()
+
+Times are inclusive: a handler calling another instrumented handler (e.g. a Tuya
+`handle_get_data` calling `_dp_2_attr_update`) accounts for it in both entries.
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import functools
+import inspect
+import json
+import logging
+import pathlib
+import time
+from collections.abc import Callable
+from typing import Any
+
+from zigpy.quirks import CustomCluster
+
+_LOGGER = logging.getLogger(__name__)
+
+# Methods instrumented when a `zhaquirks` cluster defines them
+INSTRUMENTED_METHODS = (
+    "handle_cluster_request",
+    "_update_attribute",
+    "deserialize",
+    "handle_get_data",
+    "handle_set_data_response",
+    "handle_active_status_report",
+    "_dp_2_attr_update",
+)
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+)
+
+StatsKey = tuple[str, str, str, Any]
+
+
+@dataclasses.dataclass
+class CallStats:
+    """Call statistics of one quirk cluster method and command."""
+
+    count: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    # One more bucket than `LATENCY_BUCKETS` for slower calls
+    histogram: list[int] = dataclasses.field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    exceptions: dict[str, int] = dataclasses.field(default_factory=dict)
+
+    def record(self, elapsed: float, exc: BaseException | None) -> None:
+        """Record one call."""
+        self.count += 1
+        self.total_s += elapsed
+        self.max_s = max(self.max_s, elapsed)
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+        if exc is not None:
+            name = type(exc).__name__
+            self.exceptions[name] = self.exceptions.get(name, 0) + 1
+
+
+_enabled = False
+_stats: dict[StatsKey, CallStats] = {}
+_originals: dict[tuple[type, str], Callable] = {}
+
+
+def is_enabled() -> bool:
+    """Return whether instrumentation is enabled."""
+    return _enabled
+
+
+def _quirk_name(cluster: CustomCluster) -> str:
+    """Return a name identifying the quirk a cluster belongs to."""
+    device = cluster.endpoint.device
+    metadata = getattr(device, "quirk_metadata", None)
+
+    if metadata is not None:
+        return f"{metadata.quirk_file.stem}:{metadata.quirk_file_line}"
+
+    return f"{type(device).__module__}.{type(device).__qualname__}"
+
+
+def _command_key(args: tuple) -> Any:
+    """Return the command, attribute or datapoint a handler was called for."""
+    if not args:
+        return None
+
+    arg = args[0]
+
+    if isinstance(arg, int):
+        return int(arg)
+    elif hasattr(arg, "command_id"):
+        return arg.command_id
+    elif hasattr(arg, "datapoints"):
+        return tuple(record.dp for record in arg.datapoints)
+    elif hasattr(arg, "dp"):
+        return arg.dp
+
+    return None
+
+
+def _instrument(cls: type, name: str) -> None:
+    """Replace a method defined by `cls` with a recording wrapper."""
+    func = vars(cls)[name]
+    cluster_name = f"{cls.__module__}.{cls.__qualname__}"
+
+    def record(self, args: tuple, start: float, exc: BaseException | None) -> None:
+        elapsed = time.perf_counter() - start
+
+        try:
+            key = (_quirk_name(self), cluster_name, name, _command_key(args))
+        except AttributeError:
+            key = (None, cluster_name, name, None)
+
+        stats = _stats.get(key)
+        if stats is None:
+            stats = _stats[key] = CallStats()
+        stats.record(elapsed, exc)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            exc = None
+            start = time.perf_counter()
+
+            try:
+                return await func(self, *args, **kwargs)
+            except BaseException as err:
+                exc = err
+                raise
+            finally:
+                record(self, args, start, exc)
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            exc = None
+            start = time.perf_counter()
+
+            try:
+                return func(self, *args, **kwargs)
+            except BaseException as err:
+                exc = err
+                raise
+            finally:
+                record(self, args, start, exc)
+
+    _originals[(cls, name)] = func
+    setattr(cls, name, wrapper)
+
+
+def _iter_quirk_clusters() -> list[type]:
+    """Return every loaded `zhaquirks` cluster class."""
+    classes = []
+    pending = [CustomCluster]
+    seen = set()
+
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass in seen:
+                continue
+            seen.add(subclass)
+            pending.append(subclass)
+
+            if subclass.__module__.startswith("zhaquirks."):
+                classes.append(subclass)
+
+    return classes
+
+
+def instrument_loaded_clusters() -> int:
+    """Instrument the loaded clusters, returning how many methods were wrapped.
+
+    Called by `enable()` and whenever quirk modules are lazily loaded afterwards.
+    """
+    wrapped = 0
+
+    for cls in _iter_quirk_clusters():
+        names = set(INSTRUMENTED_METHODS)
+        # Tuya datapoint handlers are looked up by name
+        names.update(getattr(cls, "data_point_handlers", {}).values())
+
+        for name in names:
+            # static and class methods are not called with the cluster
+            if (cls, name) in _originals or not inspect.isfunction(vars(cls).get(name)):
+                continue
+
+            _instrument(cls, name)
+            wrapped += 1
+
+    return wrapped
+
+
+def enable() -> None:
+    """Start recording quirk cluster message handling."""
+    global _enabled
+
+    _enabled = True
+    wrapped = instrument_loaded_clusters()
+    _LOGGER.debug("Instrumented %d quirk cluster methods", wrapped)
+
+
+def disable() -> None:
+    """Stop recording and restore the original methods, keeping the statistics."""
+    global _enabled
+
+    _enabled = False
+
+    for (cls, name), func in _originals.items():
+        setattr(cls, name, func)
+
+    _originals.clear()
+
+
+def reset() -> None:
+    """Discard the recorded statistics."""
+    _stats.clear()
+
+
+def snapshot() -> list[dict[str, Any]]:
+    """Return the recorded statistics, most time consuming first."""
+    return [
+        {
+            "quirk": quirk,
+            "cluster": cluster,
+            "method": method,
+            "command": command,
+            "count": stats.count,
+            "total_s": stats.total_s,
+            "mean_s": stats.total_s / stats.count,
+            "max_s": stats.max_s,
+            "histogram": dict(
+                zip([*map(str, LATENCY_BUCKETS), "inf"], stats.histogram)
+            ),
+            "exceptions": dict(stats.exceptions),
+        }
+        for (quirk, cluster, method, command), stats in sorted(
+            _stats.items(), key=lambda item: item[1].total_s, reverse=True
+        )
+    ]
+
+
+def dump(path: str | pathlib.Path | None = None, *, top: int = 20) -> None:
+    """Write a JSON snapshot to `path`, or log the most time consuming entries."""
+    entries = snapshot()
+
+    if path is not None:
+        pathlib.Path(path).write_text(json.dumps(entries, indent=2, default=str))
+        return
+
+    for entry in entries[:top]:
+        _LOGGER.info(
+            "%s %s.%s(%s): %d calls, %.3f ms total, %.3f ms max, exceptions: %s",
+            entry["quirk"],
+            entry["cluster"],
+            entry["method"],
+            entry["command"],
+            entry["count"],
+            entry["total_s"] * 1000,
+            entry["max_s"] * 1000,
+            entry["exceptions"],
+        )
@@ -0,0 +1,100 @@
+"""Multi-press and long press detection for remotes reporting raw button events."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class _PendingPresses:
+    """Short presses of a button counted within the multi-press window."""
+
+    __slots__ = ("callback", "count", "deadline", "handle")
+
+    def __init__(self, callback: Callable[[int], Any], deadline: float) -> None:
+        """Init."""
+        self.callback = callback
+        self.count = 1
+        self.deadline = deadline
+        self.handle: asyncio.TimerHandle | None = None
+
+
+class MultiPressDetector:
+    """Derive multi-press and long press events from button presses and releases.
+
+    Short presses of a button within `multi_press_window` seconds of each other are
+    counted and reported once the window passes. Each counting button holds a single
+    loop timer, which is only re-armed when it fires before the window has passed, so
+    a burst of presses creates neither a task nor a timer per press.
+    """
+
+    def __init__(
+        self, multi_press_window: float = 0.3, long_press_threshold: float = 1.0
+    ) -> None:
+        """Init."""
+        self.multi_press_window = multi_press_window
+        self.long_press_threshold = long_press_threshold
+        self._pending: dict[Hashable, _PendingPresses] = {}
+        # button -> long press timer, None once the long press was reported
+        self._held: dict[Hashable, asyncio.TimerHandle | None] = {}
+
+    def press(self, button: Hashable, callback: Callable[[int], Any]) -> None:
+        """Count a short press, `callback(count)` is called when the window passes."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.multi_press_window
+        pending = self._pending.get(button)
+
+        if pending is None:
+            pending = self._pending[button] = _PendingPresses(callback, deadline)
+            pending.handle = loop.call_at(deadline, self._window_passed, button)
+        else:
+            pending.count += 1
+            pending.deadline = deadline
+            pending.callback = callback
+
+    def _window_passed(self, button: Hashable) -> None:
+        pending = self._pending[button]
+        loop = asyncio.get_running_loop()
+
+        if pending.deadline > loop.time():
+            # pressed again meanwhile
+            pending.handle = loop.call_at(pending.deadline, self._window_passed, button)
+            return
+
+        del self._pending[button]
+        pending.callback(pending.count)
+
+    def down(self, button: Hashable, on_long_press: Callable[[], Any]) -> None:
+        """Start timing a button press, `on_long_press()` is called if it is held."""
+        handle = self._held.get(button)
+        if handle is not None:
+            handle.cancel()
+
+        self._held[button] = asyncio.get_running_loop().call_later(
+            self.long_press_threshold, self._long_press, button, on_long_press
+        )
+
+    def _long_press(self, button: Hashable, on_long_press: Callable[[], Any]) -> None:
+        self._held[button] = None
+        on_long_press()
+
+    def up(self, button: Hashable) -> bool:
+        """Release a button, returning whether it was released before a long press."""
+        handle = self._held.pop(button, None)
+        if handle is None:
+            return False
+
+        handle.cancel()
+        return True
+
+    def cancel(self) -> None:
+        """Drop every pending press without reporting it."""
+        for pending in self._pending.values():
+            pending.handle.cancel()
+        for handle in self._held.values():
+            if handle is not None:
+                handle.cancel()
+
+        self._pending.clear()
+        self._held.clear()
@@ -1,9 +1,7 @@
 """Module for Philips quirks implementations."""
 
-import asyncio
 import itertools
 import logging
-import time
 from typing import Any, Final, Optional, Union
 
 from zigpy.quirks import CustomCluster
@@ -13,6 +11,7 @@ from zigpy.zcl.clusters.general import Basic
 from zigpy.zcl.clusters.measurement import OccupancySensing
 from zigpy.zcl.foundation import BaseCommandDefs, ZCLAttributeDef, ZCLCommandDef
 
+from zhaquirks import MultiPressDetector
 from zhaquirks.const import (
     ARGS,
     BUTTON,
@@ -77,34 +76,6 @@ class PhilipsBasicCluster(CustomCluster, Basic):
         await self.write_attributes(self.attr_config, manufacturer=0x100B)
 
 
-class ButtonPressQueue:
-    """Philips button queue to derive multiple press events."""
-
-    def __init__(self):
-        """Init."""
-        self._ms_threshold = 300
-        self._ms_last_click = 0
-        self._click_counter = 1
-        self._callback = lambda x: None
-        self._task = None
-
-    async def _job(self):
-        await asyncio.sleep(self._ms_threshold / 1000)
-        self._callback(self._click_counter)
-
-    def press(self, callback):
-        """Process a button press."""
-        self._callback = callback
-        now_ms = time.time() * 1000
-        if now_ms - self._ms_last_click > self._ms_threshold:
-            self._click_counter = 1
-        else:
-            self._task.cancel()
-            self._click_counter += 1
-        self._ms_last_click = now_ms
-        self._task = asyncio.ensure_future(self._job())
-
-
 class Button:
     """Represents a remote button, including string literals used in triggers and actions."""
 
@@ -183,10 +154,13 @@ class PhilipsRemoteCluster(CustomCluster):
         PressType(SHORT_RELEASE, COMMAND_M_SHORT_RELEASE),
     ]
 
+    # Seconds between short releases counted as one multi-press
+    multi_press_window: float = 0.3
+
     def __init__(self, endpoint, is_server=True):
-        """Initialize button press queue for each button."""
+        """Initialize the multi-press detection."""
         super().__init__(endpoint, is_server)
-        self.button_press_queue = {k: ButtonPressQueue() for k in self.BUTTONS}
+        self.press_detector = MultiPressDetector(self.multi_press_window)
 
     def handle_cluster_request(
         self,
@@ -306,11 +280,11 @@ class PhilipsRemoteCluster(CustomCluster):
         # Derive Multiple Presses
         if press_type.name == SHORT_RELEASE:
             _LOGGER.debug(
-                "%s - handle_cluster_request handling short release. Push to button press queue for button %s",
+                "%s - handle_cluster_request handling short release. Push to press detector for button %s",
                 self.__class__.__name__,
                 args[0],
             )
-            self.button_press_queue[args[0]].press(send_press_event)
+            self.press_detector.press(args[0], send_press_event)
         else:
             action = f"{button.action}_{press_type.action}"
             self.listener_event(ZHA_SEND_EVENT, action, event_args)
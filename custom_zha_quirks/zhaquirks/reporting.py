@@ -0,0 +1,108 @@
+"""Local reporting configuration for devices ignoring ZCL configure reporting."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+import typing
+from typing import Any
+
+
+class ReportingFilter(typing.NamedTuple):
+    """Local reporting configuration of one attribute."""
+
+    # Seconds between reports, a held back change is reported once they passed
+    min_interval: float = 0
+    # Seconds after which a change within the deadband is reported anyway
+    max_interval: float | None = None
+    # Changes smaller than both deadbands are not reported
+    absolute_change: float = 0
+    relative_change: float = 0
+
+    def is_significant(self, last_value: Any, value: Any) -> bool:
+        """Return whether the change from `last_value` to `value` is to be reported."""
+        if value == last_value:
+            return False
+
+        try:
+            change = abs(value - last_value)
+            deadband = max(self.absolute_change, self.relative_change * abs(last_value))
+        except TypeError:
+            return True
+
+        return change >= deadband
+
+
+class ReportingFilterMixin:
+    """Filter attribute updates like configured reporting, for devices ignoring it.
+
+    `reporting_filters` maps attribute ids to a `ReportingFilter`. A change within
+    the deadband is dropped, or held back until `max_interval` passed if that is set.
+    A change arriving within `min_interval` of the previous report is held back until
+    it passed. Each held back value is replaced by later updates and reported by a
+    loop timer, so the last value is never lost. Updates that were never reported are
+    counted per attribute in `suppressed_updates`.
+
+    Nothing is filtered unless a quirk opts in by setting `reporting_filters`, e.g.
+    to `MEASUREMENT_REPORTING` and `SUMMATION_REPORTING`.
+    """
+
+    # attribute id -> local reporting configuration, nothing is filtered by default
+    reporting_filters: dict[int, ReportingFilter] = {}
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        # attribute id -> monotonic time and value of the last report
+        self._last_reports: dict[int, tuple[float, Any]] = {}
+        # attribute id -> held back value and the timer reporting it
+        self._held_reports: dict[int, tuple[Any, asyncio.TimerHandle]] = {}
+        self.suppressed_updates: collections.Counter[int] = collections.Counter()
+        super().__init__(*args, **kwargs)
+
+    def _update_attribute(self, attrid, value):
+        reporting = self.reporting_filters.get(attrid)
+        if reporting is None:
+            super()._update_attribute(attrid, value)
+            return
+
+        held = self._held_reports.pop(attrid, None)
+        if held is not None:
+            held[1].cancel()
+            self.suppressed_updates[attrid] += 1
+
+        last = self._last_reports.get(attrid)
+        now = time.monotonic()
+
+        if last is not None and value is not None:
+            last_time, last_value = last
+            if reporting.is_significant(last_value, value):
+                due = last_time + reporting.min_interval
+            elif reporting.max_interval is not None:
+                due = last_time + reporting.max_interval
+            else:
+                self.suppressed_updates[attrid] += 1
+                return
+
+            if due > now:
+                handle = asyncio.get_running_loop().call_later(
+                    due - now, self._report_held, attrid
+                )
+                self._held_reports[attrid] = (value, handle)
+                return
+
+        self._last_reports[attrid] = (now, value)
+        super()._update_attribute(attrid, value)
+
+    def _report_held(self, attrid: int) -> None:
+        value, _ = self._held_reports.pop(attrid)
+        self._last_reports[attrid] = (time.monotonic(), value)
+        super()._update_attribute(attrid, value)
+
+
+# Opt-in reporting of instantaneous measurements (power, voltage, current, ...)
+MEASUREMENT_REPORTING = ReportingFilter(
+    min_interval=10, max_interval=300, relative_change=0.02
+)
+# Reporting of energy summations, which only ever grow
+SUMMATION_REPORTING = ReportingFilter(min_interval=60)
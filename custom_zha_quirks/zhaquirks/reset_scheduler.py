@@ -0,0 +1,213 @@
+"""Shared coarse-grained timer for self resetting quirk clusters."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import math
+import typing
+import weakref
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import zigpy.device
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResetScheduler:
+    """Shared coarse-grained timer for self resetting clusters.
+
+    Reset deadlines are rounded up to `resolution` seconds and grouped into buckets,
+    so the event loop holds one timer for all clusters instead of one per cluster.
+    Resets may fire up to `resolution` seconds late, never early.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, resolution: float = 1.0
+    ) -> None:
+        """Init."""
+        self._loop = loop
+        self.resolution = resolution
+        # key -> (callback, group) of every pending reset
+        self._entries: dict[Hashable, tuple[Callable[[], Any], Hashable | None]] = {}
+        self._slots: dict[Hashable, int] = {}
+        self._buckets: dict[int, set[Hashable]] = {}
+        self._groups: dict[Hashable, set[Hashable]] = {}
+        self._ticks: list[int] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_tick: int | None = None
+        self._applications: weakref.WeakSet = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        """Return the number of pending resets."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a reset is pending for `key`."""
+        return key in self._entries
+
+    def schedule(
+        self,
+        key: Hashable,
+        delay: float,
+        callback: Callable[[], Any],
+        *,
+        group: Hashable | None = None,
+    ) -> None:
+        """Call `callback` after `delay` seconds, replacing a pending reset."""
+        tick = math.ceil((self._loop.time() + delay) / self.resolution)
+        slot = self._slots.get(key)
+
+        if slot == tick:
+            return
+
+        if slot is None:
+            self._entries[key] = (callback, group)
+            if group is not None:
+                self._groups.setdefault(group, set()).add(key)
+        else:
+            self._remove_from_bucket(key, slot)
+            if self._entries[key][0] != callback:
+                self._entries[key] = (callback, group)
+
+        self._slots[key] = tick
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = set()
+            heapq.heappush(self._ticks, tick)
+        bucket.add(key)
+
+        if self._timer_tick is None or tick < self._timer_tick:
+            self._arm()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the pending reset of `key`, returning whether there was one."""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+
+        self._remove_from_bucket(key, slot)
+        _callback, group = self._entries.pop(key)
+        if group is not None:
+            keys = self._groups[group]
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+
+        return True
+
+    def cancel_group(self, group: Hashable) -> int:
+        """Cancel every pending reset of `group`, returning how many were pending."""
+        keys = self._groups.pop(group, set())
+        for key in keys:
+            self._remove_from_bucket(key, self._slots.pop(key))
+            del self._entries[key]
+
+        return len(keys)
+
+    def pending(self) -> dict[Hashable, float]:
+        """Return the seconds left until each pending reset."""
+        now = self._loop.time()
+        return {
+            key: max(0.0, tick * self.resolution - now)
+            for key, tick in self._slots.items()
+        }
+
+    def watch_application(self, application: typing.Any) -> None:
+        """Cancel the resets of devices removed from `application`."""
+        if application not in self._applications:
+            self._applications.add(application)
+            application.add_listener(self)
+
+    def device_removed(self, device: zigpy.device.Device) -> None:
+        """Cancel the resets of a removed device."""
+        self.cancel_group(device.ieee)
+
+    def _remove_from_bucket(self, key: Hashable, slot: int) -> None:
+        """Remove `key` from its bucket, leaving the stale tick in the heap."""
+        bucket = self._buckets[slot]
+        bucket.discard(key)
+        if not bucket:
+            del self._buckets[slot]
+
+    def _arm(self) -> None:
+        """Schedule the loop timer for the earliest non-empty bucket."""
+        while self._ticks and self._ticks[0] not in self._buckets:
+            heapq.heappop(self._ticks)
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_tick = None
+
+        if self._ticks:
+            self._timer_tick = self._ticks[0]
+            self._timer = self._loop.call_at(
+                self._timer_tick * self.resolution, self._on_timer
+            )
+
+    def _on_timer(self) -> None:
+        """Run every reset whose bucket is due."""
+        due = self._timer_tick
+        self._timer = None
+        self._timer_tick = None
+        callbacks = []
+
+        while self._ticks and self._ticks[0] <= due:
+            for key in self._buckets.pop(heapq.heappop(self._ticks), ()):
+                del self._slots[key]
+                callback, group = self._entries.pop(key)
+                if group is not None:
+                    keys = self._groups[group]
+                    keys.discard(key)
+                    if not keys:
+                        del self._groups[group]
+                callbacks.append(callback)
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                _LOGGER.exception("Error calling reset callback %s", callback)
+
+        if self._timer is None:
+            self._arm()
+
+
+_RESET_SCHEDULERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, ResetScheduler
+] = weakref.WeakKeyDictionary()
+
+
+def get_reset_scheduler() -> ResetScheduler:
+    """Return the reset scheduler of the running event loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _RESET_SCHEDULERS.get(loop)
+    if scheduler is None:
+        scheduler = _RESET_SCHEDULERS[loop] = ResetScheduler(loop)
+    return scheduler
+
+
+class ResetTimerMixin:
+    """Mixin scheduling `_turn_off` on the shared reset scheduler."""
+
+    reset_s: int = 30
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._loop = asyncio.get_running_loop()
+        self._reset_scheduler = get_reset_scheduler()
+        self._reset_scheduler.watch_application(self.endpoint.device.application)
+
+    def _schedule_reset(self) -> None:
+        """Call `_turn_off` after `reset_s` seconds, postponing any pending reset."""
+        self._reset_scheduler.schedule(
+            self, self.reset_s, self._turn_off, group=self.endpoint.device.ieee
+        )
+
+    def _cancel_reset(self) -> bool:
+        """Cancel the pending reset, returning whether there was one."""
+        return self._reset_scheduler.cancel(self)
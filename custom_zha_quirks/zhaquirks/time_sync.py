@@ -0,0 +1,172 @@
+"""Shared time service for devices asking for, or having to be fed, the time."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import random
+import time
+import typing
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import zigpy.device
+import zigpy.types as t
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TimeSync:
+    """Shared clock for devices asking for, or having to be fed, the time.
+
+    Timestamps and payloads are computed at most once per second and shared by every
+    reply. Replies are sent after a random delay of up to `reply_jitter` seconds with
+    at most `max_in_flight` of them awaiting the radio, so a mesh of devices asking
+    for the time at once after a power cut doesn't flood the network. Devices that
+    never ask for the time can be resynced periodically instead.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        reply_jitter: float = 2.0,
+        max_in_flight: int = 4,
+    ) -> None:
+        """Init."""
+        self._loop = loop
+        self.reply_jitter = reply_jitter
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._second: int | None = None
+        self._cache: dict[Hashable, Any] = {}
+        # device ieee -> timer of the pending reply
+        self._replies: dict[t.EUI64, asyncio.TimerHandle] = {}
+        # device ieee -> timer of the next periodic resync
+        self._resyncs: dict[t.EUI64, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._applications: weakref.WeakSet = weakref.WeakSet()
+
+    def cached(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return `build()`, calling it at most once per second for each key."""
+        second = int(time.time())
+        if second != self._second:
+            self._second = second
+            self._cache.clear()
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+
+    def seconds_since(self, epoch: datetime.datetime) -> int:
+        """Return the seconds elapsed since `epoch`, in local time if it is naive."""
+        return self.cached(epoch, lambda: self._seconds_since(epoch))
+
+    def _seconds_since(self, epoch: datetime.datetime) -> int:
+        if epoch.tzinfo is None:
+            now = datetime.datetime.fromtimestamp(self._second)
+        else:
+            now = datetime.datetime.fromtimestamp(self._second, datetime.UTC)
+        return int((now - epoch).total_seconds())
+
+    def reply(
+        self,
+        device: zigpy.device.Device,
+        send: Callable[[], Awaitable[Any] | None],
+    ) -> None:
+        """Call `send()` after a random delay, replacing a reply pending for `device`.
+
+        `send` is only called once the delay passed, so it should compute the time.
+        """
+        self.watch_application(device.application)
+        handle = self._replies.pop(device.ieee, None)
+        if handle is not None:
+            handle.cancel()
+
+        self._replies[device.ieee] = self._loop.call_later(
+            random.uniform(0, self.reply_jitter), self._reply, device.ieee, send
+        )
+
+    def _reply(self, ieee: t.EUI64, send: Callable[[], Awaitable[Any] | None]) -> None:
+        del self._replies[ieee]
+        self._send(send)
+
+    def schedule_resync(
+        self,
+        device: zigpy.device.Device,
+        sync: Callable[[], Awaitable[Any] | None],
+        interval: float,
+    ) -> None:
+        """Call `sync()` every `interval` seconds until the device is removed.
+
+        The first call is at a random point of the first interval, so devices set up
+        together are not resynced together.
+        """
+        self.watch_application(device.application)
+        self.cancel_resync(device.ieee)
+        self._resyncs[device.ieee] = self._loop.call_later(
+            random.uniform(0, interval), self._resync, device.ieee, sync, interval
+        )
+
+    def cancel_resync(self, ieee: t.EUI64) -> bool:
+        """Cancel the periodic resync of a device, returning whether there was one."""
+        handle = self._resyncs.pop(ieee, None)
+        if handle is None:
+            return False
+
+        handle.cancel()
+        return True
+
+    def _resync(
+        self,
+        ieee: t.EUI64,
+        sync: Callable[[], Awaitable[Any] | None],
+        interval: float,
+    ) -> None:
+        self._resyncs[ieee] = self._loop.call_later(
+            interval, self._resync, ieee, sync, interval
+        )
+        self._send(sync)
+
+    def watch_application(self, application: typing.Any) -> None:
+        """Stop the replies and resyncs of devices removed from `application`."""
+        if application not in self._applications:
+            self._applications.add(application)
+            application.add_listener(self)
+
+    def device_removed(self, device: zigpy.device.Device) -> None:
+        """Stop the reply and resync of a removed device."""
+        self.cancel_resync(device.ieee)
+        handle = self._replies.pop(device.ieee, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _send(self, send: Callable[[], Awaitable[Any] | None]) -> None:
+        task = self._loop.create_task(self._send_bounded(send))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_bounded(self, send: Callable[[], Awaitable[Any] | None]) -> None:
+        async with self._semaphore:
+            try:
+                result = send()
+                if result is not None:
+                    await result
+            except Exception:
+                _LOGGER.debug("Failed to send the time with %s", send, exc_info=True)
+
+
+_TIME_SYNCS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TimeSync] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_time_sync() -> TimeSync:
+    """Return the time sync service of the running event loop."""
+    loop = asyncio.get_running_loop()
+    time_sync = _TIME_SYNCS.get(loop)
+    if time_sync is None:
+        time_sync = _TIME_SYNCS[loop] = TimeSync(loop)
+    return time_sync
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
 import dataclasses
 import datetime
 import enum
+import heapq
+import itertools
 import logging
-from typing import Any, Final
+from typing import Any, Final, NamedTuple
 
+import zigpy.exceptions
 from zigpy.quirks import BaseCustomDevice, CustomCluster, CustomDevice
 import zigpy.types as t
 from zigpy.typing import AddressingMode
@@ -20,7 +24,13 @@ from zigpy.zcl.clusters.hvac import Thermostat, UserInterface
 from zigpy.zcl.clusters.smartenergy import Metering
 from zigpy.zcl.foundation import BaseCommandDefs, ZCLAttributeDef
 
-from zhaquirks import Bus, EventableCluster, LocalDataCluster
+from zhaquirks import (
+    Bus,
+    EventableCluster,
+    LocalDataCluster,
+    derivation_frame,
+    get_time_sync,
+)
 from zhaquirks.const import (
     DOUBLE_PRESS,
     LEFT,
@@ -106,6 +116,7 @@ WINDOW_COVER_COMMAND_CUSTOM = 0x0006
 # TUYA Cover Custom Values
 # ---------------------------------------------------------
 COVER_EVENT = "cover_event"
+COVER_TARGET_EVENT = "cover_target_event"
 ATTR_COVER_POSITION = 0x0008
 ATTR_COVER_DIRECTION = 0x8001
 ATTR_COVER_INVERTED = 0x8002
@@ -134,6 +145,9 @@ TUYA_CMD_BASE = 0x0100
 _LOGGER = logging.getLogger(__name__)
 
 
+_UINT8_VALUES = tuple(t.uint8_t(value) for value in range(256))
+
+
 class TuyaTimePayload(t.LVList, item_type=t.uint8_t, length_type=t.uint16_t_be):
     """Tuya set time payload definition."""
 
@@ -156,6 +170,9 @@ class TuyaData:
     function: t.uint8_t
     raw: t.LVBytes
 
+    # (dp_type, raw, payload) of the last decoded payload
+    _cached_payload: tuple[TuyaDPType, bytes, Any] | None = None
+
     def __init__(
         self,
         value: TuyaDPType | None = None,
@@ -197,7 +214,17 @@ class TuyaData:
         | t.bitmap32
         | t.LVBytes
     ):
-        """Payload accordingly to data point type."""
+        """Payload accordingly to data point type, decoded once per raw value."""
+        cached = self._cached_payload
+        if cached is not None and cached[0] is self.dp_type and cached[1] is self.raw:
+            return cached[2]
+
+        payload = self._decode_payload()
+        self._cached_payload = (self.dp_type, self.raw, payload)
+        return payload
+
+    def _decode_payload(self):
+        """Decode the raw payload accordingly to data point type."""
         if self.dp_type == TuyaDPType.VALUE:
             return t.int32s_be.deserialize(self.raw)[0]
         elif self.dp_type == TuyaDPType.BOOL:
@@ -249,16 +276,14 @@ class TuyaData:
     @classmethod
     def deserialize(cls, data: bytes) -> tuple[TuyaData, bytes]:
         """Deserialize Tuya data."""
-        dp_type, data = TuyaDPType.deserialize(data)
-        function, data = t.uint8_t.deserialize(data)
-        raw, data = t.LVBytes.deserialize(data)
+        if len(data) < 3 or len(data) < 3 + data[2]:
+            raise ValueError(f"Data is too short to contain {cls}: {data!r}")
 
-        instance = cls()
-        instance.dp_type = dp_type
-        instance.function = function
-        instance.raw = raw
+        end = 3 + data[2]
+        instance = cls(function=_UINT8_VALUES[data[1]], raw=t.LVBytes(data[3:end]))
+        instance.dp_type = TuyaDPType(data[0])
 
-        return instance, data
+        return instance, data[end:]
 
 
 class Data(t.List, item_type=t.uint8_t):
@@ -304,6 +329,62 @@ class Data(t.List, item_type=t.uint8_t):
         return b"".join([self._item_type(i).serialize() for i in self[:]])
 
 
+def _as_data(value: Any) -> Data:
+    """Convert a value to the `Data` payload of a set_data command."""
+    return value if isinstance(value, Data) else Data(value)
+
+
+class TuyaScheduleSlot(NamedTuple):
+    """Switch point of a Tuya thermostatic valve schedule."""
+
+    hour: int
+    minute: int
+    temperature: int  # centidegrees
+
+
+class TuyaSchedule(t.FixedList, item_type=t.uint8_t, length=18):
+    """Tuya thermostatic valve schedule of six (hour, minute, degrees) switch points.
+
+    Like other values converted from `Data`, the bytes are kept in reverse order of
+    the wire layout, so the first switch point is stored at the end.
+    """
+
+    # Top bits of the hour are flags, e.g. the current schedule indicator
+    HOUR_MASK = 0x3F
+
+    @classmethod
+    def from_slots(cls, slots: list[TuyaScheduleSlot]) -> TuyaSchedule:
+        """Encode switch points, first one first."""
+        data = []
+        for hour, minute, temperature in reversed(slots):
+            data += (round(temperature / 100), minute, hour)
+        return cls(data)
+
+    @property
+    def slots(self) -> tuple[TuyaScheduleSlot, ...]:
+        """Decode the switch points, first one first."""
+        return tuple(
+            TuyaScheduleSlot(
+                self[index] & self.HOUR_MASK, self[index - 1], self[index - 2] * 100
+            )
+            for index in range(len(self) - 1, 1, -3)
+        )
+
+    def changed_slots(
+        self, other: TuyaSchedule | None
+    ) -> list[tuple[int, TuyaScheduleSlot]]:
+        """Return the (index, slot) pairs differing from another schedule."""
+        slots = self.slots
+        if other is None:
+            return list(enumerate(slots))
+
+        return [
+            (index, slot)
+            for index, (slot, old) in enumerate(zip(slots, other.slots))
+            if slot != old
+        ]
+
+
 class TuyaDatapointData(t.Struct):
     """Tuya Datapoint and Data."""
 
@@ -318,6 +399,43 @@ class TuyaCommand(t.Struct):
     tsn: t.uint8_t
     datapoints: t.List[TuyaDatapointData]
 
+    @classmethod
+    def deserialize(cls, data: bytes) -> tuple[TuyaCommand, bytes]:
+        """Deserialize all datapoints of a Tuya frame in a single pass.
+
+        Equivalent to the generic struct deserialization, but skips the per field
+        type conversions as the wire format already fixes every field type.
+        """
+        if len(data) < 2:
+            raise ValueError(f"Data is too short to contain {cls}: {data!r}")
+
+        datapoints = cls.fields.datapoints.type()
+        offset = 2
+        size = len(data)
+
+        while offset < size:
+            if size - offset < 4 or size - offset < 4 + data[offset + 3]:
+                raise ValueError(f"Data is too short to contain {TuyaDatapointData}")
+
+            end = offset + 4 + data[offset + 3]
+            tuya_data = TuyaData(function=_UINT8_VALUES[data[offset + 2]])
+            tuya_data.dp_type = TuyaDPType(data[offset + 1])
+            tuya_data.raw = t.LVBytes(data[offset + 4 : end])
+
+            datapoint = object.__new__(TuyaDatapointData)
+            datapoint.dp = _UINT8_VALUES[data[offset]]
+            datapoint.data = tuya_data
+            datapoints.append(datapoint)
+
+            offset = end
+
+        command = object.__new__(cls._real_cls())
+        command.status = _UINT8_VALUES[data[0]]
+        command.tsn = _UINT8_VALUES[data[1]]
+        command.datapoints = datapoints
+
+        return command, b""
+
 
 class Command(t.Struct):
     """Tuya manufacturer cluster command."""
@@ -360,6 +478,24 @@ class NoManufacturerCluster(CustomCluster):
         )
 
 
+def tuya_time_payload(
+    set_time_offset: datetime.datetime, set_time_local_offset: datetime.datetime
+) -> TuyaTimePayload:
+    """Return the set_time payload for the epochs, built at most once per second."""
+    time_sync = get_time_sync()
+
+    def build() -> TuyaTimePayload:
+        payload = TuyaTimePayload()
+        for epoch in (set_time_offset, set_time_local_offset):
+            timestamp = time_sync.seconds_since(epoch)
+            payload.extend(timestamp.to_bytes(4, "big", signed=False))
+        return payload
+
+    return time_sync.cached(
+        (TUYA_SET_TIME, set_time_offset, set_time_local_offset), build
+    )
+
+
 class TuyaManufCluster(CustomCluster):
     """Tuya manufacturer specific cluster."""
 
@@ -469,19 +605,16 @@ class TuyaManufCluster(CustomCluster):
 
         assert self.set_time_local_offset is not None
 
-        payload = TuyaTimePayload()
-        utc_timestamp = int(
-            (datetime.datetime.now(datetime.UTC) - self.set_time_offset).total_seconds()
-        )
-        local_timestamp = int(
-            (datetime.datetime.now() - self.set_time_local_offset).total_seconds()
-        )
-        payload.extend(utc_timestamp.to_bytes(4, "big", signed=False))
-        payload.extend(local_timestamp.to_bytes(4, "big", signed=False))
+        super_command = super().command
 
-        self.create_catching_task(
-            super().command(TUYA_SET_TIME, payload, expect_reply=False)
-        )
+        def send_time():
+            return super_command(
+                TUYA_SET_TIME,
+                tuya_time_payload(self.set_time_offset, self.set_time_local_offset),
+                expect_reply=False,
+            )
+
+        get_time_sync().reply(self.endpoint.device, send_time)
 
 
 class TuyaManufClusterAttributes(TuyaManufCluster):
@@ -534,19 +667,42 @@ class TuyaManufClusterAttributes(TuyaManufCluster):
             attributes, allow_cache=True, only_cache=True, manufacturer=manufacturer
         )
 
-    async def write_attributes(self, attributes, manufacturer=None):
-        """Defer attributes writing to the set_data tuya command."""
+    # Send all records of a write in a single set_data frame. Only for devices known
+    # to accept several datapoints per frame.
+    pack_set_data: bool = False
+    # Records of a write in flight at once when they are not packed. Only raise it
+    # for devices known to cope with concurrent set_data frames.
+    max_concurrent_set_data: int = 1
+
+    def _set_data_payload(self, records: list[foundation.Attribute]) -> Command:
+        """Build a set_data payload carrying the datapoints of the records."""
+        cmd_payload = TuyaManufCluster.Command()
+        cmd_payload.status = 0
+        cmd_payload.tsn = self.endpoint.device.application.get_sequence()
+        cmd_payload.command_id = records[0].attrid
+        cmd_payload.function = 0
+        cmd_payload.data = records[0].value.value
+
+        if len(records) > 1:
+            # further datapoints follow the first one with the same header layout
+            data = Data(_as_data(records[0].value.value)[:])
+            for record in records[1:]:
+                data.extend(
+                    t.uint16_t(record.attrid).serialize()
+                    + b"\x00"
+                    + _as_data(record.value.value).serialize()
+                )
+            cmd_payload.data = data
 
-        records = self._write_attr_records(attributes)
+        return cmd_payload
 
-        for record in records:
-            cmd_payload = TuyaManufCluster.Command()
-            cmd_payload.status = 0
-            cmd_payload.tsn = self.endpoint.device.application.get_sequence()
-            cmd_payload.command_id = record.attrid
-            cmd_payload.function = 0
-            cmd_payload.data = record.value.value
+    async def _send_set_data(
+        self, records: list[foundation.Attribute], manufacturer: int | None
+    ) -> foundation.Status:
+        """Send the records in one set_data command, returning its status."""
+        cmd_payload = self._set_data_payload(records)
 
+        try:
             await super().command(
                 TUYA_SET_DATA,
                 cmd_payload,
@@ -554,6 +710,40 @@ class TuyaManufClusterAttributes(TuyaManufCluster):
                 expect_reply=False,
                 tsn=cmd_payload.tsn,
             )
+        except (zigpy.exceptions.ZigbeeException, TimeoutError) as exc:
+            self.debug(
+                "Failed to write attributes %s: %r",
+                [record.attrid for record in records],
+                exc,
+            )
+            return foundation.Status.FAILURE
+
+        return foundation.Status.SUCCESS
+
+    async def write_attributes(self, attributes, manufacturer=None):
+        """Defer attributes writing to the set_data tuya command."""
+
+        records = self._write_attr_records(attributes)
+
+        if self.pack_set_data and len(records) > 1:
+            status = await self._send_set_data(records, manufacturer)
+            statuses = [status] * len(records)
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrent_set_data)
+
+            async def send(record: foundation.Attribute) -> foundation.Status:
+                async with semaphore:
+                    return await self._send_set_data([record], manufacturer)
+
+            statuses = await asyncio.gather(*(send(record) for record in records))
+
+        failed = [
+            foundation.WriteAttributesStatusRecord(status, record.attrid)
+            for record, status in zip(records, statuses)
+            if status != foundation.Status.SUCCESS
+        ]
+        if failed:
+            return [failed]
 
         return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
 
@@ -705,6 +895,45 @@ class TuyaDimmerSwitch(TuyaSwitch):
         super().__init__(*args, **kwargs)
 
 
+def _mapped_write_result(
+    manufacturer_cluster: CustomCluster,
+    records: list[foundation.Attribute],
+    mapped_attrs: list[dict],
+    result: list | None,
+) -> list:
+    """Report the records whose mapped manufacturer attributes failed to write."""
+    failed_ids = {
+        status_record.attrid
+        for status_record in (result[0] if result else [])
+        if status_record.status != foundation.Status.SUCCESS
+    }
+    if not failed_ids:
+        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+
+    failed = []
+    for record, new_attrs in zip(records, mapped_attrs):
+        for attr in new_attrs:
+            try:
+                attrid = manufacturer_cluster.find_attribute(attr).id
+            except KeyError:
+                continue
+            if attrid in failed_ids:
+                failed.append(
+                    foundation.WriteAttributesStatusRecord(
+                        foundation.Status.FAILURE, record.attrid
+                    )
+                )
+                break
+
+    return [
+        failed
+        or [
+            foundation.WriteAttributesStatusRecord(foundation.Status.FAILURE, r.attrid)
+            for r in records
+        ]
+    ]
+
+
 class TuyaThermostatCluster(LocalDataCluster, Thermostat):
     """Thermostat cluster for Tuya thermostats."""
 
@@ -713,10 +942,29 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
     class AttributeDefs(Thermostat.AttributeDefs):
         """Cluster attributes."""
 
+    # Setpoint raise/lower commands within this many seconds of each other are
+    # written to the device as one setpoint
+    setpoint_debounce: float = 0.5
+
     def __init__(self, *args, **kwargs):
         """Init."""
         super().__init__(*args, **kwargs)
         self.endpoint.device.thermostat_bus.add_listener(self)
+        # setpoint the raise/lower commands sent so far add up to, until the device
+        # reports the setpoint back
+        self._setpoint_target: int | None = None
+        self._setpoint_burst: asyncio.Future | None = None
+        self._setpoint_timer: asyncio.TimerHandle | None = None
+        self._setpoint_writes = 0
+
+    def _update_attribute(self, attrid, value):
+        super()._update_attribute(attrid, value)
+        if (
+            attrid == Thermostat.AttributeDefs.occupied_heating_setpoint.id
+            and self._setpoint_burst is None
+            and not self._setpoint_writes
+        ):
+            self._setpoint_target = None
 
     def temperature_change(self, attr, value):
         """Local or target temperature change from device."""
@@ -747,6 +995,7 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
             return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
 
         manufacturer_attrs = {}
+        mapped_attrs = []
         for record in records:
             attr_name = self.attributes[record.attrid].name
             new_attrs = self.map_attribute(attr_name, record.value.value)
@@ -764,6 +1013,7 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
             )
 
             manufacturer_attrs.update(new_attrs)
+            mapped_attrs.append(new_attrs)
 
         if not manufacturer_attrs:
             return [
@@ -775,11 +1025,13 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
                 ]
             ]
 
-        await self.endpoint.tuya_manufacturer.write_attributes(
+        result = await self.endpoint.tuya_manufacturer.write_attributes(
             manufacturer_attrs, manufacturer=manufacturer
         )
 
-        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+        return _mapped_write_result(
+            self.endpoint.tuya_manufacturer, records, mapped_attrs, result
+        )
 
     # pylint: disable=W0236
     async def command(
@@ -806,24 +1058,69 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
                 foundation.GeneralCommand.Default_Response
             ].schema(command_id=command_id, status=foundation.Status.INVALID_VALUE)
 
-        attrid = self.attributes_by_name["occupied_heating_setpoint"].id
-
-        success, _ = await self.read_attributes((attrid,), manufacturer=manufacturer)
-        try:
-            current = success[attrid]
-        except KeyError:
-            return foundation.GENERAL_COMMANDS[
-                foundation.GeneralCommand.Default_Response
-            ].schema(command_id=command_id, status=foundation.Status.FAILURE)
+        if self._setpoint_target is None:
+            attrid = self.attributes_by_name["occupied_heating_setpoint"].id
+            try:
+                self._setpoint_target = self._attr_cache[attrid]
+            except KeyError:
+                return foundation.GENERAL_COMMANDS[
+                    foundation.GeneralCommand.Default_Response
+                ].schema(command_id=command_id, status=foundation.Status.FAILURE)
 
         # offset is given in decidegrees, see Zigbee cluster specification
-        (res,) = await self.write_attributes(
-            {"occupied_heating_setpoint": current + offset * 10},
-            manufacturer=manufacturer,
+        self._setpoint_target = self._clamp_setpoint(
+            self._setpoint_target + offset * 10
         )
+
+        loop = asyncio.get_running_loop()
+        if self._setpoint_burst is None:
+            self._setpoint_burst = loop.create_future()
+        if self._setpoint_timer is not None:
+            self._setpoint_timer.cancel()
+        self._setpoint_timer = loop.call_later(
+            self.setpoint_debounce, self._flush_setpoint, manufacturer
+        )
+
+        status = await asyncio.shield(self._setpoint_burst)
         return foundation.GENERAL_COMMANDS[
             foundation.GeneralCommand.Default_Response
-        ].schema(command_id=command_id, status=res[0].status)
+        ].schema(command_id=command_id, status=status)
+
+    def _clamp_setpoint(self, setpoint: int) -> int:
+        """Limit a setpoint to the heating setpoint limits, if known."""
+        low = self._attr_cache.get(
+            Thermostat.AttributeDefs.min_heat_setpoint_limit.id, setpoint
+        )
+        high = self._attr_cache.get(
+            Thermostat.AttributeDefs.max_heat_setpoint_limit.id, setpoint
+        )
+        return min(max(setpoint, low), high)
+
+    def _flush_setpoint(self, manufacturer: int | None) -> None:
+        """Write the setpoint of a burst of raise/lower commands."""
+        burst, self._setpoint_burst = self._setpoint_burst, None
+        self._setpoint_timer = None
+        self._setpoint_writes += 1
+        self.create_catching_task(
+            self._write_setpoint(burst, self._setpoint_target, manufacturer)
+        )
+
+    async def _write_setpoint(
+        self, burst: asyncio.Future, setpoint: int, manufacturer: int | None
+    ) -> None:
+        status = foundation.Status.FAILURE
+        try:
+            (res,) = await self.write_attributes(
+                {"occupied_heating_setpoint": setpoint}, manufacturer=manufacturer
+            )
+            status = res[0].status
+        finally:
+            self._setpoint_writes -= 1
+            if status != foundation.Status.SUCCESS and self._setpoint_burst is None:
+                # fall back to the setpoint last reported by the device
+                self._setpoint_target = None
+            if not burst.done():
+                burst.set_result(status)
 
 
 class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
@@ -856,6 +1153,7 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
         records = self._write_attr_records(attributes)
 
         manufacturer_attrs = {}
+        mapped_attrs = []
         for record in records:
             if record.attrid == self.attributes_by_name["keypad_lockout"].id:
                 lock = 0 if record.value.value == self.KeypadLockout.No_lockout else 1
@@ -877,6 +1175,7 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
                 )
 
             manufacturer_attrs.update(new_attrs)
+            mapped_attrs.append(new_attrs)
 
         if not manufacturer_attrs:
             return [
@@ -888,11 +1187,13 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
                 ]
             ]
 
-        await self.endpoint.tuya_manufacturer.write_attributes(
+        result = await self.endpoint.tuya_manufacturer.write_attributes(
             manufacturer_attrs, manufacturer=manufacturer
         )
 
-        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+        return _mapped_write_result(
+            self.endpoint.tuya_manufacturer, records, mapped_attrs, result
+        )
 
 
 class TuyaLocalCluster(LocalDataCluster):
@@ -1182,6 +1483,154 @@ class TuyaZB1888Cluster(CustomCluster):
 
 
 # Tuya Window Cover Implementation
+class TuyaCoverMotion:
+    """Estimate the lift percentage of a moving cover from its full travel time.
+
+    While the cover moves the estimate is published at most every `update_interval`
+    seconds, short of the target, and positions reported by the device replace it.
+    Unless configured, the full travel time is learned from movements between both
+    ends.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[int], None],
+        travel_time: float | None = None,
+        update_interval: float = 1.0,
+    ) -> None:
+        """Init."""
+        self._publish = publish
+        self.travel_time = travel_time
+        self.update_interval = update_interval
+        self._learn = travel_time is None
+        self.position: float | None = None
+        # whether the position was reported by the device rather than estimated
+        self._reported = False
+        self._reported_position: int | None = None
+        self.target: int | None = None
+        self._start_time = 0.0
+        self._start_position: float | None = None
+        self._timer_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def can_estimate(self) -> bool:
+        """Return whether positions can be estimated while moving."""
+        return self.travel_time is not None and self.position is not None
+
+    def is_at(self, position: int) -> bool:
+        """Return whether the device reported resting at a position."""
+        return self.target is None and self._reported and self.position == position
+
+    def estimate(self) -> float | None:
+        """Return the estimated current position."""
+        if self.target is None or not self.can_estimate:
+            return self.position
+
+        elapsed = asyncio.get_running_loop().time() - self._start_time
+        travelled = elapsed / self.travel_time * 100
+        if self.target >= self._start_position:
+            return min(self._start_position + travelled, self.target)
+        return max(self._start_position - travelled, self.target)
+
+    def start(self, target: int) -> None:
+        """Start moving towards a target position."""
+        estimate = self.estimate()
+        if estimate != self.position:
+            self.position = estimate
+            self._reported = False
+        self._cancel_timer()
+        self.target = target
+        self._start_time = asyncio.get_running_loop().time()
+        self._start_position = self.position
+        if self.can_estimate and self.position != target:
+            self._schedule_tick()
+
+    def stop(self) -> None:
+        """Stop moving, publishing the estimated position."""
+        if self.target is None:
+            return
+        self.position = self.estimate()
+        self._reported = False
+        self._finish()
+        if self.position is not None:
+            self._publish(round(self.position))
+
+    def abort(self) -> None:
+        """Stop moving without the device having moved, back to its last position."""
+        if self.target is None:
+            return
+        self._finish()
+        if self._reported_position is not None:
+            self.position = self._reported_position
+            self._reported = True
+        else:
+            self.position = self._start_position
+        if self.position is not None:
+            self._publish(round(self.position))
+
+    async def move(self, target: int, send: Awaitable[Any]) -> Any:
+        """Start moving towards a target while the command doing so is sent."""
+        self.start(target)
+        try:
+            result = await send
+        except Exception:
+            self.abort()
+            raise
+
+        status = getattr(result, "status", None)
+        if status is not None and status != foundation.Status.SUCCESS:
+            self.abort()
+        return result
+
+    def report(self, position: int) -> None:
+        """Snap to a position reported by the device."""
+        self._reported_position = position
+        if self.target is not None and position == self.target:
+            elapsed = asyncio.get_running_loop().time() - self._start_time
+            if self._learn and {self._start_position, position} == {0, 100}:
+                self.travel_time = (
+                    elapsed
+                    if self.travel_time is None
+                    else (self.travel_time + elapsed) / 2
+                )
+            self.position = position
+            self._reported = True
+            self._finish()
+            return
+
+        self.position = position
+        self._reported = True
+        if self.target is not None:
+            # still on the way, estimate from the reported position onwards
+            self._start_time = asyncio.get_running_loop().time()
+            self._start_position = position
+
+    def _finish(self) -> None:
+        self.target = None
+        self._cancel_timer()
+
+    def _cancel_timer(self) -> None:
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+    def _schedule_tick(self) -> None:
+        self._timer_handle = asyncio.get_running_loop().call_later(
+            self.update_interval, self._tick
+        )
+
+    def _tick(self) -> None:
+        self._timer_handle = None
+        position = self.estimate()
+        # the device reports the final position once it arrives
+        if round(position) == self.target:
+            return
+        self._publish(round(position))
+        remaining = abs(self.target - position) / 100 * self.travel_time
+        if remaining > self.update_interval:
+            self._schedule_tick()
+
+
 class TuyaManufacturerWindowCover(TuyaManufCluster):
     """Manufacturer Specific Cluster for cover device."""
 
@@ -1208,16 +1657,19 @@ class TuyaManufacturerWindowCover(TuyaManufCluster):
                 tuya_payload.data,
             )
 
-            ids = [
-                TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE,
-                TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL,
-            ]
-            if tuya_payload.command_id in ids:
+            if tuya_payload.command_id == TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE:
                 self.endpoint.device.cover_bus.listener_event(
                     COVER_EVENT,
                     ATTR_COVER_POSITION,
                     tuya_payload.data[4],
                 )
+            elif (
+                tuya_payload.command_id
+                == TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL
+            ):
+                self.endpoint.device.cover_bus.listener_event(
+                    COVER_TARGET_EVENT, tuya_payload.data[4]
+                )
             elif (
                 tuya_payload.command_id
                 == TUYA_DP_TYPE_ENUM + TUYA_DP_ID_DIRECTION_CHANGE
@@ -1257,21 +1709,36 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
         motor_direction: Final = ZCLAttributeDef(id=ATTR_COVER_DIRECTION, type=t.Bool)
         cover_inverted: Final = ZCLAttributeDef(id=ATTR_COVER_INVERTED, type=t.Bool)
 
+    # Seconds the cover takes to fully open or close, learned when None
+    cover_travel_time: float | None = None
+    # Minimum seconds between two estimated positions while the cover moves
+    cover_update_interval: float = 1.0
+
     def __init__(self, *args, **kwargs):
         """Initialize instance."""
         super().__init__(*args, **kwargs)
         self.endpoint.device.cover_bus.add_listener(self)
+        self.motion = TuyaCoverMotion(
+            lambda position: self._update_attribute(ATTR_COVER_POSITION, position),
+            self.cover_travel_time,
+            self.cover_update_interval,
+        )
+
+    def _lift_percentage(self, value: int) -> int:
+        """Convert between Tuya and lift percentage positions."""
+        invert_attr = self._attr_cache.get(ATTR_COVER_INVERTED) == 1
+        invert = (
+            not invert_attr
+            if self.endpoint.device.tuya_cover_inverted_by_default
+            else invert_attr
+        )
+        return value if invert else 100 - value
 
     def cover_event(self, attribute, value):
         """Event listener for cover events."""
         if attribute == ATTR_COVER_POSITION:
-            invert_attr = self._attr_cache.get(ATTR_COVER_INVERTED) == 1
-            invert = (
-                not invert_attr
-                if self.endpoint.device.tuya_cover_inverted_by_default
-                else invert_attr
-            )
-            value = value if invert else 100 - value
+            value = self._lift_percentage(value)
+            self.motion.report(value)
         self._update_attribute(attribute, value)
         _LOGGER.debug(
             "%s Tuya Attribute Cache : [%s]",
@@ -1279,7 +1746,23 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
             self._attr_cache,
         )
 
-    def command(
+    def cover_target_event(self, value):
+        """Event listener for the device starting to move to a position."""
+        target = self._lift_percentage(value)
+        if target == self.motion.target:
+            return
+
+        self.motion.start(target)
+        if not self.motion.can_estimate:
+            # without a travel time, show the target like the device reports it
+            self._update_attribute(ATTR_COVER_POSITION, target)
+
+    async def _default_response(self, command_id: int) -> foundation.CommandSchema:
+        return foundation.GENERAL_COMMANDS[
+            foundation.GeneralCommand.Default_Response
+        ].schema(command_id=command_id, status=foundation.Status.SUCCESS)
+
+    async def command(
         self,
         command_id: foundation.GeneralCommand | int | t.uint8_t,
         *args,
@@ -1289,6 +1772,7 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
         **kwargs: Any,
     ):
         """Override the default Cluster command."""
+        target = None
         if manufacturer is None:
             manufacturer = self.endpoint.device.manufacturer
         _LOGGER.debug(
@@ -1314,6 +1798,10 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
                 # need to implement direction change
                 self.endpoint.device.tuya_cover_command[command_id],
             ]  # remap the command to the Tuya command
+            if command_id == WINDOW_COVER_COMMAND_STOP:
+                self.motion.stop()
+            else:
+                target = 0 if command_id == WINDOW_COVER_COMMAND_UPOPEN else 100
         # Set Position Command
         elif command_id == WINDOW_COVER_COMMAND_LIFTPERCENT:
             tuya_payload.status = 0
@@ -1328,6 +1816,10 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
                 else invert_attr
             )
             position = args[0] if invert else 100 - args[0]
+            if self.motion.is_at(args[0]):
+                # the device reported being there, spare the round trip
+                return await self._default_response(command_id)
+            target = args[0]
             tuya_payload.data = [
                 4,
                 0,
@@ -1358,9 +1850,12 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
                 tuya_payload.data,
             )
 
-            return self.endpoint.tuya_manufacturer.command(
+            send = self.endpoint.tuya_manufacturer.command(
                 TUYA_SET_DATA, tuya_payload, expect_reply=True
             )
+            if target is None:
+                return await send
+            return await self.motion.move(target, send)
         else:
             _LOGGER.debug("Unrecognised command: %x", command_id)
             return foundation.Status.UNSUP_CLUSTER_COMMAND
@@ -1505,6 +2000,138 @@ class AttributeWithMask:
     mask: int
 
 
+class TuyaCommandPriority(enum.IntEnum):
+    """Priority of a command sent through a TuyaSendQueue, lowest first."""
+
+    USER = 0
+    HOUSEKEEPING = 1
+
+
+@dataclasses.dataclass(eq=False)
+class _QueuedCommand:
+    """Command waiting in a TuyaSendQueue."""
+
+    send: Callable[[], Coroutine[Any, Any, Any]]
+    key: Hashable | None
+    done: asyncio.Future[Any]
+    superseded: bool = False
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    """Mark a failure as retrieved, the send task already logs it."""
+    if not future.cancelled():
+        future.exception()
+
+
+class TuyaSendQueue:
+    """Per-device queue pacing the commands sent to a Tuya MCU.
+
+    Commands are sent by priority, then in submission order, with at most
+    `max_in_flight` of them awaiting the radio and at least `spacing` seconds
+    between two sends. A command submitted with the key of a command still waiting
+    in the queue supersedes it, the superseded command's future resolves to None.
+    """
+
+    def __init__(
+        self, cluster: CustomCluster, max_in_flight: int = 1, spacing: float = 0.0
+    ) -> None:
+        """Init."""
+        self._cluster = cluster
+        self.max_in_flight = max_in_flight
+        self.spacing = spacing
+        self._queue: list[tuple[int, int, _QueuedCommand]] = []
+        self._queued_by_key: dict[Hashable, _QueuedCommand] = {}
+        self._seq = itertools.count()
+        self._waiting = 0
+        self._in_flight = 0
+        self._last_sent: float | None = None
+        self._timer_handle: asyncio.TimerHandle | None = None
+        self.counters: dict[str, int] = dict.fromkeys(
+            ("submitted", "sent", "failed", "superseded"), 0
+        )
+
+    def submit(
+        self,
+        send: Callable[[], Coroutine[Any, Any, Any]],
+        *,
+        priority: TuyaCommandPriority = TuyaCommandPriority.USER,
+        key: Hashable | None = None,
+    ) -> asyncio.Future[Any]:
+        """Queue a command, `send` creates its coroutine once it is its turn.
+
+        The returned future resolves once the command was sent.
+        """
+        done = asyncio.get_running_loop().create_future()
+        done.add_done_callback(_retrieve_exception)
+        queued = _QueuedCommand(send, key, done)
+        self.counters["submitted"] += 1
+
+        if key is not None:
+            previous = self._queued_by_key.get(key)
+            if previous is not None:
+                previous.superseded = True
+                previous.done.set_result(None)
+                self._waiting -= 1
+                self.counters["superseded"] += 1
+            self._queued_by_key[key] = queued
+
+        self._waiting += 1
+        heapq.heappush(self._queue, (priority, next(self._seq), queued))
+        self._dispatch()
+        return done
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters and current queue depth, for monitoring."""
+        return {**self.counters, "queued": self._waiting, "in_flight": self._in_flight}
+
+    def _dispatch(self) -> None:
+        """Send queued commands while the in-flight and spacing limits allow."""
+        if self._timer_handle is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        while self._in_flight < self.max_in_flight:
+            # drop superseded commands first, they must not wait for the spacing
+            while self._queue and self._queue[0][2].superseded:
+                heapq.heappop(self._queue)
+            if not self._queue:
+                return
+
+            if self._last_sent is not None:
+                delay = self._last_sent + self.spacing - loop.time()
+                if delay > 0:
+                    self._timer_handle = loop.call_later(delay, self._on_timer)
+                    return
+
+            _, _, queued = heapq.heappop(self._queue)
+            if queued.key is not None:
+                del self._queued_by_key[queued.key]
+
+            self._waiting -= 1
+            self._in_flight += 1
+            self._last_sent = loop.time()
+            self._cluster.create_catching_task(self._send(queued))
+
+    def _on_timer(self) -> None:
+        self._timer_handle = None
+        self._dispatch()
+
+    async def _send(self, queued: _QueuedCommand) -> None:
+        try:
+            result = await queued.send()
+        except Exception as exc:
+            self.counters["failed"] += 1
+            queued.done.set_exception(exc)
+            raise
+        else:
+            self.counters["sent"] += 1
+            queued.done.set_result(result)
+        finally:
+            self._in_flight -= 1
+            self._dispatch()
+
+
 class TuyaNewManufCluster(CustomCluster):
     """Tuya manufacturer specific cluster.
 
@@ -1574,14 +2201,22 @@ class TuyaNewManufCluster(CustomCluster):
     dp_to_attribute: dict[int, DPToAttributeMapping | list[DPToAttributeMapping]] = {}
     data_point_handlers: dict[int, str] = {}
 
+    # Opt-in pacing of the commands sent to the MCU, see TuyaSendQueue.
+    # None sends every command right away.
+    send_queue_max_in_flight: int | None = None
+    send_queue_spacing: float = 0.0
+
     def __init__(self, *args, **kwargs):
         """Initialize the cluster and mark attributes as valid on LocalDataClusters."""
         super().__init__(*args, **kwargs)
 
-        self._dp_to_attributes: dict[int, list[DPToAttributeMapping]] = {
-            dp: attr if isinstance(attr, list) else [attr]
-            for dp, attr in self.dp_to_attribute.items()
-        }
+        self.send_queue: TuyaSendQueue | None = None
+        if self.send_queue_max_in_flight is not None:
+            self.send_queue = TuyaSendQueue(
+                self, self.send_queue_max_in_flight, self.send_queue_spacing
+            )
+
+        self._build_dp_indexes()
         for dp_map in self._dp_to_attributes.values():
             # get the endpoint that is being mapped to
             endpoint = self.endpoint
@@ -1609,6 +2244,70 @@ class TuyaNewManufCluster(CustomCluster):
                         cluster._VALID_ATTRIBUTES = set()
                     cluster._VALID_ATTRIBUTES.add(attr.id)
 
+    def _build_dp_indexes(self) -> None:
+        """Index the datapoint mappings by datapoint and by mapped attribute.
+
+        The indexes are rebuilt when `dp_to_attribute` is replaced, mappings must not
+        be mutated in place after the cluster has been created.
+        """
+        self._dp_mappings_source = self.dp_to_attribute
+        self._dp_to_attributes: dict[int, list[DPToAttributeMapping]] = {
+            dp: attr if isinstance(attr, list) else [attr]
+            for dp, attr in self.dp_to_attribute.items()
+        }
+
+        # (endpoint_id, attribute_name) -> {dp: mapping}, for outbound writes
+        self._attr_to_dp_mapping: dict[
+            tuple[int, str], dict[int, DPToAttributeMapping]
+        ] = {}
+        for dp, dp_map in self._dp_to_attributes.items():
+            for mapped_attr in dp_map:
+                if mapped_attr.endpoint_id is None:
+                    endpoint_id = self.endpoint.endpoint_id
+                else:
+                    endpoint_id = mapped_attr.endpoint_id
+
+                if isinstance(mapped_attr.attribute_name, tuple):
+                    attribute_names = mapped_attr.attribute_name
+                else:
+                    attribute_names = (mapped_attr.attribute_name,)
+
+                for attribute_name in attribute_names:
+                    self._attr_to_dp_mapping.setdefault(
+                        (endpoint_id, attribute_name), {}
+                    )[dp] = mapped_attr
+
+        # dp -> [(mapping, target cluster)], resolved on first report of the dp as
+        # clusters on other endpoints may not exist yet while this one is created
+        self._dp_targets: dict[int, list[tuple[DPToAttributeMapping, Any]]] = {}
+
+    def _resolve_dp_targets(self, dp: int) -> list[tuple[DPToAttributeMapping, Any]]:
+        """Resolve the clusters the mappings of a datapoint update."""
+        targets = []
+        endpoint = self.endpoint
+        for mapped_attr in self._dp_to_attributes[dp]:
+            if mapped_attr.endpoint_id:
+                endpoint = self.endpoint.device.endpoints[mapped_attr.endpoint_id]
+            targets.append((mapped_attr, getattr(endpoint, mapped_attr.ep_attribute)))
+
+        return targets
+
+    def send_mcu_command(
+        self,
+        send: Callable[[], Coroutine[Any, Any, Any]],
+        *,
+        priority: TuyaCommandPriority = TuyaCommandPriority.USER,
+        key: Hashable | None = None,
+    ) -> asyncio.Future[Any] | None:
+        """Send a command to the MCU, through the send queue if enabled.
+
+        With a send queue, returns the future of the queued command.
+        """
+        if self.send_queue is None:
+            self.create_catching_task(send())
+            return None
+        return self.send_queue.submit(send, priority=priority, key=key)
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -1650,23 +2349,25 @@ class TuyaNewManufCluster(CustomCluster):
     def handle_get_data(self, command: TuyaCommand) -> foundation.Status:
         """Handle get_data response (report)."""
         dp_error = False
-        for record in command.datapoints:
-            try:
-                dp_handler = self.data_point_handlers[record.dp]
-                getattr(self, dp_handler)(record)
-            except (AttributeError, KeyError):
-                self.debug("No datapoint handler for %s", record)
-                dp_error = True
-                # return foundation.Status.UNSUPPORTED_ATTRIBUTE
-
-        _LOGGER.debug(
-            "[0x%04x:%s:0x%04x] Received value %s for attribute 0x%04x",
-            self.endpoint.device.nwk,
-            self.endpoint.endpoint_id,
-            self.cluster_id,
-            record.data.payload,
-            record.dp,
-        )
+        with derivation_frame():
+            for record in command.datapoints:
+                try:
+                    dp_handler = self.data_point_handlers[record.dp]
+                    getattr(self, dp_handler)(record)
+                except (AttributeError, KeyError):
+                    self.debug("No datapoint handler for %s", record)
+                    dp_error = True
+                    # return foundation.Status.UNSUPPORTED_ATTRIBUTE
+
+        if command.datapoints and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[0x%04x:%s:0x%04x] Received value %s for attribute 0x%04x",
+                self.endpoint.device.nwk,
+                self.endpoint.endpoint_id,
+                self.cluster_id,
+                record.data.payload,
+                record.dp,
+            )
 
         return (
             foundation.Status.SUCCESS
@@ -1683,17 +2384,20 @@ class TuyaNewManufCluster(CustomCluster):
 
     def _dp_2_attr_update(self, datapoint: TuyaDatapointData) -> None:
         """Handle data point to attribute report conversion."""
+        if self.dp_to_attribute is not self._dp_mappings_source:
+            self._build_dp_indexes()
+
         try:
-            dp_map = self._dp_to_attributes[datapoint.dp]
+            targets = self._dp_targets[datapoint.dp]
         except KeyError:
-            self.debug("No attribute mapping for %s data point", datapoint.dp)
-            return
+            if datapoint.dp not in self._dp_to_attributes:
+                self.debug("No attribute mapping for %s data point", datapoint.dp)
+                return
+            targets = self._dp_targets[datapoint.dp] = self._resolve_dp_targets(
+                datapoint.dp
+            )
 
-        endpoint = self.endpoint
-        for mapped_attr in dp_map:
-            if mapped_attr.endpoint_id:
-                endpoint = self.endpoint.device.endpoints[mapped_attr.endpoint_id]
-            cluster = getattr(endpoint, mapped_attr.ep_attribute)
+        for mapped_attr, cluster in targets:
             value = datapoint.data.payload
             if mapped_attr.converter:
                 value = mapped_attr.converter(value)
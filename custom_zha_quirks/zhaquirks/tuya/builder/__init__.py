@@ -845,6 +845,7 @@ class TuyaQuirkBuilder(QuirkBuilder):
         replacement_cluster: TuyaMCUCluster = TuyaMCUCluster,
         force_add_cluster: bool = False,
         mcu_write_command: foundation.GeneralCommand | int | t.uint8_t = TUYA_SET_DATA,
+        write_batch_window: float | None = None,
     ) -> QuirksV2RegistryEntry:
         """Build the quirks v2 registry entry.
 
@@ -853,6 +854,8 @@ class TuyaQuirkBuilder(QuirkBuilder):
             even if no new Tuya attributes/datapoints were added before.
         :param mcu_write_command: The MCU command to use for the Tuya MCU cluster.
             Default is TUYA_SET_DATA. Few devices use TUYA_SEND_DATA instead.
+        :param write_batch_window: Coalesce datapoints written within this many
+            seconds into a single MCU command. Default is None (disabled).
         :return: The quirks v2 registry entry.
         """
 
@@ -882,6 +885,8 @@ class TuyaQuirkBuilder(QuirkBuilder):
             TuyaReplacementCluster.dp_to_attribute = self.tuya_dp_to_attribute
 
             TuyaReplacementCluster.mcu_write_command = mcu_write_command
+            if write_batch_window is not None:
+                TuyaReplacementCluster.write_batch_window = write_batch_window
 
             self.replaces(TuyaReplacementCluster)
         return super().add_to_registry()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 import datetime
+import functools
 from typing import Any, Final
 
 import zigpy.types as t
@@ -11,7 +13,7 @@ from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import LevelControl, OnOff
 from zigpy.zcl.foundation import ZCLAttributeDef
 
-from zhaquirks import Bus, DoublingPowerConfigurationCluster
+from zhaquirks import Bus, DoublingPowerConfigurationCluster, get_time_sync
 
 # add EnchantedDevice import for custom quirks backwards compatibility
 from zhaquirks.tuya import (
@@ -23,10 +25,11 @@ from zhaquirks.tuya import (
     NoManufacturerCluster,
     PowerOnState,
     TuyaCommand,
+    TuyaCommandPriority,
     TuyaDatapointData,
     TuyaLocalCluster,
     TuyaNewManufCluster,
-    TuyaTimePayload,
+    tuya_time_payload,
 )
 
 # New manufacturer attributes
@@ -155,6 +158,14 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
     set_time_offset = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
     set_time_local_offset = datetime.datetime(1970, 1, 1)
 
+    # Opt-in: coalesce datapoints written within this many seconds into one command.
+    # 0 only coalesces writes issued together, e.g. by a single write_attributes call.
+    write_batch_window: float | None = None
+    # Serialized datapoint bytes per batched command, to stay within one radio frame
+    write_batch_max_bytes: int = 64
+    # Opt-out for devices that reject commands carrying several datapoints
+    multi_dp_write_supported: bool = True
+
     # TODO: Backwards compatibility, remove
     MCUVersion = MCUVersion
     TuyaConnectionStatus = TuyaConnectionStatus
@@ -199,6 +210,12 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
         self.endpoint.device.command_bus = Bus()
         self.endpoint.device.command_bus.add_listener(self)
 
+        # (expect_reply, manufacturer) -> {dp: datapoint} waiting for the batch flush
+        self._batched_writes: dict[
+            tuple[bool, int | None], dict[int, TuyaDatapointData]
+        ] = {}
+        self._batch_flush_handle: asyncio.TimerHandle | asyncio.Handle | None = None
+
     def from_cluster_data(self, data: TuyaClusterData) -> list[TuyaCommand]:
         """Convert from cluster data to a tuya data payload."""
 
@@ -259,43 +276,99 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
             )
             return
 
-        for tuya_command in tuya_commands:
-            self.create_catching_task(
-                self.command(
-                    self.mcu_write_command,
-                    tuya_command,
-                    expect_reply=cluster_data.expect_reply,
-                    manufacturer=cluster_data.manufacturer,
+        if self.write_batch_window is not None and self.multi_dp_write_supported:
+            for tuya_command in tuya_commands:
+                self._batch_write(tuya_command, cluster_data)
+        else:
+            for tuya_command in tuya_commands:
+                self._send_datapoints(
+                    tuya_command, cluster_data.expect_reply, cluster_data.manufacturer
                 )
-            )
 
         endpoint = self.endpoint.device.endpoints[cluster_data.endpoint_id]
         cluster = getattr(endpoint, cluster_data.cluster_name)
         cluster.update_attribute(cluster_data.cluster_attr, cluster_data.attr_value)
 
+    def _batch_write(
+        self,
+        tuya_command: TuyaCommand,
+        cluster_data: TuyaClusterData,  # type:ignore[valid-type]
+    ) -> None:
+        """Queue the datapoints of a command until the write batch is flushed."""
+
+        key = (cluster_data.expect_reply, cluster_data.manufacturer)
+        batch = self._batched_writes.setdefault(key, {})
+        for datapoint in tuya_command.datapoints:
+            # a later write of the same datapoint supersedes the queued one
+            batch[datapoint.dp] = datapoint
+
+        if self._batch_flush_handle is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        if self.write_batch_window:
+            self._batch_flush_handle = loop.call_later(
+                self.write_batch_window, self._flush_batched_writes
+            )
+        else:
+            self._batch_flush_handle = loop.call_soon(self._flush_batched_writes)
+
+    def _flush_batched_writes(self) -> None:
+        """Send the queued datapoints, packing as many as fit in each command."""
+
+        self._batch_flush_handle = None
+        batches, self._batched_writes = self._batched_writes, {}
+
+        for (expect_reply, manufacturer), batch in batches.items():
+            chunks: list[list[TuyaDatapointData]] = [[]]
+            size = 0
+            for datapoint in batch.values():
+                dp_size = 5 + len(datapoint.data.raw)
+                if chunks[-1] and size + dp_size > self.write_batch_max_bytes:
+                    chunks.append([])
+                    size = 0
+                chunks[-1].append(datapoint)
+                size += dp_size
+
+            for datapoints in chunks:
+                cmd_payload = TuyaCommand()
+                cmd_payload.status = 0
+                cmd_payload.tsn = self.endpoint.device.application.get_sequence()
+                cmd_payload.datapoints = t.List(datapoints)
+                self.debug("Sending %d batched datapoints", len(datapoints))
+                self._send_datapoints(cmd_payload, expect_reply, manufacturer)
+
+    def _send_datapoints(
+        self,
+        tuya_command: TuyaCommand,
+        expect_reply: bool,
+        manufacturer: int | None,
+    ) -> None:
+        """Send a datapoint write, superseding a queued write of the same datapoints."""
+
+        self.send_mcu_command(
+            functools.partial(
+                self.command,
+                self.mcu_write_command,
+                tuya_command,
+                expect_reply=expect_reply,
+                manufacturer=manufacturer,
+            ),
+            priority=TuyaCommandPriority.USER,
+            key=tuple(datapoint.dp for datapoint in tuya_command.datapoints),
+        )
+
     def get_dp_mapping(
         self, endpoint_id: int, attribute_name: str
     ) -> dict[int, DPToAttributeMapping]:
         """Search for the DP in _dp_to_attributes."""
 
-        result: dict[int, DPToAttributeMapping] = {}
-        for dp, dp_mapping in self._dp_to_attributes.items():
-            for mapped_attr in dp_mapping:
-                if (
-                    attribute_name == mapped_attr.attribute_name
-                    or (
-                        isinstance(mapped_attr.attribute_name, tuple)
-                        and attribute_name in mapped_attr.attribute_name
-                    )
-                ) and (
-                    (
-                        mapped_attr.endpoint_id is None
-                        and endpoint_id == self.endpoint.endpoint_id
-                    )
-                    or (endpoint_id == mapped_attr.endpoint_id)
-                ):
-                    self.debug("get_dp_mapping --> found DP: %s", dp)
-                    result[dp] = mapped_attr
+        if self.dp_to_attribute is not self._dp_mappings_source:
+            self._build_dp_indexes()
+
+        result = dict(self._attr_to_dp_mapping.get((endpoint_id, attribute_name), {}))
+        if result:
+            self.debug("get_dp_mapping --> found DPs: %s", list(result))
         return result
 
     def handle_mcu_version_response(self, payload: MCUVersion) -> foundation.Status:  # type:ignore[valid-type]
@@ -309,22 +382,26 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
         """Handle set_time requests (0x24)."""
 
         self.debug("handle_set_time_request payload: %s", payload)
-        payload_rsp = TuyaTimePayload()
-
-        utc_timestamp = int(
-            (datetime.datetime.now(datetime.UTC) - self.set_time_offset).total_seconds()
-        )
-        local_timestamp = int(
-            (datetime.datetime.now() - self.set_time_local_offset).total_seconds()
-        )
+        super_command = super().command
 
-        payload_rsp.extend(utc_timestamp.to_bytes(4, "big", signed=False))
-        payload_rsp.extend(local_timestamp.to_bytes(4, "big", signed=False))
+        def send_time():
+            payload_rsp = tuya_time_payload(
+                self.set_time_offset, self.set_time_local_offset
+            )
+            self.debug("handle_set_time_request response: %s", payload_rsp)
+            return super_command(TUYA_SET_TIME, payload_rsp, expect_reply=False)
 
-        self.debug("handle_set_time_request response: %s", payload_rsp)
-        self.create_catching_task(
-            super().command(TUYA_SET_TIME, payload_rsp, expect_reply=False)
-        )
+        if self.send_queue is None:
+            # awaited by the time sync service, bounding the replies in flight
+            send = send_time
+        else:
+            send = functools.partial(
+                self.send_mcu_command,
+                send_time,
+                priority=TuyaCommandPriority.HOUSEKEEPING,
+                key=TUYA_SET_TIME,
+            )
+        get_time_sync().reply(self.endpoint.device, send)
 
         return foundation.Status.SUCCESS
 
@@ -338,8 +415,15 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
         payload_rsp.tsn = payload.tsn
         payload_rsp.status = b"\x01"  # 0x00 not connected to internet | 0x01 connected to internet | 0x02 time out
 
-        self.create_catching_task(
-            super().command(TUYA_MCU_CONNECTION_STATUS, payload_rsp, expect_reply=False)
+        self.send_mcu_command(
+            functools.partial(
+                super().command,
+                TUYA_MCU_CONNECTION_STATUS,
+                payload_rsp,
+                expect_reply=False,
+            ),
+            priority=TuyaCommandPriority.HOUSEKEEPING,
+            key=TUYA_MCU_CONNECTION_STATUS,
         )
 
         return foundation.Status.SUCCESS
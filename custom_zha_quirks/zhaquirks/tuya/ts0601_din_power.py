@@ -11,7 +11,7 @@ from zigpy.zcl.clusters.homeautomation import ElectricalMeasurement
 from zigpy.zcl.clusters.smartenergy import Metering
 from zigpy.zcl.foundation import ZCLAttributeDef
 
-from zhaquirks import Bus, LocalDataCluster
+from zhaquirks import Bus, LocalDataCluster, ReportingFilterMixin
 from zhaquirks.const import (
     DEVICE_TYPE,
     ENDPOINTS,
@@ -86,7 +86,9 @@ class TuyaManufClusterDinPower(TuyaManufClusterAttributes):
             )
 
 
-class TuyaPowerMeasurement(LocalDataCluster, ElectricalMeasurement):
+class TuyaPowerMeasurement(
+    ReportingFilterMixin, LocalDataCluster, ElectricalMeasurement
+):
     """Custom class for power, voltage and current measurement."""
 
     POWER_ID = 0x050B
@@ -138,7 +140,7 @@ class TuyaPowerMeasurement(LocalDataCluster, ElectricalMeasurement):
         self._update_attribute(self.TOTAL_REACTIVE_POWER_ID, value)
 
 
-class TuyaElectricalMeasurement(LocalDataCluster, Metering):
+class TuyaElectricalMeasurement(ReportingFilterMixin, LocalDataCluster, Metering):
     """Custom class for total energy measurement."""
 
     CURRENT_DELIVERED_ID = 0x0000
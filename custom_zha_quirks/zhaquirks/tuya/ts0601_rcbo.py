@@ -1,6 +1,6 @@
 """Tuya Din RCBO Circuit Breaker."""
 
-from typing import Any, Final, Optional, Union
+from typing import Final, Optional, Union
 
 from zigpy.profiles import zha
 from zigpy.quirks import CustomCluster, CustomDevice
@@ -18,6 +18,7 @@ from zigpy.zcl.clusters.homeautomation import ElectricalMeasurement
 from zigpy.zcl.clusters.smartenergy import Metering
 from zigpy.zcl.foundation import ZCLAttributeDef
 
+from zhaquirks import DerivedAttribute, DerivedAttributesMixin, ReportingFilterMixin
 from zhaquirks.const import (
     DEVICE_TYPE,
     ENDPOINTS,
@@ -193,7 +194,12 @@ class TuyaRCBOOnOff(TuyaOnOff, TuyaAttributesCluster):
         return await super().command(command_id, args, manufacturer, expect_reply, tsn)
 
 
-class TuyaRCBOElectricalMeasurement(ElectricalMeasurement, TuyaAttributesCluster):
+class TuyaRCBOElectricalMeasurement(
+    DerivedAttributesMixin,
+    ReportingFilterMixin,
+    ElectricalMeasurement,
+    TuyaAttributesCluster,
+):
     """Custom class for power, voltage and current measurement."""
 
     AC_VOLTAGE_MULTIPLIER = 0x0600
@@ -212,6 +218,21 @@ class TuyaRCBOElectricalMeasurement(ElectricalMeasurement, TuyaAttributesCluster
         AC_POWER_DIVISOR: 10,
     }
 
+    derived_attributes = (
+        DerivedAttribute(
+            "apparent_power",
+            ("rms_current", "rms_voltage"),
+            lambda current, voltage: int(current * voltage / 1000) if voltage else None,
+        ),
+        DerivedAttribute(
+            "power_factor",
+            ("active_power", "apparent_power"),
+            lambda power, apparent: (
+                round(min(power / apparent * 100, 100)) if apparent else None
+            ),
+        ),
+    )
+
     class AttributeDefs(ElectricalMeasurement.AttributeDefs):
         """Attribute definitions."""
 
@@ -233,24 +254,6 @@ class TuyaRCBOElectricalMeasurement(ElectricalMeasurement, TuyaAttributesCluster
         rms_historical_voltage: Final = ZCLAttributeDef(id=0xF760, type=t.uint16_t)
         rms_historical_current: Final = ZCLAttributeDef(id=0xF770, type=t.uint16_t)
 
-    def update_attribute(self, attr_name: str, value: Any) -> None:
-        """Calculate active current and power factor."""
-
-        super().update_attribute(attr_name, value)
-
-        if attr_name == "rms_current":
-            rms_voltage = self.get("rms_voltage")
-            if rms_voltage:
-                apparent_power = value * rms_voltage / 1000
-                super().update_attribute("apparent_power", int(apparent_power))
-
-        if attr_name == "active_power":
-            apparent_power = self.get("apparent_power")
-            if apparent_power:
-                power_factor = value / apparent_power * 100
-                power_factor = min(power_factor, 100)
-                super().update_attribute("power_factor", round(power_factor))
-
 
 class TuyaRCBODeviceTemperature(DeviceTemperature, TuyaAttributesCluster):
     """Tuya device temperature."""
@@ -261,7 +264,7 @@ class TuyaRCBODeviceTemperature(DeviceTemperature, TuyaAttributesCluster):
         over_temp_trip: Final = ZCLAttributeDef(id=0xFF10, type=t.Bool)
 
 
-class TuyaRCBOMetering(Metering, TuyaAttributesCluster):
+class TuyaRCBOMetering(ReportingFilterMixin, Metering, TuyaAttributesCluster):
     """Custom class for total energy measurement."""
 
     UNIT_OF_MEASURE = 0x0300
@@ -33,6 +33,8 @@ from zhaquirks.const import (
 from zhaquirks.tuya import (
     TuyaManufClusterAttributes,
     TuyaPowerConfigurationCluster2AA,
+    TuyaSchedule,
+    TuyaScheduleSlot,
     TuyaThermostat,
     TuyaThermostatCluster,
     TuyaUserInterfaceCluster,
@@ -211,10 +213,6 @@ MOES_SCHEDULE_WORKDAY_ATTR = 0x0070
 MOES_SCHEDULE_WEEKEND_ATTR = 0x0071
 
 
-class data144(t.FixedList, item_type=t.uint8_t, length=18):
-    """General data, Discrete, 144 bit."""
-
-
 class MoesManufCluster(TuyaManufClusterAttributes):
     """Manufacturer Specific Cluster of some thermostatic valves."""
 
@@ -282,10 +280,14 @@ class MoesManufCluster(TuyaManufClusterAttributes):
             id=MOES_AWAY_DAYS_ATTR, type=t.uint32_t, is_manufacturer_specific=True
         )
         workday_schedule: Final = ZCLAttributeDef(
-            id=MOES_SCHEDULE_WORKDAY_ATTR, type=data144, is_manufacturer_specific=True
+            id=MOES_SCHEDULE_WORKDAY_ATTR,
+            type=TuyaSchedule,
+            is_manufacturer_specific=True,
         )
         weekend_schedule: Final = ZCLAttributeDef(
-            id=MOES_SCHEDULE_WEEKEND_ATTR, type=data144, is_manufacturer_specific=True
+            id=MOES_SCHEDULE_WEEKEND_ATTR,
+            type=TuyaSchedule,
+            is_manufacturer_specific=True,
         )
 
     DIRECT_MAPPED_ATTRS = {
@@ -447,6 +449,12 @@ class MoesThermostat(TuyaThermostatCluster):
         unoccupied_duration_days: Final = ZCLAttributeDef(
             id=0x4007, type=t.uint32_t, is_manufacturer_specific=True
         )
+        workday_schedule: Final = ZCLAttributeDef(
+            id=0x4100, type=TuyaSchedule, is_manufacturer_specific=True
+        )
+        weekend_schedule: Final = ZCLAttributeDef(
+            id=0x4200, type=TuyaSchedule, is_manufacturer_specific=True
+        )
         workday_schedule_1_hour: Final = ZCLAttributeDef(
             id=0x4110, type=t.uint8_t, is_manufacturer_specific=True
         )
@@ -631,6 +639,12 @@ class MoesThermostat(TuyaThermostatCluster):
         "weekend_schedule_1_hour": 6,
     }
 
+    # Manufacturer attribute and switch point defaults of each schedule
+    SCHEDULE_ATTRS = {
+        "workday_schedule": (MOES_SCHEDULE_WORKDAY_ATTR, WORKDAY_SCHEDULE_ATTRS),
+        "weekend_schedule": (MOES_SCHEDULE_WEEKEND_ATTR, WEEKEND_SCHEDULE_ATTRS),
+    }
+
     def map_attribute(self, attribute, value):
         """Map standardized attribute value to dict of manufacturer values."""
 
@@ -670,50 +684,63 @@ class MoesThermostat(TuyaThermostatCluster):
                     self.attributes_by_name["operation_preset"].id, 2
                 )
             }
-        if attribute in self.WORKDAY_SCHEDULE_ATTRS:
-            data = data144()
-            for num, (attr, default) in enumerate(self.WORKDAY_SCHEDULE_ATTRS.items()):
-                if num % 3 == 0:
-                    if attr == attribute:
-                        val = round(value / 100)
-                    else:
-                        val = round(
-                            self._attr_cache.get(
-                                self.attributes_by_name[attr].id, default
-                            )
-                            / 100
-                        )
-                elif attr == attribute:
-                    val = value
-                else:
-                    val = self._attr_cache.get(
-                        self.attributes_by_name[attr].id, default
-                    )
+        if attribute in self.SCHEDULE_ATTRS:
+            return {self.SCHEDULE_ATTRS[attribute][0]: TuyaSchedule(value)}
+        schedule = self._slot_schedule(attribute)
+        if schedule is not None:
+            return {
+                self.SCHEDULE_ATTRS[schedule][0]: self._schedule_from_slots(
+                    schedule, {attribute: value}
+                )
+            }
 
-                data.append(val)
-            return {MOES_SCHEDULE_WORKDAY_ATTR: data}
-        if attribute in self.WEEKEND_SCHEDULE_ATTRS:
-            data = data144()
-            for num, (attr, default) in enumerate(self.WEEKEND_SCHEDULE_ATTRS.items()):
-                if num % 3 == 0:
-                    if attr == attribute:
-                        val = round(value / 100)
-                    else:
-                        val = round(
-                            self._attr_cache.get(
-                                self.attributes_by_name[attr].id, default
-                            )
-                            / 100
-                        )
-                elif attr == attribute:
-                    val = value
+    def _slot_schedule(self, attribute: str) -> str | None:
+        """Return the schedule a switch point attribute belongs to."""
+        for schedule, (_, defaults) in self.SCHEDULE_ATTRS.items():
+            if attribute in defaults:
+                return schedule
+        return None
+
+    def _schedule_from_slots(self, schedule: str, values: dict) -> TuyaSchedule:
+        """Encode a schedule from switch point values, cached ones or defaults."""
+        defaults = self.SCHEDULE_ATTRS[schedule][1]
+        slots = []
+        for num in range(1, len(defaults) // 3 + 1):
+            slot = []
+            for field in TuyaScheduleSlot._fields:
+                attr = f"{schedule}_{num}_{field}"
+                if attr in values:
+                    slot.append(values[attr])
                 else:
-                    val = self._attr_cache.get(
-                        self.attributes_by_name[attr].id, default
+                    slot.append(
+                        self._attr_cache.get(
+                            self.attributes_by_name[attr].id, defaults[attr]
+                        )
                     )
+            slots.append(TuyaScheduleSlot(*slot))
+        return TuyaSchedule.from_slots(slots)
+
+    async def write_attributes(self, attributes, manufacturer=None):
+        """Fold switch point writes into a single write per schedule."""
+        folded = {}
+        slot_values = {}
+        for key, value in attributes.items():
+            try:
+                name = self.find_attribute(key).name
+            except KeyError:
+                folded[key] = value
+                continue
+
+            schedule = self._slot_schedule(name)
+            if schedule is None:
+                folded[key] = value
+            else:
+                slot_values.setdefault(schedule, {})[name] = value
+
+        for schedule, values in slot_values.items():
+            folded[schedule] = self._schedule_from_slots(schedule, values)
 
-                data.append(val)
-            return {MOES_SCHEDULE_WEEKEND_ATTR: data}
+        return await super().write_attributes(folded, manufacturer=manufacturer)
 
     def mode_change(self, value):
         """System Mode change."""
@@ -745,127 +772,24 @@ class MoesThermostat(TuyaThermostatCluster):
         """Scheduler attribute change."""
 
         if attr == MOES_SCHEDULE_WORKDAY_ATTR:
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_hour"].id, value[17] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_minute"].id, value[16]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_temperature"].id,
-                value[15] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_hour"].id, value[14] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_minute"].id, value[13]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_temperature"].id,
-                value[12] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_hour"].id, value[11] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_minute"].id, value[10]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_temperature"].id,
-                value[9] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_hour"].id, value[8] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_minute"].id, value[7]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_temperature"].id,
-                value[6] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_hour"].id, value[5] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_minute"].id, value[4]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_temperature"].id,
-                value[3] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_hour"].id, value[2] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_minute"].id, value[1]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_temperature"].id,
-                value[0] * 100,
-            )
+            schedule = "workday_schedule"
         elif attr == MOES_SCHEDULE_WEEKEND_ATTR:
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_hour"].id, value[17] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_minute"].id, value[16]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_temperature"].id,
-                value[15] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_hour"].id, value[14] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_minute"].id, value[13]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_temperature"].id,
-                value[12] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_hour"].id, value[11] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_minute"].id, value[10]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_temperature"].id,
-                value[9] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_hour"].id, value[8] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_minute"].id, value[7]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_temperature"].id,
-                value[6] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_hour"].id, value[5] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_minute"].id, value[4]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_temperature"].id,
-                value[3] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_hour"].id, value[2] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_minute"].id, value[1]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_temperature"].id,
-                value[0] * 100,
-            )
+            schedule = "weekend_schedule"
+        else:
+            return
+
+        attrid = self.attributes_by_name[schedule].id
+        value = TuyaSchedule(value)
+        old = self._attr_cache.get(attrid)
+        changed = value.changed_slots(None if old is None else TuyaSchedule(old))
+
+        self._update_attribute(attrid, value)
+        for index, slot in changed:
+            for field, field_value in zip(slot._fields, slot):
+                self._update_attribute(
+                    self.attributes_by_name[f"{schedule}_{index + 1}_{field}"].id,
+                    field_value,
+                )
 
 
 class MoesThermostatNew(MoesThermostat):
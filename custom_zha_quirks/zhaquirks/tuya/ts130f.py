@@ -16,6 +16,7 @@ from zigpy.zcl.clusters.general import (
     Scenes,
     Time,
 )
+from zigpy.zcl import foundation
 from zigpy.zcl.foundation import ZCLAttributeDef
 
 from zhaquirks.const import (
@@ -26,7 +27,11 @@ from zhaquirks.const import (
     OUTPUT_CLUSTERS,
     PROFILE_ID,
 )
-from zhaquirks.tuya import SwitchBackLight, TuyaZBExternalSwitchTypeCluster
+from zhaquirks.tuya import (
+    SwitchBackLight,
+    TuyaCoverMotion,
+    TuyaZBExternalSwitchTypeCluster,
+)
 
 ATTR_CURRENT_POSITION_LIFT_PERCENTAGE = 0x0008
 CMD_GO_TO_LIFT_PERCENTAGE = 0x0005
@@ -60,29 +65,64 @@ class TuyaCoveringCluster(CustomCluster, WindowCovering):
         motor_reversal: Final = ZCLAttributeDef(id=0xF002, type=t.enum8)
         calibration_time: Final = ZCLAttributeDef(id=0xF003, type=t.uint16_t)
 
+    # Seconds the cover takes to fully open or close, learned when None
+    cover_travel_time: float | None = None
+    # Minimum seconds between two estimated positions while the cover moves
+    cover_update_interval: float = 1.0
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self.motion = TuyaCoverMotion(
+            lambda position: super(TuyaCoveringCluster, self)._update_attribute(
+                ATTR_CURRENT_POSITION_LIFT_PERCENTAGE, position
+            ),
+            self.cover_travel_time,
+            self.cover_update_interval,
+        )
+
     def _update_attribute(self, attrid, value):
         if attrid == ATTR_CURRENT_POSITION_LIFT_PERCENTAGE:
             # Invert the percentage value (cf https://github.com/dresden-elektronik/deconz-rest-plugin/issues/3757)
             value = 100 - value
+            self.motion.report(value)
         super()._update_attribute(attrid, value)
 
     async def command(
         self, command_id, *args, manufacturer=None, expect_reply=True, tsn=None
     ):
         """Override default command to invert percent lift value."""
+        target = None
+        if command_id == self.ServerCommandDefs.up_open.id:
+            target = 0
+        elif command_id == self.ServerCommandDefs.down_close.id:
+            target = 100
+        elif command_id == self.ServerCommandDefs.stop.id:
+            self.motion.stop()
+
         if command_id == CMD_GO_TO_LIFT_PERCENTAGE:
             percent = args[0]
+            if self.motion.is_at(percent):
+                # the device reported being there, spare the round trip
+                return foundation.GENERAL_COMMANDS[
+                    foundation.GeneralCommand.Default_Response
+                ].schema(command_id=command_id, status=foundation.Status.SUCCESS)
+            target = percent
             # Invert the percentage value (cf https://github.com/dresden-elektronik/deconz-rest-plugin/issues/3757)
             percent = 100 - percent
             v = (percent,)
-            return await super().command(command_id, *v)
-        return await super().command(
+            return await self.motion.move(target, super().command(command_id, *v))
+
+        send = super().command(
             command_id,
             *args,
             manufacturer=manufacturer,
             expect_reply=expect_reply,
             tsn=tsn,
         )
+        if target is None:
+            return await send
+        return await self.motion.move(target, send)
 
 
 class TuyaTS130FTI(CustomDevice):
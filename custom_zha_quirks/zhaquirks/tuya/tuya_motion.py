@@ -1,6 +1,5 @@
 """BlitzWolf IS-3/Tuya motion rechargeable occupancy sensor."""
 
-import asyncio
 from typing import Any
 
 from zigpy.quirks.v2 import EntityPlatform, EntityType
@@ -11,6 +10,7 @@ import zigpy.types as t
 from zigpy.zcl.clusters.measurement import OccupancySensing
 from zigpy.zcl.clusters.security import IasZone
 
+from zhaquirks import ResetTimerMixin
 from zhaquirks.tuya import TuyaLocalCluster
 from zhaquirks.tuya.builder import TuyaQuirkBuilder
 
@@ -19,7 +19,7 @@ class TuyaOccupancySensing(OccupancySensing, TuyaLocalCluster):
     """Tuya local OccupancySensing cluster."""
 
 
-class TuyaMotionWithReset(IasZone, TuyaLocalCluster):
+class TuyaMotionWithReset(ResetTimerMixin, IasZone, TuyaLocalCluster):
     """Tuya local IAS motion cluster with reset."""
 
     _CONSTANT_ATTRIBUTES = {
@@ -27,15 +27,8 @@ class TuyaMotionWithReset(IasZone, TuyaLocalCluster):
     }
     reset_s: int = 15
 
-    def __init__(self, *args, **kwargs):
-        """Init."""
-        super().__init__(*args, **kwargs)
-        self._loop = asyncio.get_running_loop()
-        self._timer_handle = None
-
     def _turn_off(self) -> None:
         """Reset IAS zone status."""
-        self._timer_handle = None
         self.debug("%s - Resetting Tuya motion sensor", self.endpoint.device.ieee)
         self._update_attribute(IasZone.AttributeDefs.zone_status.id, 0)
 
@@ -46,9 +39,7 @@ class TuyaMotionWithReset(IasZone, TuyaLocalCluster):
             and value == IasZone.ZoneStatus.Alarm_1
         ):
             self.debug("%s - Received Tuya motion event", self.endpoint.device.ieee)
-            if self._timer_handle:
-                self._timer_handle.cancel()
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._schedule_reset()
 
         super()._update_attribute(attrid, value)
 
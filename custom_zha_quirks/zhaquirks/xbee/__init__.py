@@ -3,12 +3,16 @@
 See xbee.md for additional information.
 """
 
+from __future__ import annotations
+
 import asyncio
 import enum
+import functools
 import logging
 from typing import Any, Optional
 
 from zigpy.quirks import CustomDevice
+import zigpy.exceptions
 import zigpy.types as t
 from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import (
@@ -48,6 +52,9 @@ ATTR_PRESENT_VALUE = 0x0055
 PIN_ANALOG_OUTPUT = 2
 
 REMOTE_AT_COMMAND_TIMEOUT = 30
+# Largest unicast RF payload without fragmentation or APS encryption, see ATNP
+XBEE_SERIAL_MAX_PAYLOAD = 84
+XBEE_SERIAL_STREAM_LIMIT = 2**16
 
 
 # https://github.com/zigpy/zigpy-xbee/blob/dev/zigpy_xbee/api.py
@@ -258,11 +265,12 @@ class XBeePWM(LocalDataCluster, AnalogOutput):
             attr_id = "present_value"
         if attr_id:
             duty_cycle = int(round(float(attributes[attr_id])))
-            at_command = self._ep_id_2_pwm.get(self._endpoint.endpoint_id)
-            await self._endpoint.device.remote_at(at_command, duty_cycle)
-
-            at_command = ENDPOINT_TO_AT.get(self._endpoint.endpoint_id)
-            await self._endpoint.device.remote_at(at_command, PIN_ANALOG_OUTPUT)
+            await self._endpoint.device.remote_at_batch(
+                [
+                    (self._ep_id_2_pwm.get(self._endpoint.endpoint_id), duty_cycle),
+                    (ENDPOINT_TO_AT.get(self._endpoint.endpoint_id), PIN_ANALOG_OUTPUT),
+                ]
+            )
 
         return await super().write_attributes(attributes, manufacturer, **kwargs)
 
@@ -298,11 +306,31 @@ class XBeeRemoteATRequest(LocalDataCluster):
         )
 
     _seq: int = 1
+    # Remote AT commands awaiting a reply at once, at most one per frame id
+    max_pending_at_commands: int = 255
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._pending_at_commands = asyncio.Semaphore(self.max_pending_at_commands)
+
+    @property
+    def _at_response_cluster(self):
+        return self._endpoint.in_clusters[XBEE_AT_RESPONSE_CLUSTER]
 
     def _save_at_request(self, frame_id, future):
-        self._endpoint.in_clusters[XBEE_AT_RESPONSE_CLUSTER].save_at_request(
-            frame_id, future
-        )
+        self._at_response_cluster.save_at_request(frame_id, future)
+
+    def _next_frame_id(self) -> int:
+        """Return the next frame id without a pending request."""
+        for _ in range(255):
+            frame_id = self._seq
+            self._seq = (self._seq % 255) + 1
+
+            if not self._at_response_cluster.is_awaiting(frame_id):
+                return frame_id
+
+        raise RuntimeError("No free frame id for a remote AT command")
 
     def remote_at_command(self, cmd_name, *args, apply_changes=True, **kwargs):
         """Execute a Remote AT Command and Return Response."""
@@ -321,22 +349,46 @@ class XBeeRemoteATRequest(LocalDataCluster):
             options |= 0x02
         return self._remote_at_command(options, cmd_name, *args)
 
+    async def remote_at_commands(self, commands, *, apply_changes=True):
+        """Execute several Remote AT Commands and Return their Responses.
+
+        `commands` are `(cmd_name, *args)` tuples. They are all sent without waiting
+        for each reply, and changes are applied by a single trailing `AC` once every
+        command succeeded.
+        """
+        results = await asyncio.gather(
+            *(
+                self.remote_at_command(cmd_name, *args, apply_changes=False)
+                for cmd_name, *args in commands
+            ),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        if apply_changes:
+            await self.remote_at_command("AC", apply_changes=False)
+
+        return results
+
     async def _remote_at_command(self, options, name, *args):
         _LOGGER.debug("Remote AT command: %s %s", name, args)
         data = t.serialize(args, (AT_COMMANDS[name],))
-        try:
-            return await asyncio.wait_for(
-                await self._command(options, name.encode("ascii"), data, *args),
-                timeout=REMOTE_AT_COMMAND_TIMEOUT,
-            )
-        except TimeoutError:
-            _LOGGER.warning("No response to %s command", name)
-            raise
+        async with self._pending_at_commands:
+            try:
+                return await asyncio.wait_for(
+                    await self._command(options, name.encode("ascii"), data, *args),
+                    timeout=REMOTE_AT_COMMAND_TIMEOUT,
+                )
+            except TimeoutError:
+                _LOGGER.warning("No response to %s command", name)
+                raise
 
     async def _command(self, options, command, data, *args):
         _LOGGER.debug("Command %s %s", command, data)
-        frame_id = self._seq
-        self._seq = (self._seq % 255) + 1
+        frame_id = self._next_frame_id()
         schema = (
             t.uint8_t,
             t.uint8_t,
@@ -430,11 +482,25 @@ class XBeeRemoteATResponse(LocalDataCluster):
 
     cluster_id = XBEE_AT_RESPONSE_CLUSTER
 
-    _awaiting = {}
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        # Pending requests of this device, by frame id
+        self._awaiting: dict[int, asyncio.Future] = {}
 
     def save_at_request(self, frame_id, future):
         """Save pending request."""
-        self._awaiting[frame_id] = (future,)
+        self._awaiting[frame_id] = future
+        # Forget the request once answered, failed or timed out
+        future.add_done_callback(functools.partial(self._discard_at_request, frame_id))
+
+    def is_awaiting(self, frame_id) -> bool:
+        """Check if a request is pending for the frame id."""
+        return frame_id in self._awaiting
+
+    def _discard_at_request(self, frame_id, future):
+        if self._awaiting.get(frame_id) is future:
+            del self._awaiting[frame_id]
 
     def handle_cluster_request(
         self,
@@ -449,7 +515,13 @@ class XBeeRemoteATResponse(LocalDataCluster):
                 "Remote AT command response: %s",
                 (args.frame_id, args.cmd, args.status, args.value),
             )
-            (fut,) = self._awaiting.pop(args.frame_id)
+            fut = self._awaiting.pop(args.frame_id, None)
+            if fut is None or fut.done():
+                _LOGGER.debug(
+                    "Ignoring remote AT response to unknown frame %s", args.frame_id
+                )
+                return
+
             try:
                 status = ATCommandResult(args.status)
             except ValueError:
@@ -489,6 +561,16 @@ class XBeeDigitalIOCluster(LocalDataCluster, BinaryInput):
     """Digital IO Cluster for the XBee."""
 
     cluster_id = XBEE_IO_CLUSTER
+    # Only update pins whose value changed since the last update
+    report_changes_only: bool = False
+    # Smallest change of an analog input value updated in `report_changes_only` mode
+    analog_deadband: float = 0.0
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._last_digital: dict[int, int] = {}
+        self._last_analog: dict[int, float] = {}
 
     def handle_cluster_request(
         self,
@@ -503,31 +585,48 @@ class XBeeDigitalIOCluster(LocalDataCluster, BinaryInput):
         """
         if hdr.command_id == SAMPLE_DATA_CMD:
             values = args.io_sample
-            if "digital_samples" in values:
-                # Update digital inputs
-                active_pins = [
-                    i for i, x in enumerate(values["digital_samples"]) if x is not None
-                ]
-                for pin in active_pins:
-                    # pylint: disable=W0212
-                    self._endpoint.device[0xD0 + pin].on_off._update_attribute(
-                        ATTR_ON_OFF, values["digital_samples"][pin]
-                    )
-            if "analog_samples" in values:
-                # Update analog inputs
-                active_pins = [
-                    i for i, x in enumerate(values["analog_samples"]) if x is not None
-                ]
-                for pin in active_pins:
-                    # pylint: disable=W0212
-                    self._endpoint.device[0xD0 + pin].analog_input._update_attribute(
-                        ATTR_PRESENT_VALUE,
-                        values["analog_samples"][pin]
-                        / (10.23 if pin != 7 else 1000),  # supply voltage is in mV
-                    )
+            for sample_set in values.get("sample_sets", (values,)):
+                self._handle_sample_set(sample_set)
         else:
             super().handle_cluster_request(hdr, args)
 
+    def _handle_sample_set(self, values):
+        """Update the pins sampled in one sample set."""
+        changes_only = self.report_changes_only
+
+        # Update digital inputs
+        for pin, value in enumerate(values.get("digital_samples", ())):
+            if value is None:
+                continue
+            if changes_only and self._last_digital.get(pin) == value:
+                continue
+
+            self._last_digital[pin] = value
+            # pylint: disable=W0212
+            self._endpoint.device[0xD0 + pin].on_off._update_attribute(
+                ATTR_ON_OFF, value
+            )
+
+        # Update analog inputs
+        for pin, value in enumerate(values.get("analog_samples", ())):
+            if value is None:
+                continue
+
+            value /= 10.23 if pin != 7 else 1000  # supply voltage is in mV
+            last = self._last_analog.get(pin)
+            if (
+                changes_only
+                and last is not None
+                and (value == last or abs(value - last) < self.analog_deadband)
+            ):
+                continue
+
+            self._last_analog[pin] = value
+            # pylint: disable=W0212
+            self._endpoint.device[0xD0 + pin].analog_input._update_attribute(
+                ATTR_PRESENT_VALUE, value
+            )
+
     class ServerCommandDefs(BaseCommandDefs):
         """Server command definitions."""
 
@@ -573,6 +672,26 @@ class XBeeSerialDataCluster(LocalDataCluster):
     cluster_id = XBEE_DATA_CLUSTER
     ep_attribute = "xbee_serial_data"
 
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        # Receives incoming data instead of the event relay while a stream is open
+        self.stream_reader: XBeeSerialReader | None = None
+
+    async def send_data(self, data: bytes):
+        """Send raw serial data, returning the delivery status."""
+        status, _ = await self._endpoint.device.application.request(
+            self._endpoint.device,
+            XBEE_PROFILE_ID,
+            XBEE_DATA_CLUSTER,
+            XBEE_DATA_ENDPOINT,
+            XBEE_DATA_ENDPOINT,
+            self._endpoint.device.get_sequence(),
+            data,
+            expect_reply=False,
+        )
+        return status
+
     async def command(
         self,
         command_id,
@@ -583,16 +702,7 @@ class XBeeSerialDataCluster(LocalDataCluster):
         tsn=None,
     ):
         """Handle outgoing data."""
-        status, _ = await self._endpoint.device.application.request(
-            self._endpoint.device,
-            XBEE_PROFILE_ID,
-            XBEE_DATA_CLUSTER,
-            XBEE_DATA_ENDPOINT,
-            XBEE_DATA_ENDPOINT,
-            self._endpoint.device.get_sequence(),
-            BinaryString(data).serialize(),
-            expect_reply=False,
-        )
+        status = await self.send_data(BinaryString(data).serialize())
 
         return foundation.GENERAL_COMMANDS[
             foundation.GeneralCommand.Default_Response
@@ -606,7 +716,9 @@ class XBeeSerialDataCluster(LocalDataCluster):
         dst_addressing: Optional[t.AddrMode] = None,
     ):
         """Handle incoming data."""
-        if hdr.command_id == DATA_IN_CMD:
+        if hdr.command_id == DATA_IN_CMD and self.stream_reader is not None:
+            self.stream_reader.feed_data(args.data.serialize())
+        elif hdr.command_id == DATA_IN_CMD:
             self._endpoint.out_clusters[LevelControl.cluster_id].handle_cluster_request(
                 hdr, {"data": args.data}
             )
@@ -632,6 +744,197 @@ class XBeeSerialDataCluster(LocalDataCluster):
         )
 
 
+class XBeeSerialReader:
+    """Buffered reader of the serial data received from an XBee.
+
+    Incoming radio frames are appended to a buffer of at most `limit` bytes. The
+    radio cannot be paused, so data that does not fit is dropped and counted.
+    """
+
+    def __init__(self, limit: int = XBEE_SERIAL_STREAM_LIMIT) -> None:
+        """Init."""
+        self._limit = limit
+        self._buffer = bytearray()
+        self._eof = False
+        self._waiter: asyncio.Future | None = None
+        self.dropped_bytes = 0
+
+    def feed_data(self, data: bytes) -> None:
+        """Append received data to the buffer."""
+        free = self._limit - len(self._buffer)
+        if len(data) > free:
+            _LOGGER.warning(
+                "XBee serial stream buffer full, dropping %d bytes", len(data) - free
+            )
+            self.dropped_bytes += len(data) - free
+            data = data[:free]
+
+        if data:
+            self._buffer += data
+            self._wakeup()
+
+    def feed_eof(self) -> None:
+        """Mark the end of the stream."""
+        self._eof = True
+        self._wakeup()
+
+    def at_eof(self) -> bool:
+        """Return whether the stream ended and the buffer is empty."""
+        return self._eof and not self._buffer
+
+    def _wakeup(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+        self._waiter = None
+
+    async def _wait_for_data(self) -> None:
+        if self._waiter is not None:
+            raise RuntimeError("XBee serial stream is already being read")
+
+        self._waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read up to `n` bytes, or everything buffered if `n` is negative.
+
+        Waits for data if the buffer is empty and returns `b""` at the end of stream.
+        """
+        while not self._buffer and not self._eof:
+            await self._wait_for_data()
+
+        if n < 0:
+            n = len(self._buffer)
+
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+    async def readexactly(self, n: int) -> bytes:
+        """Read exactly `n` bytes."""
+        while len(self._buffer) < n:
+            if self._eof:
+                raise asyncio.IncompleteReadError(bytes(self._buffer), n)
+            await self._wait_for_data()
+
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+    async def readuntil(self, separator: bytes = b"\n") -> bytes:
+        """Read data up to and including `separator`."""
+        offset = 0
+        while (index := self._buffer.find(separator, offset)) < 0:
+            if self._eof:
+                raise asyncio.IncompleteReadError(bytes(self._buffer), None)
+            offset = max(0, len(self._buffer) - len(separator) + 1)
+            await self._wait_for_data()
+
+        end = index + len(separator)
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return data
+
+
+class XBeeSerialWriter:
+    """Writer of serial data to an XBee.
+
+    Writes are buffered and sent in the background, split into radio frames of at
+    most `max_payload` bytes. `drain()` waits while more than `limit` bytes are
+    buffered.
+    """
+
+    def __init__(
+        self,
+        cluster: XBeeSerialDataCluster,
+        reader: XBeeSerialReader | None = None,
+        *,
+        limit: int = XBEE_SERIAL_STREAM_LIMIT,
+        max_payload: int = XBEE_SERIAL_MAX_PAYLOAD,
+    ) -> None:
+        """Init."""
+        self._cluster = cluster
+        self._reader = reader
+        self._limit = limit
+        self._max_payload = max_payload
+        self._buffer = bytearray()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._flush_task: asyncio.Task | None = None
+        self._exception: Exception | None = None
+        self._closing = False
+
+    def write(self, data: bytes) -> None:
+        """Queue data to be sent."""
+        if self._exception is not None:
+            raise self._exception
+        if self._closing:
+            raise RuntimeError("XBee serial stream is closed")
+
+        self._buffer += data
+        if len(self._buffer) > self._limit:
+            self._drained.clear()
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def drain(self) -> None:
+        """Wait until the write buffer is below its limit."""
+        await self._drained.wait()
+        if self._exception is not None:
+            raise self._exception
+
+    def close(self) -> None:
+        """Close the stream once buffered data has been sent."""
+        if self._closing:
+            return
+
+        self._closing = True
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    def is_closing(self) -> bool:
+        """Return whether the stream is closed or being closed."""
+        return self._closing
+
+    async def wait_closed(self) -> None:
+        """Wait until the stream is closed."""
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+        if self._exception is not None:
+            raise self._exception
+
+    async def _flush(self) -> None:
+        """Send buffered data, one radio frame at a time."""
+        try:
+            while self._buffer:
+                chunk = bytes(self._buffer[: self._max_payload])
+                del self._buffer[: self._max_payload]
+
+                if len(self._buffer) <= self._limit:
+                    self._drained.set()
+
+                status = await self._cluster.send_data(chunk)
+                if status != foundation.Status.SUCCESS:
+                    raise zigpy.exceptions.DeliveryError(
+                        f"Failed to send XBee serial data: {status!r}", status
+                    )
+        except Exception as exc:
+            _LOGGER.debug("XBee serial stream failed", exc_info=exc)
+            self._exception = exc
+            self._buffer.clear()
+        finally:
+            self._flush_task = None
+            self._drained.set()
+
+            if self._closing and self._reader is not None:
+                if self._cluster.stream_reader is self._reader:
+                    self._cluster.stream_reader = None
+                self._reader.feed_eof()
+
+
 class XBeeCommon(CustomDevice):
     """XBee common class."""
 
@@ -643,6 +946,38 @@ class XBeeCommon(CustomDevice):
             .remote_at_command(command, *args, apply_changes=True, **kwargs)
         )
 
+    def remote_at_batch(self, commands, *, apply_changes=True):
+        """Remote at commands, pipelined and applied together."""
+        return (
+            self.endpoints[XBEE_AT_ENDPOINT]
+            .out_clusters[XBEE_AT_REQUEST_CLUSTER]
+            .remote_at_commands(commands, apply_changes=apply_changes)
+        )
+
+    async def open_serial_stream(
+        self,
+        *,
+        limit: int = XBEE_SERIAL_STREAM_LIMIT,
+        max_payload: int = XBEE_SERIAL_MAX_PAYLOAD,
+    ) -> tuple[XBeeSerialReader, XBeeSerialWriter]:
+        """Open a stream over the serial data of the device.
+
+        While the stream is open, received data goes to the reader instead of the
+        event relay. Opening another stream ends the previous reader.
+        """
+        endpoint = self.endpoints[XBEE_DATA_ENDPOINT]
+        in_cluster = endpoint.in_clusters[XBEE_DATA_CLUSTER]
+
+        if in_cluster.stream_reader is not None:
+            in_cluster.stream_reader.feed_eof()
+
+        reader = XBeeSerialReader(limit)
+        in_cluster.stream_reader = reader
+        writer = XBeeSerialWriter(
+            in_cluster, reader, limit=limit, max_payload=max_payload
+        )
+        return reader, writer
+
     def custom_profile_packet_received(self, packet: t.ZigbeePacket) -> None:
         """Deserialize."""
         if packet.profile_id != XBEE_PROFILE_ID:
@@ -39,8 +39,33 @@ class BinaryString(str):
         return (cls(data), b"")
 
 
+DIGITAL_PIN_COUNT = 15
+ANALOG_PIN_COUNT = 8
+
+# Set bit indices of every analog mask, and of the digital masks seen so far
+_ANALOG_MASK_PINS = tuple(
+    tuple(pin for pin in range(ANALOG_PIN_COUNT) if mask >> pin & 1)
+    for mask in range(1 << ANALOG_PIN_COUNT)
+)
+_DIGITAL_MASK_PINS: dict[int, tuple[int, ...]] = {}
+
+
+def _digital_mask_pins(mask: int) -> tuple[int, ...]:
+    """Return the digital pins enabled by a mask."""
+    pins = _DIGITAL_MASK_PINS.get(mask)
+    if pins is None:
+        pins = _DIGITAL_MASK_PINS[mask] = tuple(
+            pin for pin in range(DIGITAL_PIN_COUNT) if mask >> pin & 1
+        )
+    return pins
+
+
 class IOSample(dict):
-    """Parse an XBee IO sample report."""
+    """Parse an XBee IO sample report.
+
+    `digital_samples` and `analog_samples` hold the last sample set, with `None` for
+    disabled pins. `sample_sets` holds every sample set of the report, oldest first.
+    """
 
     serialize = None
 
@@ -52,56 +77,44 @@ class IOSample(dict):
         Sample set count byte 0
         Digital mask byte 1, 2
         Analog mask byte 3
-        Digital samples byte 4, 5 (if any sample exists)
-        Analog Sample, 2 bytes per
+        For each sample set:
+            Digital samples 2 bytes (if any digital pin is enabled)
+            Analog Sample, 2 bytes per enabled analog pin
         """
-        sample_sets = int.from_bytes(data[0:1], byteorder="big")
-        if sample_sets != 1:
-            raise ValueError("Number of sets is not 1")
-        digital_mask = data[1:3]
-        analog_mask = data[3:4]
-        digital_sample = data[4:6]
-        num_bits = 15
-        digital_pins = [
-            (int.from_bytes(digital_mask, byteorder="big") >> bit) & 1
-            for bit in range(num_bits - 1, -1, -1)
-        ]
-        digital_pins = list(reversed(digital_pins))
-        analog_pins = [
-            (int.from_bytes(analog_mask, byteorder="big") >> bit) & 1
-            for bit in range(8 - 1, -1, -1)
-        ]
-        analog_pins = list(reversed(analog_pins))
-        if 1 in digital_pins:
-            digital_samples: list[int | None] = [
-                (int.from_bytes(digital_sample, byteorder="big") >> bit) & 1
-                for bit in range(num_bits - 1, -1, -1)
-            ]
-            digital_samples = list(reversed(digital_samples))
-            sample_index = 6
-        else:
-            # skip digital samples block
-            digital_samples = digital_pins
-            sample_index = 4
-        analog_samples = []
-        for apin in analog_pins:
-            if apin == 1:
-                analog_samples.append(
-                    int.from_bytes(
-                        data[sample_index : sample_index + 2], byteorder="big"
-                    )
-                )
-                sample_index += 2
-            else:
-                analog_samples.append(None)
-        for dpin in range(len(digital_pins)):
-            if digital_pins[dpin] == 0:
-                digital_samples[dpin] = None
-
-        return (
-            {
-                "digital_samples": digital_samples,
-                "analog_samples": analog_samples,
-            },
-            data[sample_index:],
-        )
+        if len(data) < 4:
+            raise ValueError(f"IO sample is too short: {data!r}")
+
+        sample_sets = data[0]
+        if sample_sets == 0:
+            raise ValueError("IO sample has no sample sets")
+
+        digital_pins = _digital_mask_pins((data[1] << 8 | data[2]) & 0x7FFF)
+        analog_pins = _ANALOG_MASK_PINS[data[3]]
+        set_size = (2 if digital_pins else 0) + 2 * len(analog_pins)
+        end = 4 + sample_sets * set_size
+
+        if len(data) < end:
+            raise ValueError(f"IO sample is too short: {data!r}")
+
+        sets = []
+        index = 4
+
+        for _ in range(sample_sets):
+            digital_samples: list[int | None] = [None] * DIGITAL_PIN_COUNT
+            analog_samples: list[int | None] = [None] * ANALOG_PIN_COUNT
+
+            if digital_pins:
+                digital_sample = data[index] << 8 | data[index + 1]
+                index += 2
+                for pin in digital_pins:
+                    digital_samples[pin] = digital_sample >> pin & 1
+
+            for pin in analog_pins:
+                analog_samples[pin] = data[index] << 8 | data[index + 1]
+                index += 2
+
+            sets.append(
+                {"digital_samples": digital_samples, "analog_samples": analog_samples}
+            )
+
+        return {**sets[-1], "sample_sets": sets}, data[end:]
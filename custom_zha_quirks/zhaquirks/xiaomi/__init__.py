@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+import dataclasses
 import logging
 import math
 from typing import Any, Final
@@ -40,6 +42,8 @@ from zhaquirks import (
     MotionOnEvent,
     OccupancyWithReset,
     QuickInitDevice,
+    ReportingFilterMixin,
+    derivation_frame,
 )
 from zhaquirks.const import (
     ATTRIBUTE_ID,
@@ -97,6 +101,11 @@ XIAOMI_ATTR_4 = "X-attrib-4"
 XIAOMI_ATTR_5 = "X-attrib-5"
 XIAOMI_ATTR_6 = "X-attrib-6"
 XIAOMI_MIJA_ATTRIBUTE = 0xFF02
+XIAOMI_STRING_ATTRIBUTES = (
+    XIAOMI_AQARA_ATTRIBUTE,
+    XIAOMI_MIJA_ATTRIBUTE,
+    XIAOMI_AQARA_ATTRIBUTE_E1,
+)
 XIAOMI_NODE_DESC = NodeDescriptor(
     byte1=2,
     byte2=64,
@@ -113,6 +122,170 @@ XIAOMI_NODE_DESC = NodeDescriptor(
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True)
+class XiaomiAttributeTarget:
+    """Endpoint cluster updated from a decoded Xiaomi attribute report value."""
+
+    # Endpoint attribute of the target cluster
+    ep_attribute: str
+    # Attribute to update, or `None` to call `method` instead
+    attribute_id: int | None = None
+    method: str | None = None
+    converter: Callable[[Any], Any] | None = None
+    # Skip the value if the quirk does not implement the target
+    optional: bool = False
+
+
+# Tags reported by every Aqara device
+AQARA_ATTRIBUTE_NAMES: dict[int, str] = {
+    1: BATTERY_VOLTAGE_MV,
+    3: TEMPERATURE,
+    4: XIAOMI_ATTR_4,
+    5: XIAOMI_ATTR_5,
+    6: XIAOMI_ATTR_6,
+    10: PATH,
+}
+
+# Temperature sensors send temperature/humidity/pressure updates through this
+# cluster instead of the respective clusters
+_AQARA_WEATHER_ATTRIBUTE_NAMES: dict[int, str] = {
+    100: TEMPERATURE_MEASUREMENT,
+    101: HUMIDITY_MEASUREMENT,
+    102: PRESSURE_MEASUREMENT,
+}
+_AQARA_PLUG_ATTRIBUTE_NAMES: dict[int, str] = {
+    149: CONSUMPTION,
+    150: VOLTAGE,
+    152: POWER,
+}
+_AQARA_MOTION_ATTRIBUTE_NAMES: dict[int, str] = {101: ILLUMINANCE_MEASUREMENT}
+
+# Model specific tags, added to or replacing `AQARA_ATTRIBUTE_NAMES`
+AQARA_MODEL_ATTRIBUTE_NAMES: dict[str, dict[int, str]] = {
+    "lumi.sensor_ht": _AQARA_WEATHER_ATTRIBUTE_NAMES,
+    "lumi.sens": _AQARA_WEATHER_ATTRIBUTE_NAMES,
+    "lumi.weather": {
+        **_AQARA_WEATHER_ATTRIBUTE_NAMES,
+        102: PRESSURE_MEASUREMENT_PRECISION,
+    },
+    "lumi.airmonitor.acn01": {
+        **_AQARA_WEATHER_ATTRIBUTE_NAMES,
+        102: TVOC_MEASUREMENT,
+    },
+    "lumi.sensor_ht.agl02": _AQARA_WEATHER_ATTRIBUTE_NAMES,
+    "lumi.plug": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.plug.maus01": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.plug.maeu01": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.plug.mmeu01": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.relay.c2acn01": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.switch.n0agl1": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.switch.n0acn2": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.switch.acn047": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.switch.agl011": {150: VOLTAGE, 151: CONSUMPTION, 152: POWER},
+    "lumi.sensor_motion.aq2": {11: ILLUMINANCE_MEASUREMENT},
+    "lumi.curtain.acn002": {101: BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE},
+    "lumi.motion.agl02": _AQARA_MOTION_ATTRIBUTE_NAMES,
+    "lumi.motion.ac02": {
+        **_AQARA_MOTION_ATTRIBUTE_NAMES,
+        105: DETECTION_INTERVAL,
+        106: MOTION_SENSITIVITY,
+    },
+    "lumi.motion.acn001": _AQARA_MOTION_ATTRIBUTE_NAMES,
+    "lumi.motion.agl04": {
+        102: DETECTION_INTERVAL,
+        105: MOTION_SENSITIVITY,
+        258: DETECTION_INTERVAL,
+        268: MOTION_SENSITIVITY,
+    },
+    "lumi.motion.ac01": {
+        5: POWER_OUTAGE_COUNT,
+        101: PRESENCE_DETECTED,
+        102: PRESENCE_EVENT,
+        103: MONITORING_MODE,
+        105: APPROACH_DISTANCE,
+        268: MOTION_SENSITIVITY,
+        322: PRESENCE_DETECTED,
+        323: PRESENCE_EVENT,
+        324: MONITORING_MODE,
+        326: APPROACH_DISTANCE,
+    },
+    "lumi.sensor_smoke.acn03": {
+        160: SMOKE,
+        161: SMOKE_DENSITY,
+        162: SELF_TEST,
+        163: BUZZER_MANUAL_MUTE,
+        164: HEARTBEAT_INDICATOR,
+        165: LINKAGE_ALARM,
+    },
+}
+
+MIJA_ATTRIBUTE_NAMES: tuple[str, ...] = (
+    STATE,
+    BATTERY_VOLTAGE_MV,
+    XIAOMI_ATTR_3,
+    XIAOMI_ATTR_4,
+    XIAOMI_ATTR_5,
+    XIAOMI_ATTR_6,
+)
+
+# Clusters updated from decoded attribute report values
+XIAOMI_ATTRIBUTE_TARGETS: dict[str, XiaomiAttributeTarget] = {
+    # many Xiaomi devices report this, but not all quirks implement the
+    # XiaomiPowerConfiguration cluster
+    BATTERY_VOLTAGE_MV: XiaomiAttributeTarget(
+        "power", method="battery_reported", optional=True
+    ),
+    TEMPERATURE_MEASUREMENT: XiaomiAttributeTarget(
+        "temperature", TemperatureMeasurement.AttributeDefs.measured_value.id
+    ),
+    HUMIDITY_MEASUREMENT: XiaomiAttributeTarget(
+        "humidity", RelativeHumidity.AttributeDefs.measured_value.id
+    ),
+    PRESSURE_MEASUREMENT: XiaomiAttributeTarget(
+        "pressure", PressureMeasurement.AttributeDefs.measured_value.id
+    ),
+    PRESSURE_MEASUREMENT_PRECISION: XiaomiAttributeTarget(
+        "pressure",
+        PressureMeasurement.AttributeDefs.measured_value.id,
+        converter=lambda value: value / 100,
+    ),
+    POWER: XiaomiAttributeTarget(
+        "electrical_measurement",
+        ElectricalMeasurement.AttributeDefs.active_power.id,
+        converter=lambda value: round(value * 10),
+    ),
+    CONSUMPTION: XiaomiAttributeTarget(
+        "smartenergy_metering",
+        Metering.AttributeDefs.current_summ_delivered.id,
+        converter=lambda value: round(value * 1000),
+    ),
+    VOLTAGE: XiaomiAttributeTarget(
+        "electrical_measurement",
+        ElectricalMeasurement.AttributeDefs.rms_voltage.id,
+        converter=lambda value: value * 0.1,
+    ),
+    ILLUMINANCE_MEASUREMENT: XiaomiAttributeTarget(
+        "illuminance", IlluminanceMeasurement.AttributeDefs.measured_value.id
+    ),
+    TVOC_MEASUREMENT: XiaomiAttributeTarget("voc_level", 0x0000),
+    TEMPERATURE: XiaomiAttributeTarget(
+        "device_temperature",
+        DeviceTemperature.AttributeDefs.current_temperature.id,
+        converter=lambda value: value * 100,
+        optional=True,
+    ),
+    BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE: XiaomiAttributeTarget(
+        "power", method="battery_percent_reported"
+    ),
+    SMOKE: XiaomiAttributeTarget("ias_zone", IasZone.AttributeDefs.zone_status.id),
+}
+
+
+def aqara_attribute_names(model: str | None) -> dict[int, str]:
+    """Return the names of the Aqara attribute report tags sent by a model."""
+    return {**AQARA_ATTRIBUTE_NAMES, **AQARA_MODEL_ATTRIBUTE_NAMES.get(model, {})}
+
+
 class XiaomiCustomDevice(CustomDevice):
     """Custom device representing xiaomi devices."""
 
@@ -153,6 +326,15 @@ class XiaomiQuickInitDevice(XiaomiCustomDevice, QuickInitDevice):
 class XiaomiCluster(CustomCluster):
     """Xiaomi cluster implementation."""
 
+    # Number of fixed attribute reports kept, shared by all Xiaomi clusters
+    attr_report_cache_size: int = 256
+    _attr_report_cache: OrderedDict[bytes, bytes | None] = OrderedDict()
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._aqara_attribute_names = aqara_attribute_names(self.endpoint.device.model)
+
     def _iter_parse_attr_report(
         self, data: bytes
     ) -> Iterator[tuple[foundation.Attribute, bytes]]:
@@ -163,12 +345,7 @@ class XiaomiCluster(CustomCluster):
         attr_type, data = t.uint8_t.deserialize(data)
 
         if (
-            attr_id
-            not in (
-                XIAOMI_AQARA_ATTRIBUTE,
-                XIAOMI_MIJA_ATTRIBUTE,
-                XIAOMI_AQARA_ATTRIBUTE_E1,
-            )
+            attr_id not in XIAOMI_STRING_ATTRIBUTES
             or attr_type != 0x42  # "Character String"
         ):
             # Assume other attributes are reported correctly
@@ -218,6 +395,71 @@ class XiaomiCluster(CustomCluster):
             for remaining_attrs in self._interpret_attr_reports(remaining_data):
                 yield (attr,) + remaining_attrs
 
+    def _fix_unbroken_attr_report(self, data: bytes) -> bytes | None:
+        """Fix a Xiaomi attribute report in one pass, assuming correct lengths.
+
+        Returns `None` if any string attribute length is wrong.
+        """
+        fixed_data = bytearray(data)
+        offset = 0
+
+        while offset < len(data):
+            if (
+                len(data) - offset >= 4
+                and (data[offset] | data[offset + 1] << 8) in XIAOMI_STRING_ATTRIBUTES
+                and data[offset + 2] == 0x42  # "Character String"
+            ):
+                fixed_data[offset + 2] = 0x41  # The data type should be "Octet String"
+                offset += 4 + data[offset + 3]
+
+                if offset > len(data):
+                    return None
+                continue
+
+            try:
+                _, remaining_data = foundation.Attribute.deserialize(data[offset:])
+            except (KeyError, ValueError):
+                return None
+
+            offset = len(data) - len(remaining_data)
+
+        return bytes(fixed_data)
+
+    def _fix_attr_report(self, data: bytes) -> bytes | None:
+        """Fix a Xiaomi attribute report, searching for valid lengths if needed."""
+        fixed_data = self._fix_unbroken_attr_report(data)
+
+        if fixed_data is not None:
+            return fixed_data
+
+        reports = list(self._interpret_attr_reports(data))
+
+        if not reports:
+            return None
+        elif len(reports) > 1:
+            _LOGGER.warning(
+                "Xiaomi attribute report has multiple valid interpretations: %r",
+                reports,
+            )
+
+        return b"".join(attr.serialize() for attr in reports[0])
+
+    def _cached_fix_attr_report(self, data: bytes) -> bytes | None:
+        """Fix a Xiaomi attribute report, reusing the result for repeated reports."""
+        cache = self._attr_report_cache
+
+        try:
+            fixed_data = cache[data]
+        except KeyError:
+            fixed_data = cache[data] = self._fix_attr_report(data)
+
+            if len(cache) > self.attr_report_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(data)
+
+        return fixed_data
+
     def deserialize(self, data):
         """Deserialize cluster data."""
         hdr, data = foundation.ZCLHeader.deserialize(data)
@@ -229,18 +471,11 @@ class XiaomiCluster(CustomCluster):
         ):
             return super().deserialize(hdr.serialize() + data)
 
-        reports = list(self._interpret_attr_reports(data))
+        fixed_data = self._cached_fix_attr_report(data)
 
-        if not reports:
+        if fixed_data is None:
             _LOGGER.warning("Failed to parse Xiaomi attribute report: %r", data)
             return super().deserialize(hdr.serialize() + data)
-        elif len(reports) > 1:
-            _LOGGER.warning(
-                "Xiaomi attribute report has multiple valid interpretations: %r",
-                reports,
-            )
-
-        fixed_data = b"".join(attr.serialize() for attr in reports[0])
 
         return super().deserialize(hdr.serialize() + fixed_data)
 
@@ -282,205 +517,66 @@ class XiaomiCluster(CustomCluster):
             attrid,
             attributes,
         )
-        if BATTERY_VOLTAGE_MV in attributes:
-            # many Xiaomi devices report this, but not all quirks implement the XiaomiPowerConfiguration cluster,
-            # so we might error out if the method doesn't exist
-            if hasattr(self.endpoint.power, "battery_reported") and callable(
-                self.endpoint.power.battery_reported
-            ):
-                self.endpoint.power.battery_reported(attributes[BATTERY_VOLTAGE_MV])
-            else:
-                # log a debug message if the cluster is not implemented
-                _LOGGER.debug(
-                    "%s - Xiaomi battery voltage attribute received but XiaomiPowerConfiguration not used",
-                    self.endpoint.device.ieee,
-                )
 
-        if TEMPERATURE_MEASUREMENT in attributes:
-            self.endpoint.temperature.update_attribute(
-                TemperatureMeasurement.AttributeDefs.measured_value.id,
-                attributes[TEMPERATURE_MEASUREMENT],
-            )
-
-        if HUMIDITY_MEASUREMENT in attributes:
-            self.endpoint.humidity.update_attribute(
-                RelativeHumidity.AttributeDefs.measured_value.id,
-                attributes[HUMIDITY_MEASUREMENT],
-            )
+        with derivation_frame():
+            for name, attr_value in attributes.items():
+                target = XIAOMI_ATTRIBUTE_TARGETS.get(name)
+                if target is not None:
+                    self._update_attribute_target(name, target, attr_value)
 
-        if PRESSURE_MEASUREMENT in attributes:
-            self.endpoint.pressure.update_attribute(
-                PressureMeasurement.AttributeDefs.measured_value.id,
-                attributes[PRESSURE_MEASUREMENT],
-            )
-
-        if PRESSURE_MEASUREMENT_PRECISION in attributes:
-            self.endpoint.pressure.update_attribute(
-                PressureMeasurement.AttributeDefs.measured_value.id,
-                attributes[PRESSURE_MEASUREMENT_PRECISION] / 100,
-            )
-
-        if POWER in attributes:
-            self.endpoint.electrical_measurement.update_attribute(
-                ElectricalMeasurement.AttributeDefs.active_power.id,
-                round(attributes[POWER] * 10),
-            )
-
-        if CONSUMPTION in attributes:
-            zcl_consumption = round(attributes[CONSUMPTION] * 1000)
-            self.endpoint.smartenergy_metering.update_attribute(
-                Metering.AttributeDefs.current_summ_delivered.id, zcl_consumption
-            )
-
-        if VOLTAGE in attributes:
-            self.endpoint.electrical_measurement.update_attribute(
-                ElectricalMeasurement.AttributeDefs.rms_voltage.id,
-                attributes[VOLTAGE] * 0.1,
-            )
-
-        if ILLUMINANCE_MEASUREMENT in attributes:
-            self.endpoint.illuminance.update_attribute(
-                IlluminanceMeasurement.AttributeDefs.measured_value.id,
-                attributes[ILLUMINANCE_MEASUREMENT],
-            )
-
-        if TVOC_MEASUREMENT in attributes:
-            self.endpoint.voc_level.update_attribute(
-                0x0000, attributes[TVOC_MEASUREMENT]
-            )
+    def _update_attribute_target(
+        self, name: str, target: XiaomiAttributeTarget, value: Any
+    ) -> None:
+        """Forward a decoded attribute report value to its endpoint cluster."""
+        cluster = getattr(self.endpoint, target.ep_attribute, None)
+        if target.method is not None:
+            handler = getattr(cluster, target.method, None)
+        else:
+            handler = getattr(cluster, "update_attribute", None)
 
-        if TEMPERATURE in attributes:
-            if hasattr(self.endpoint, "device_temperature"):
-                self.endpoint.device_temperature.update_attribute(
-                    DeviceTemperature.AttributeDefs.current_temperature.id,
-                    attributes[TEMPERATURE] * 100,
+        if not callable(handler):
+            if not target.optional:
+                raise AttributeError(
+                    f"{self.endpoint} has no {target.ep_attribute} cluster for {name}"
                 )
 
-        if BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE in attributes:
-            self.endpoint.power.battery_percent_reported(
-                attributes[BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE]
+            _LOGGER.debug(
+                "%s - Xiaomi %s attribute received but %s is not implemented",
+                self.endpoint.device.ieee,
+                name,
+                target.ep_attribute,
             )
+            return
 
-        if SMOKE in attributes:
-            self.endpoint.ias_zone.update_attribute(
-                IasZone.AttributeDefs.zone_status.id, attributes[SMOKE]
-            )
+        if target.converter is not None:
+            value = target.converter(value)
+
+        if target.method is not None:
+            handler(value)
+        else:
+            handler(target.attribute_id, value)
 
     def _parse_aqara_attributes(self, value):
         """Parse non-standard attributes."""
         attributes = {}
-        attribute_names = {
-            1: BATTERY_VOLTAGE_MV,
-            3: TEMPERATURE,
-            4: XIAOMI_ATTR_4,
-            5: XIAOMI_ATTR_5,
-            6: XIAOMI_ATTR_6,
-            10: PATH,
-        }
-
-        if self.endpoint.device.model in [
-            "lumi.sensor_ht",
-            "lumi.sens",
-            "lumi.weather",
-            "lumi.airmonitor.acn01",
-            "lumi.sensor_ht.agl02",
-        ]:
-            # Temperature sensors send temperature/humidity/pressure updates through this
-            # cluster instead of the respective clusters
-            attribute_names.update(
-                {
-                    100: TEMPERATURE_MEASUREMENT,
-                    101: HUMIDITY_MEASUREMENT,
-                    102: TVOC_MEASUREMENT
-                    if self.endpoint.device.model == "lumi.airmonitor.acn01"
-                    else PRESSURE_MEASUREMENT_PRECISION
-                    if self.endpoint.device.model == "lumi.weather"
-                    else PRESSURE_MEASUREMENT,
-                }
-            )
-        elif self.endpoint.device.model in [
-            "lumi.plug",
-            "lumi.plug.maus01",
-            "lumi.plug.maeu01",
-            "lumi.plug.mmeu01",
-            "lumi.relay.c2acn01",
-            "lumi.switch.n0agl1",
-            "lumi.switch.n0acn2",
-            "lumi.switch.acn047",
-        ]:
-            attribute_names.update({149: CONSUMPTION, 150: VOLTAGE, 152: POWER})
-        elif self.endpoint.device.model == "lumi.switch.agl011":
-            attribute_names.update({150: VOLTAGE, 151: CONSUMPTION, 152: POWER})
-        elif self.endpoint.device.model == "lumi.sensor_motion.aq2":
-            attribute_names.update({11: ILLUMINANCE_MEASUREMENT})
-        elif self.endpoint.device.model == "lumi.curtain.acn002":
-            attribute_names.update({101: BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE})
-        elif self.endpoint.device.model in [
-            "lumi.motion.agl02",
-            "lumi.motion.ac02",
-            "lumi.motion.acn001",
-        ]:
-            attribute_names.update({101: ILLUMINANCE_MEASUREMENT})
-            if self.endpoint.device.model == "lumi.motion.ac02":
-                attribute_names.update({105: DETECTION_INTERVAL})
-                attribute_names.update({106: MOTION_SENSITIVITY})
-        elif self.endpoint.device.model == "lumi.motion.agl04":
-            attribute_names.update({102: DETECTION_INTERVAL})
-            attribute_names.update({105: MOTION_SENSITIVITY})
-            attribute_names.update({258: DETECTION_INTERVAL})
-            attribute_names.update({268: MOTION_SENSITIVITY})
-        elif self.endpoint.device.model == "lumi.motion.ac01":
-            attribute_names.update({5: POWER_OUTAGE_COUNT})
-            attribute_names.update({101: PRESENCE_DETECTED})
-            attribute_names.update({102: PRESENCE_EVENT})
-            attribute_names.update({103: MONITORING_MODE})
-            attribute_names.update({105: APPROACH_DISTANCE})
-            attribute_names.update({268: MOTION_SENSITIVITY})
-            attribute_names.update({322: PRESENCE_DETECTED})
-            attribute_names.update({323: PRESENCE_EVENT})
-            attribute_names.update({324: MONITORING_MODE})
-            attribute_names.update({326: APPROACH_DISTANCE})
-        elif self.endpoint.device.model == "lumi.sensor_smoke.acn03":
-            attribute_names.update({160: SMOKE})
-            attribute_names.update({161: SMOKE_DENSITY})
-            attribute_names.update({162: SELF_TEST})
-            attribute_names.update({163: BUZZER_MANUAL_MUTE})
-            attribute_names.update({164: HEARTBEAT_INDICATOR})
-            attribute_names.update({165: LINKAGE_ALARM})
-        result = {}
+        attribute_names = self._aqara_attribute_names
 
         # Some attribute reports end with a stray null byte
         while value not in (b"", b"\x00"):
             skey = int(value[0])
             svalue, value = foundation.TypeValue.deserialize(value[1:])
-            result[skey] = svalue.value
-        for item, val in result.items():
-            key = (
-                attribute_names[item]
-                if item in attribute_names
-                else "0xff01-" + str(item)
-            )
-            attributes[key] = val
+            key = attribute_names.get(skey)
+            if key is None:
+                key = "0xff01-" + str(skey)
+            attributes[key] = svalue.value
 
         return attributes
 
     def _parse_mija_attributes(self, value):
         """Parse non-standard attributes."""
-        attribute_names = (
-            STATE,
-            BATTERY_VOLTAGE_MV,
-            XIAOMI_ATTR_3,
-            XIAOMI_ATTR_4,
-            XIAOMI_ATTR_5,
-            XIAOMI_ATTR_6,
+        return dict(
+            zip(MIJA_ATTRIBUTE_NAMES, (attr_value.value for attr_value in value))
         )
-        result = []
-
-        for attr_value in value:
-            result.append(attr_value.value)
-        attributes = dict(zip(attribute_names, result))
-
-        return attributes
 
 
 class BasicCluster(XiaomiCluster, Basic):
@@ -669,7 +765,9 @@ class AnalogInputCluster(CustomCluster, AnalogInput):
             )
 
 
-class ElectricalMeasurementCluster(LocalDataCluster, ElectricalMeasurement):
+class ElectricalMeasurementCluster(
+    ReportingFilterMixin, LocalDataCluster, ElectricalMeasurement
+):
     """Electrical measurement cluster to receive reports that are sent to the basic cluster."""
 
     POWER_ID = ElectricalMeasurement.AttributeDefs.active_power.id
@@ -703,7 +801,7 @@ class ElectricalMeasurementCluster(LocalDataCluster, ElectricalMeasurement):
         )
 
 
-class MeteringCluster(LocalDataCluster, Metering):
+class MeteringCluster(ReportingFilterMixin, LocalDataCluster, Metering):
     """Metering cluster to receive reports that are sent to the basic cluster."""
 
     CURRENT_SUMM_DELIVERED_ID = Metering.AttributeDefs.current_summ_delivered.id
@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-from functools import reduce
-import math
 import struct
-from typing import Any, Final
+from typing import Any, Final, NamedTuple
 
 from zigpy.profiles import zha
 from zigpy.quirks import CustomCluster
@@ -140,234 +138,203 @@ class ThermostatCluster(CustomCluster, Thermostat):
         return result
 
 
-class ScheduleEvent:
-    """Schedule event object."""
+# Magic byte, day selection, then (time, unknown, temperature) for four events
+SCHEDULE_STRUCT = struct.Struct(">BB" + "H2xH" * 4)
+SCHEDULE_MAGIC_BYTE = 0x04
+FULL_DAY = 24 * 60
 
-    _is_next_day = False
 
-    def __init__(self, value, is_next_day=False):
-        """Create ScheduleEvent object from bytes or string."""
-        if isinstance(value, bytes):
-            self._verify_buffer_len(value)
-            self._time = self._read_time_from_buf(value)
-            self._temp = self._read_temp_from_buf(value)
-            self._validate_time(self._time)
-            self._validate_temp(self._temp)
-        elif isinstance(value, str):
-            groups = value.split(",")
-            if len(groups) != 2:
-                raise ValueError("Time and temperature must contain ',' separator")
-            self._time = self._parse_time(groups[0])
-            self._temp = self._parse_temp(groups[1])
-            self._validate_time(self._time)
-            self._validate_temp(self._temp)
-        else:
-            raise TypeError(
-                f"Cannot create ScheduleEvent object from type: {type(value)}"
+def _verify_day_names(days: list[str]) -> None:
+    if len(days) == 0 or len(days) > 7:
+        raise ValueError("Number of days selected must be between 1 and 7")
+    if len(days) != len(set(days)):
+        raise ValueError("Duplicate day names present")
+    for d in days:
+        if d not in DAYS_MAP:
+            raise ValueError(
+                f"String: {d} is not a valid day name, valid names: mon, tue, wed, thu, fri, sat, sun"
             )
-        self._is_next_day = is_next_day
-
-    @staticmethod
-    def _verify_buffer_len(buf):
-        if len(buf) != 6:
-            raise ValueError("Buffer size must equal 6")
-
-    @staticmethod
-    def _read_time_from_buf(buf):
-        time = struct.unpack_from(">H", buf, offset=0)[0]
-        time &= ~NEXT_DAY_FLAG
-        return time
-
-    @staticmethod
-    def _parse_time(string):
-        parts = string.split(":")
-        if len(parts) != 2:
-            raise ValueError("Time must contain ':' separator")
-
-        hours = int(parts[0])
-        minutes = int(parts[1])
-
-        return hours * 60 + minutes
-
-    @staticmethod
-    def _read_temp_from_buf(buf):
-        return struct.unpack_from(">H", buf, offset=4)[0] / 100
-
-    @staticmethod
-    def _parse_temp(string):
-        return float(string)
-
-    @staticmethod
-    def _validate_time(time):
-        if time <= 0:
-            raise ValueError("Time must be between 00:00 and 23:59")
-        if time > 24 * 60:
-            raise ValueError("Time must be between 00:00 and 23:59")
-
-    @staticmethod
-    def _validate_temp(temp):
-        if temp < 5:
-            raise ValueError("Temperature must be between 5 and 30 °C")
-        if temp > 30:
-            raise ValueError("Temperature must be between 5 and 30 °C")
-        if (temp * 10) % 5 != 0:
-            raise ValueError("Temperature must be whole or half degrees")
-
-    def _write_time_to_buf(self, buf):
-        time = self._time
-        if self._is_next_day:
-            time |= NEXT_DAY_FLAG
-        struct.pack_into(">H", buf, 0, time)
-
-    def _write_temp_to_buf(self, buf):
-        struct.pack_into(">H", buf, 4, int(self._temp * 100))
-
-    def is_next_day(self):
-        """Return if event is on the next day."""
-        return self._is_next_day
-
-    def set_next_day(self, is_next_day):
-        """Set if event is on the next day."""
-        self._is_next_day = is_next_day
-
-    def get_time(self):
-        """Return event time."""
-        return self._time
 
-    def __str__(self):
-        """Return event as string."""
-        return f"{math.floor(self._time / 60)}:{f'{self._time % 60:0>2}'},{f'{self._temp:.1f}'}"
-
-    def serialize(self):
-        """Serialize event to bytes."""
-        result = bytearray(6)
-        self._write_time_to_buf(result)
-        self._write_temp_to_buf(result)
-        return result
 
+def _parse_event(string: str) -> tuple[int, int]:
+    groups = string.split(",")
+    if len(groups) != 2:
+        raise ValueError("Time and temperature must contain ',' separator")
 
-class ScheduleSettings(t.LVBytes):
-    """Schedule settings object."""
+    parts = groups[0].split(":")
+    if len(parts) != 2:
+        raise ValueError("Time must contain ':' separator")
 
-    def __new__(cls, value):
-        """Create ScheduleSettings object from bytes or string."""
-        day_selection = None
-        events = [None] * 4
-        if isinstance(value, bytes):
-            ScheduleSettings._verify_buffer_len(value)
-            ScheduleSettings._verify_magic_byte(value)
-            day_selection = ScheduleSettings._read_day_selection(value)
-            for i in range(4):
-                events[i] = ScheduleSettings._read_event(value, i)
-        elif isinstance(value, str):
-            groups = value.split("|")
-            ScheduleSettings._verify_string(groups)
-            day_selection = ScheduleSettings._read_day_selection(groups[0])
-            for i in range(4):
-                events[i] = ScheduleSettings._read_event(groups[i + 1], i)
-        else:
-            raise TypeError(
-                f"Cannot create ScheduleSettings object from type: {type(value)}"
-            )
+    temp = float(groups[1])
+    # checked before rounding to centidegrees, which would hide e.g. 21.004
+    if (temp * 10) % 5 != 0:
+        raise ValueError("Temperature must be whole or half degrees")
+
+    return int(parts[0]) * 60 + int(parts[1]), round(temp * 100)
 
-        for i in range(1, 4):
-            if events[i].get_time() < events[i - 1].get_time():
-                events[i].set_next_day(True)
-        ScheduleSettings._verify_event_durations(events)
 
-        result = bytearray(b"\x04")
-        result.append(ScheduleSettings._get_day_selection_byte(day_selection))
-        for e in events:
-            result.extend(e.serialize())
-        return super().__new__(cls, bytes(result))
+class ScheduleRecord(NamedTuple):
+    """Decoded schedule settings.
 
-    @staticmethod
-    def _verify_buffer_len(buf):
-        if len(buf) != 26:
+    Times are minutes after midnight, without the next day flag, and temperatures
+    are in centidegrees.
+    """
+
+    days: int
+    times: tuple[int, int, int, int]
+    temperatures: tuple[int, int, int, int]
+
+    @classmethod
+    def from_bytes(cls, buf: bytes) -> ScheduleRecord:
+        """Decode the 26 byte attribute value."""
+        if len(buf) != SCHEDULE_STRUCT.size:
             raise ValueError("Buffer size must equal 26")
 
-    @staticmethod
-    def _verify_magic_byte(buf):
-        if struct.unpack_from("c", buf, offset=0)[0][0] != 0x04:
+        magic, days, *events = SCHEDULE_STRUCT.unpack(buf)
+        if magic != SCHEDULE_MAGIC_BYTE:
             raise ValueError("Magic byte must be equal to 0x04")
 
-    @staticmethod
-    def _verify_string(groups):
+        t0, temp0, t1, temp1, t2, temp2, t3, temp3 = events
+        return cls(
+            days,
+            (
+                t0 & ~NEXT_DAY_FLAG,
+                t1 & ~NEXT_DAY_FLAG,
+                t2 & ~NEXT_DAY_FLAG,
+                t3 & ~NEXT_DAY_FLAG,
+            ),
+            (temp0, temp1, temp2, temp3),
+        )
+
+    @classmethod
+    def from_string(cls, value: str) -> ScheduleRecord:
+        """Parse a string like "mon,tue|6:00,21.0|8:00,17.0|17:30,21.0|22:00,17.0"."""
+        groups = value.split("|")
         if len(groups) != 5:
             raise ValueError("There must be 5 groups in a string")
-        days = groups[0].split(",")
-        ScheduleSettings._verify_day_selection_in_str(days)
 
-    @staticmethod
-    def _verify_day_selection_in_str(days):
-        if len(days) == 0 or len(days) > 7:
+        day_names = groups[0].split(",")
+        _verify_day_names(day_names)
+
+        events = [_parse_event(group) for group in groups[1:]]
+        return cls(
+            sum(DAYS_MAP[d] for d in day_names),
+            tuple(time for time, _ in events),
+            tuple(temp for _, temp in events),
+        )
+
+    @property
+    def day_names(self) -> list[str]:
+        """Return the names of the selected days."""
+        return [name for name, bit in DAYS_MAP.items() if self.days & bit]
+
+    def validate(self) -> None:
+        """Raise ValueError if the device would not accept the schedule."""
+        if self.days & 0x01:
+            raise ValueError("Incorrect day selected")
+        if not self.days:
             raise ValueError("Number of days selected must be between 1 and 7")
-        if len(days) != len(set(days)):
-            raise ValueError("Duplicate day names present")
-        for d in days:
-            if d not in DAYS_MAP:
-                raise ValueError(
-                    f"String: {d} is not a valid day name, valid names: mon, tue, wed, thu, fri, sat, sun"
-                )
-
-    @staticmethod
-    def _read_day_selection(value):
-        day_selection = []
-        if isinstance(value, bytes):
-            byte = struct.unpack_from("c", value, offset=1)[0][0]
-            if byte & 0x01:
-                raise ValueError("Incorrect day selected")
-            for i, v in DAYS_MAP.items():
-                if byte & v:
-                    day_selection.append(i)
-            ScheduleSettings._verify_day_selection_in_str(day_selection)
-        elif isinstance(value, str):
-            day_selection = value.split(",")
-            ScheduleSettings._verify_day_selection_in_str(day_selection)
-        return day_selection
-
-    @staticmethod
-    def _read_event(value, index):
-        if isinstance(value, bytes):
-            event_buf = value[2 + index * 6 : 8 + index * 6]
-            return ScheduleEvent(event_buf)
-        elif isinstance(value, str):
-            return ScheduleEvent(value)
-
-    @staticmethod
-    def _verify_event_durations(events):
-        full_day = 24 * 60
-        prev_time = events[0].get_time()
-        durations = []
-        for i in range(1, 4):
-            event = events[i]
-            if event.is_next_day():
-                durations.append(full_day - prev_time + event.get_time())
-            else:
-                durations.append(event.get_time() - prev_time)
-            prev_time = event.get_time()
-        if any(d < 60 for d in durations):
+
+        for time, temp in zip(self.times, self.temperatures):
+            if not 0 < time <= FULL_DAY:
+                raise ValueError("Time must be between 00:00 and 23:59")
+            if not 500 <= temp <= 3000:
+                raise ValueError("Temperature must be between 5 and 30 °C")
+            if temp % 50:
+                raise ValueError("Temperature must be whole or half degrees")
+
+        t0, t1, t2, t3 = self.times
+        durations = (
+            (t1 - t0) % FULL_DAY,
+            (t2 - t1) % FULL_DAY,
+            (t3 - t2) % FULL_DAY,
+        )
+        if min(durations) < 60:
             raise ValueError("The individual times must be at least 1 hour apart")
-        if reduce((lambda x, y: x + y), durations) > full_day:
+        if sum(durations) > FULL_DAY:
             raise ValueError("The start and end times must be at most 24 hours apart")
 
-    @staticmethod
-    def _get_day_selection_byte(day_selection):
-        byte = 0x00
-        for d in day_selection:
-            byte |= DAYS_MAP[d]
-        return byte
+    def to_bytes(self) -> bytes:
+        """Encode the 26 byte attribute value, flagging events on the next day."""
+        t0, t1, t2, t3 = self.times
+        temp0, temp1, temp2, temp3 = self.temperatures
+        return SCHEDULE_STRUCT.pack(
+            SCHEDULE_MAGIC_BYTE,
+            self.days,
+            t0,
+            temp0,
+            t1 | NEXT_DAY_FLAG if t1 < t0 else t1,
+            temp1,
+            t2 | NEXT_DAY_FLAG if t2 < t1 else t2,
+            temp2,
+            t3 | NEXT_DAY_FLAG if t3 < t2 else t3,
+            temp3,
+        )
+
+    def replace_event(
+        self, index: int, *, time: int | None = None, temperature: int | None = None
+    ) -> ScheduleRecord:
+        """Return a copy with the time and/or temperature of one event replaced."""
+        times = list(self.times)
+        temperatures = list(self.temperatures)
+        if time is not None:
+            times[index] = time
+        if temperature is not None:
+            temperatures[index] = temperature
+        return self._replace(times=tuple(times), temperatures=tuple(temperatures))
+
+    def diff(self, other: ScheduleRecord) -> list[str]:
+        """Return the names of the fields differing from another record."""
+        changed = ["days"] if self.days != other.days else []
+        changed += (
+            f"event_{i}"
+            for i in range(4)
+            if self.times[i] != other.times[i]
+            or self.temperatures[i] != other.temperatures[i]
+        )
+        return changed
+
+    def __str__(self) -> str:
+        """Return the schedule as string."""
+        return "|".join(
+            [
+                ",".join(self.day_names),
+                *(
+                    f"{time // 60}:{time % 60:0>2},{temp / 100:.1f}"
+                    for time, temp in zip(self.times, self.temperatures)
+                ),
+            ]
+        )
+
+
+class ScheduleSettings(t.LVBytes):
+    """Schedule settings object."""
+
+    record: ScheduleRecord
+
+    def __new__(cls, value):
+        """Create ScheduleSettings object from bytes, string or a record."""
+        if isinstance(value, ScheduleSettings):
+            return value
+        elif isinstance(value, ScheduleRecord):
+            record = value
+        elif isinstance(value, bytes):
+            record = ScheduleRecord.from_bytes(value)
+        elif isinstance(value, str):
+            record = ScheduleRecord.from_string(value)
+        else:
+            raise TypeError(
+                f"Cannot create ScheduleSettings object from type: {type(value)}"
+            )
+
+        record.validate()
+        settings = super().__new__(cls, record.to_bytes())
+        settings.record = record
+        return settings
 
     def __str__(self):
         """Return ScheduleSettings as string."""
-        day_selection = ScheduleSettings._read_day_selection(self)
-        events = [None] * 4
-        for i in range(4):
-            events[i] = ScheduleSettings._read_event(self, i)
-        result = ",".join(day_selection)
-        for e in events:
-            result += f"|{e}"
-        return result
+        return str(self.record)
 
 
 class AqaraThermostatSpecificCluster(XiaomiAqaraE1Cluster):